@@ -0,0 +1,119 @@
+"""aiopioneer learned AVR command capabilities."""
+
+import logging
+import time
+
+from typing import Any
+
+from .const import Zone
+from .params import (
+    AVRParams,
+    PARAM_UNSUPPORTED_COMMAND_FAILURES,
+    PARAM_UNSUPPORTED_COMMAND_REPROBE_INTERVAL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CommandCapabilities:
+    """Learned set of query commands that are unsupported by the AVR model."""
+
+    def __init__(self, params: AVRParams):
+        self._params = params
+        self._failures: dict[tuple[str, Zone], tuple[int, float]] = {}
+        self.model: str = None
+
+    def __repr__(self) -> str:
+        return f"CommandCapabilities(model={self.model}, failures={self._failures})"
+
+    @staticmethod
+    def get_command_key(command: str, args: list | tuple = None) -> str:
+        """Get capability key for a command and its arguments."""
+        if not args:
+            return command
+        return " ".join([command, *[str(arg) for arg in args]])
+
+    def set_model(self, model: str) -> None:
+        """Set AVR model, discarding capabilities learned for another model."""
+        if model != self.model:
+            if self.model is not None and self._failures:
+                _LOGGER.info("AVR model changed, clearing learned capabilities")
+                self._failures = {}
+            self.model = model
+
+    def record_failure(
+        self, command: str, zone: Zone, args: list | tuple = None
+    ) -> None:
+        """Record an unsupported command (E03/E04) response."""
+        if not self._params.get_param(PARAM_UNSUPPORTED_COMMAND_FAILURES):
+            return
+        key = (self.get_command_key(command, args), zone)
+        failure_count, _ = self._failures.get(key, (0, 0.0))
+        self._failures[key] = (failure_count + 1, time.time())
+        if failure_count + 1 == self._params.get_param(
+            PARAM_UNSUPPORTED_COMMAND_FAILURES
+        ):
+            _LOGGER.info(
+                "AVR command %s unsupported for %s, skipping on refresh",
+                key[0],
+                zone.full_name,
+            )
+
+    def record_success(
+        self, command: str, zone: Zone, args: list | tuple = None
+    ) -> None:
+        """Clear recorded failures for a command that has succeeded."""
+        if self._failures:
+            self._failures.pop((self.get_command_key(command, args), zone), None)
+
+    def is_unsupported(
+        self, command: str, zone: Zone, args: list | tuple = None
+    ) -> bool:
+        """Return whether a command should be skipped as unsupported."""
+        if not self._failures:
+            return False
+        failures = self._params.get_param(PARAM_UNSUPPORTED_COMMAND_FAILURES)
+        key = (self.get_command_key(command, args), zone)
+        if not failures or (failure := self._failures.get(key)) is None:
+            return False
+        failure_count, last_failed = failure
+        if failure_count < failures:
+            return False
+        reprobe_interval = self._params.get_param(
+            PARAM_UNSUPPORTED_COMMAND_REPROBE_INTERVAL
+        )
+        if reprobe_interval and time.time() - last_failed >= reprobe_interval:
+            return False  ## re-probe command, failure time updated if it fails
+        return True
+
+    def get_unsupported_commands(self) -> dict[str, Any]:
+        """Get learned unsupported commands for persisting."""
+        return {
+            "model": self.model,
+            "commands": [
+                [command, zone.value, failure_count, last_failed]
+                for (command, zone), (failure_count, last_failed) in (
+                    self._failures.items()
+                )
+            ],
+        }
+
+    def set_unsupported_commands(self, unsupported: dict[str, Any]) -> None:
+        """Restore persisted unsupported commands for the current AVR model."""
+        model = unsupported.get("model")
+        if self.model is not None and model != self.model:
+            _LOGGER.info(
+                "ignoring unsupported commands learned for model %s", str(model)
+            )
+            return
+        self.model = model
+        self._failures = {
+            (command, Zone(zone)): (int(failure_count), float(last_failed))
+            for command, zone, failure_count, last_failed in unsupported.get(
+                "commands", []
+            )
+        }
+
+    def clear(self) -> None:
+        """Clear all learned capabilities."""
+        self._failures = {}
@@ -5,14 +5,14 @@ import logging
 import sys
 import json
 import argparse
-from collections.abc import Callable, Awaitable
+from collections.abc import Callable, Awaitable, Mapping
 from typing import Any
 
 import aioconsole
 import yaml
 
 from aiopioneer import PioneerAVR
-from aiopioneer.property_registry import PROPERTY_REGISTRY
+from aiopioneer.property_registry import get_property_registry
 from aiopioneer.const import Zone, DEFAULT_PORT, TunerBand, MEDIA_CONTROL_COMMANDS_ALL
 from aiopioneer.params import (
     PARAM_DEBUG_LISTENER,
@@ -80,6 +80,15 @@ class PioneerAVRCli(aioconsole.AsynchronousCli):
             raise ValueError("")
         return argl in valid_args[0]
 
+    @staticmethod
+    def thaw(obj):
+        """Convert read-only mappings and tuples to plain dicts and lists."""
+        if isinstance(obj, Mapping):
+            return {k: PioneerAVRCli.thaw(v) for k, v in obj.items()}
+        if isinstance(obj, tuple):
+            return [PioneerAVRCli.thaw(v) for v in obj]
+        return obj
+
     @staticmethod
     def dump(obj, flow_style: bool = False) -> str:
         """Dump an object to YAML."""
@@ -104,11 +113,11 @@ class PioneerAVRCli(aioconsole.AsynchronousCli):
 
     async def get_params(self, reader, writer) -> str:
         """Show the currently active set of parameters."""
-        return self.dump(self.pioneer.params.params_all)
+        return self.dump(self.thaw(self.pioneer.params.params_all))
 
     async def get_user_params(self, reader, writer) -> str:
         """Show the currently active set of user parameters."""
-        return self.dump(self.pioneer.params.user_params)
+        return self.dump(self.thaw(self.pioneer.params.user_params))
 
     async def set_user_params(self, reader, writer, params: dict) -> str:
         """Set the user parameters."""
@@ -118,17 +127,18 @@ class PioneerAVRCli(aioconsole.AsynchronousCli):
         """Show the current cached AVR properties."""
 
         def scrub_property(prop):
-            if isinstance(prop, (set, list)):
+            if isinstance(prop, (set, frozenset, list, tuple)):
                 return list(scrub_property(v) for v in prop)
-            if isinstance(prop, dict):
-                return {scrub_property(k): v for k, v in prop.items()}
+            if isinstance(prop, Mapping):
+                return {scrub_property(k): scrub_property(v) for k, v in prop.items()}
             if isinstance(prop, Zone):
                 return prop.name
             return prop
 
+        snapshot = self.pioneer.properties.get_snapshot()
         return self.dump(
             {
-                prop: scrub_property(getattr(self.pioneer.properties, prop))
+                prop: scrub_property(snapshot[prop])
                 for prop in [p for p in PROPS_ALL if not prop_show or p in prop_show]
             },
             flow_style=None,
@@ -417,7 +427,7 @@ class PioneerAVRCli(aioconsole.AsynchronousCli):
         ]
         return dict(command_list) | {
             command.name: get_avr_command(command)
-            for command in PROPERTY_REGISTRY.commands
+            for command in get_property_registry().commands
         }
 
 
@@ -454,7 +464,7 @@ async def async_cli_main(args: argparse.Namespace):
         _LOGGER.error("could not connect to AVR: %s", repr(exc))
         return False
 
-    print(f"Using default params: {pioneer.params.user_params}")
+    print(f"Using default params: {dict(pioneer.params.user_params)}")
     pioneer.params.set_user_param(PARAM_DEBUG_LISTENER, True)
     if args.query_zones:
         await pioneer.query_zones()
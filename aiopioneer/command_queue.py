@@ -42,7 +42,11 @@ class CommandItem:
 
     def __eq__(self, value: Self):
         if self.command in ["_delayed_query_basic"]:
-            return self.command == value.command
+            ## Coalesce delayed queries, but wait for each powered on zone
+            return self.command == value.command and (
+                self.args == value.args
+                or not any(isinstance(arg, Zone) for arg in self.args + value.args)
+            )
         ## NOTE: assumes queue_item is lhs for `in` comparison
         if self.command == "_full_refresh" and value.command in [
             "_refresh_zone",
@@ -83,6 +87,7 @@ class CommandQueue:
         self._queue: list[list[CommandItem]] = [[] for _ in range(num_queues)]
         self._task = None
         self._execute_callback: Callable[[CommandItem], Awaitable[None]] = None
+        self._executing_item: CommandItem = None
         self._command_exceptions: list[Exception] = []
         self._execute_lock = asyncio.Lock()
         self.startup_lock = asyncio.Lock()
@@ -155,6 +160,30 @@ class CommandQueue:
         if start_executing:
             self.schedule()
 
+    def remove(self, command: str, zone: Zone = None) -> None:
+        """
+        Remove queued items for a command, optionally only for a zone. The
+        executing item is not removed.
+        """
+        for queue_id, queue in enumerate(self._queue):
+            items = [
+                item
+                for item in queue
+                if item is self._executing_item
+                or item.command != command
+                or (zone is not None and item.zone is not zone)
+            ]
+            if len(items) == len(queue):
+                continue
+            if self._params.get_param(PARAM_DEBUG_COMMAND_QUEUE):
+                _LOGGER.debug(
+                    "removing %d %s items from queue #%d",
+                    len(queue) - len(items),
+                    command,
+                    queue_id,
+                )
+            self._queue[queue_id] = items
+
     def extend(self, items: list[CommandItem]) -> None:
         """Extend the command queue with a list of CommandItems."""
         for item in items:
@@ -220,6 +249,7 @@ class CommandQueue:
                 command = command_item.command
                 if self._params.get_param(PARAM_DEBUG_COMMAND_QUEUE):
                     _LOGGER.debug("command queue executing %s", command_item)
+                self._executing_item = command_item
                 try:
                     await self._execute_callback(command_item)
                 except AVRUnavailableError:
@@ -233,6 +263,8 @@ class CommandQueue:
                         "exception executing command %s: %s", command, repr(exc)
                     )
                     self._command_exceptions.append(exc)
+                finally:
+                    self._executing_item = None
 
                 self.pop(queue_id=queue_id)  ## pop from active queue
 
@@ -7,6 +7,8 @@ import logging
 import time
 import traceback
 
+from collections import deque
+
 from .const import DEFAULT_PORT, DEFAULT_TIMEOUT, DEFAULT_SCAN_INTERVAL
 from .exceptions import (
     AVRError,
@@ -18,15 +20,21 @@ from .exceptions import (
     AVRConnectTimeoutError,
     AVRResponseDecodeError,
 )
+from .health import ConnectionHealth
+from .latency import CommandLatency
+from .recorder import TrafficRecorder, RECORDER_MAX_BYTES, RECORDER_BACKUP_COUNT
+from .retry import RetryPolicy, BackoffRetryPolicy
+from .transport import AVRTransport, TCPTransport
 from .params import (
     AVRParams,
     PARAM_COMMAND_DELAY,
     PARAM_ALWAYS_POLL,
     PARAM_DEBUG_LISTENER,
     PARAM_DEBUG_COMMAND,
+    PARAM_HEALTH_CHECK_IDLE_TIME,
+    PARAM_HEALTH_CHECK_MISSED_PROBES,
 )
 from .util import (
-    sock_set_keepalive,
     get_backoff_delay,
     cancel_task,
 )
@@ -37,6 +45,9 @@ _LOGGER = logging.getLogger(__name__)
 class AVRConnection:
     """Pioneer AVR connection class."""
 
+    HEALTH_PROBE_COMMAND = "?P"  ## main zone power, supported by all AVRs
+    HEALTH_PROBE_RESPONSE = "PWR"
+
     def __init__(  # pylint: disable=super-init-not-called
         self,
         params: AVRParams,
@@ -44,19 +55,25 @@ class AVRConnection:
         port: int = DEFAULT_PORT,
         timeout: float = DEFAULT_TIMEOUT,
         scan_interval: float = DEFAULT_SCAN_INTERVAL,
+        transport: AVRTransport = None,
     ):
         """Initialise the Pioneer AVR connection."""
         _LOGGER.debug(
-            ">> AVRConnection.__init__(host=%s, port=%s, timeout=%s, scan_interval=%s)",
+            ">> AVRConnection.__init__(host=%s, port=%s, timeout=%s, "
+            "scan_interval=%s, transport=%s)",
             repr(host),
             repr(port),
             repr(timeout),
             repr(scan_interval),
+            repr(transport),
         )
         self.params = params
         self._host = host
         self._port = port
         self._timeout = timeout
+        self.latency = CommandLatency(params, timeout)
+        self.retry_policy: RetryPolicy = BackoffRetryPolicy(params)
+        self.health = ConnectionHealth()
         self.scan_interval = scan_interval
 
         self.available = False
@@ -70,13 +87,16 @@ class AVRConnection:
         self._disconnect_lock = asyncio.Lock()
         self._request_lock = asyncio.Lock()
         self._listener_task = None
+        self._health_monitor_task = None
         self._reconnect_task = None
         self._response_event = asyncio.Event()
         self._response_queue: list[str] = []
         self._queue_responses = False
 
-        self._reader = None
-        self._writer = None
+        if transport is None:
+            transport = TCPTransport(host, port)
+        self._transport = transport
+        self._recorder: TrafficRecorder = None
 
     ## Connection/disconnection
     async def connect(self, reconnect: bool = True) -> None:
@@ -91,11 +111,8 @@ class AVRConnection:
         async with self._connect_lock:
             _LOGGER.debug("opening AVR connection")
             try:
-                reader, writer = (
-                    await asyncio.wait_for(  # pylint: disable=unused-variable
-                        asyncio.open_connection(self._host, self._port),
-                        timeout=self._timeout,
-                    )
+                await asyncio.wait_for(
+                    self._transport.connect(), timeout=self._timeout
                 )
             except TimeoutError as exc:
                 raise AVRConnectTimeoutError(exc=exc) from exc
@@ -103,8 +120,6 @@ class AVRConnection:
                 raise AVRConnectError(exc=exc) from exc
 
             _LOGGER.info("AVR connection established")
-            self._reader = reader
-            self._writer = writer
             self.available = True
             self._reconnect = reconnect
             await self.on_connect()
@@ -114,7 +129,10 @@ class AVRConnection:
     async def on_connect(self) -> None:
         """Start AVR tasks on connection."""
         self._set_socket_options()
+        self.health.last_response_at = time.monotonic()
+        self.health.missed_probes = 0
         await self._listener_schedule()
+        await self._health_monitor_schedule()
         await asyncio.sleep(0)  # yield to listener task
 
     async def disconnect(self, reconnect: bool = None) -> None:
@@ -135,16 +153,14 @@ class AVRConnection:
             _LOGGER.debug("disconnecting AVR connection")
             self.available = False
             await self.on_disconnect()
-            if self._writer:
-                ## Close AVR connection
-                _LOGGER.debug("closing AVR connection")
-                self._writer.close()
-                try:
-                    await self._writer.wait_closed()
-                except Exception as exc:  # pylint: disable=broad-except
-                    _LOGGER.debug("ignoring disconnect exception: %s", repr(exc))
-            self._reader = None
-            self._writer = None
+            ## Close AVR connection
+            _LOGGER.debug("closing AVR connection")
+            try:
+                await self._transport.close()
+            except Exception as exc:  # pylint: disable=broad-except
+                _LOGGER.debug("ignoring disconnect exception: %s", repr(exc))
+            if self._recorder:
+                self._recorder.flush()
             _LOGGER.info("AVR connection closed")
 
             if reconnect:
@@ -154,6 +170,7 @@ class AVRConnection:
 
     async def on_disconnect(self) -> None:
         """Stop tasks on disconnection."""
+        await self._health_monitor_cancel(ignore_exception=True)
         await self._listener_cancel(ignore_exception=True)
         await asyncio.sleep(0)  # yield to listener task
 
@@ -162,6 +179,7 @@ class AVRConnection:
         _LOGGER.debug(">> shutdown started")
         await self._reconnect_cancel()
         await self.disconnect(reconnect=False)
+        self.stop_recording()
         await asyncio.sleep(0)  # yield to pending shutdown tasks
         _LOGGER.debug(">> shutdown completed")
 
@@ -201,16 +219,29 @@ class AVRConnection:
 
     def _set_socket_options(self) -> None:
         """Set socket keepalive options."""
-        sock_set_keepalive(
-            self._writer.get_extra_info("socket"),
-            after_idle_sec=int(self._timeout),
-            interval_sec=int(self._timeout),
-            max_fails=3,
-        )
+        self._transport.set_keepalive(self._timeout)
+
+    def start_recording(
+        self,
+        path: str,
+        max_bytes: int = RECORDER_MAX_BYTES,
+        backup_count: int = RECORDER_BACKUP_COUNT,
+    ) -> None:
+        """Start recording raw AVR traffic to a file."""
+        self.stop_recording()
+        _LOGGER.info("recording AVR traffic to %s", path)
+        self._recorder = TrafficRecorder(path, max_bytes, backup_count)
+
+    def stop_recording(self) -> None:
+        """Stop recording raw AVR traffic."""
+        if self._recorder:
+            self._recorder.close()
+            self._recorder = None
 
     async def set_timeout(self, timeout: float) -> None:
         """Set timeout and update socket keepalive options."""
         self._timeout = timeout
+        self.latency.timeout = timeout
         self._set_socket_options()
 
     async def _reconnect_schedule(self) -> None:
@@ -242,24 +273,33 @@ class AVRConnection:
         """AVR connection listener. Decode responses and update state."""
         if self.params.get_param(PARAM_DEBUG_LISTENER):
             _LOGGER.debug(">> listener started")
+        responses: deque[str] = deque()
         while self.available:
             action = "listening for responses"
             debug_listener = self.params.get_param(PARAM_DEBUG_LISTENER)
             try:
-                response = (await self._reader.readuntil(b"\n")).decode().strip()
-                ## NOTE: any response from the AVR received within the
-                ## scan_interval, including keepalives and responses triggered
-                ## via the remote and by other clients, will cause the next
-                ## update to be rescheduled to scan_interval after the last
-                ## response.
-                ##
-                ## Keepalives may be sent by the AVR (every 30 seconds on the
-                ## VSX-930) when connected to port 8102, but are not sent when
-                ## connected to port 23.
-                ##
+                if responses:
+                    response = responses.popleft()
+                else:
+                    lines = await self._transport.read_lines()
+                    self.health.last_response_at = time.monotonic()
+                    if self._recorder:
+                        self._recorder.record_rx(lines)
+                    responses.extend(lines)
+                    ## NOTE: any response from the AVR received within the
+                    ## scan_interval, including keepalives and responses triggered
+                    ## via the remote and by other clients, will cause the next
+                    ## update to be rescheduled to scan_interval after the last
+                    ## response.
+                    ##
+                    ## Keepalives may be sent by the AVR (every 30 seconds on the
+                    ## VSX-930) when connected to port 8102, but are not sent when
+                    ## connected to port 23.
+                    if not self.params.get_param(PARAM_ALWAYS_POLL):
+                        self.last_updated = time.time()  # consider as refresh
+                    continue
+
                 ## Check for empty response
-                if not self.params.get_param(PARAM_ALWAYS_POLL):
-                    self.last_updated = time.time()  # consider responses as refresh
                 if response is not None and not response:
                     ## Skip processing empty responses (keepalives)
                     # if debug_listener:
@@ -331,6 +371,71 @@ class AVRConnection:
         )
         self._listener_task = None
 
+    async def _health_monitor(self) -> None:
+        """Probe AVR when connection is idle to detect a dead connection."""
+        _LOGGER.debug(">> health monitor started")
+        health = self.health
+        while self.available:
+            if not (idle_time := self.params.get_param(PARAM_HEALTH_CHECK_IDLE_TIME)):
+                break
+            idle = time.monotonic() - health.last_response_at
+            if health.missed_probes == 0 and idle < idle_time:
+                await asyncio.sleep(idle_time - idle)
+                continue
+
+            ## Connection idle, probe AVR
+            health.probes += 1
+            probe_sent_at = time.monotonic()
+            try:
+                await self.send_raw_request(
+                    self.HEALTH_PROBE_COMMAND, self.HEALTH_PROBE_RESPONSE
+                )
+                health.rtt.record(time.monotonic() - probe_sent_at)
+                health.missed_probes = 0
+                continue
+            except AVRCommandResponseError:
+                health.missed_probes = 0  ## AVR responded
+                continue
+            except AVRResponseTimeoutError:
+                health.probe_failures += 1
+            except AVRUnavailableError:
+                break
+
+            if health.last_response_at > probe_sent_at:
+                health.missed_probes = 0  ## other responses were received
+                continue
+            health.missed_probes += 1
+            missed_probes = self.params.get_param(PARAM_HEALTH_CHECK_MISSED_PROBES)
+            _LOGGER.debug(
+                "AVR health probe missed (%d/%d)", health.missed_probes, missed_probes
+            )
+            if health.missed_probes >= missed_probes:
+                _LOGGER.warning(
+                    "AVR not responding after %d health probes, reconnecting",
+                    health.missed_probes,
+                )
+                health.dead_links += 1
+                health.missed_probes = 0
+                if not self._disconnect_lock.locked():
+                    await self.disconnect()  ## schedules reconnect if enabled
+                break
+
+        _LOGGER.debug(">> health monitor completed")
+
+    async def _health_monitor_schedule(self) -> None:
+        """Schedule the health monitor task."""
+        await self._health_monitor_cancel()
+        self._health_monitor_task = asyncio.create_task(
+            self._health_monitor(), name="avr_health_monitor"
+        )
+
+    async def _health_monitor_cancel(self, ignore_exception=False) -> None:
+        """Cancel the health monitor task."""
+        await cancel_task(
+            self._health_monitor_task, ignore_exceptions=ignore_exception
+        )
+        self._health_monitor_task = None
+
     ## Send commands and requests to AVR
     async def send_raw_command(self, command: str, rate_limit: bool = True) -> None:
         """Send a raw command to the AVR."""
@@ -351,11 +456,12 @@ class AVRConnection:
                 await asyncio.sleep(command_delay - since_command)
         _LOGGER.debug("sending command: %s", command)
         try:
-            self._writer.write(command.encode("ASCII") + b"\r")
-            await self._writer.drain()
+            await self._transport.write_lines([command])
         except Exception as exc:
             _LOGGER.error("could not send command %s to AVR: %s", command, repr(exc))
             raise AVRUnavailableError from exc
+        if self._recorder:
+            self._recorder.record_tx(command)
         self._last_command_at = time.time()
 
     async def _wait_for_response(self, command: str, response_prefix: str) -> str:
@@ -392,30 +498,48 @@ class AVRConnection:
             self._queue_responses = False
             self._response_queue = []
 
-        async with self._request_lock:  ## Only send one request at a time
-            self._response_queue = []
-            ## Start queueing responses before sending command
-            self._queue_responses = True
-            self._response_event.clear()
-            send_count = 0
-            while True:
+        attempt = 0
+        while True:
+            async with self._request_lock:  ## Only send one request at a time
+                self._response_queue = []
+                ## Start queueing responses before sending command
+                self._queue_responses = True
+                self._response_event.clear()
                 await self.send_raw_command(command, rate_limit=rate_limit)
+                sent_at = time.monotonic()
+                attempt += 1
                 try:
                     response = await asyncio.wait_for(
                         self._wait_for_response(command, response_prefix),
-                        timeout=self._timeout,
+                        timeout=self.latency.get_timeout(response_prefix),
                     )
-                    stop_response_queue()
+                    self.latency.record(response_prefix, time.monotonic() - sent_at)
                     return response
                 except TimeoutError as exc:  # response timer expired
-                    stop_response_queue()
-                    raise AVRResponseTimeoutError(command=command) from exc
+                    self.latency.record_timeout(response_prefix)
+                    error = AVRResponseTimeoutError(command=command)
+                    delay = self._get_retry_delay(command, error, attempt, retry_count)
+                    if delay is None:
+                        raise error from exc
                 except AVRCommandResponseError as exc:
-                    send_count += 1
-                    if send_count > retry_count or exc.response not in ["E02", "B00"]:
-                        stop_response_queue()
+                    ## Error responses may be faster than responses, do not sample
+                    self.latency.record_error(response_prefix)
+                    delay = self._get_retry_delay(command, exc, attempt, retry_count)
+                    if delay is None:
                         raise
-                    _LOGGER.warning(
-                        "retrying failed command (%d): %s", send_count, command
-                    )
-                    await asyncio.sleep(1)
+                finally:
+                    stop_response_queue()
+
+            ## Wait for retry without blocking other requests
+            _LOGGER.warning(
+                "retrying failed command (%d) in %.3fs: %s", attempt, delay, command
+            )
+            await asyncio.sleep(delay)
+
+    def _get_retry_delay(
+        self, command: str, exc: AVRError, attempt: int, retry_count: int
+    ) -> float | None:
+        """Get delay before retrying a failed request, or None if not retried."""
+        if attempt > retry_count:
+            return None
+        return self.retry_policy.get_retry_delay(command, exc, attempt)
@@ -41,6 +41,15 @@ class TunerBand(StrEnum):
     AM = "AM"
 
 
+class VolumeRampCurve(StrEnum):
+    """Volume ramp curves."""
+
+    LINEAR = "linear"
+    EASE_IN = "ease_in"
+    EASE_OUT = "ease_out"
+    EASE_IN_OUT = "ease_in_out"
+
+
 SOURCE_TUNER = 2
 
 # Listening modes is a dict with a nested array for the following structure:
@@ -1,137 +1,183 @@
 """aiopioneer response decoder."""
 
 import logging
+import time
 
+from collections.abc import AsyncIterable, Iterable, Iterator
+from typing import Any
+
+from .command_queue import CommandItem
 from .const import Zone
 from .decoders.code_map import CodeMapBase
 from .decoders.response import Response
 from .exceptions import AVRResponseDecodeError
 from .params import AVRParams
 from .properties import AVRProperties
-from .property_registry import PROPERTY_REGISTRY
+from .property_registry import get_property_registry
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _commit_response(response: Response) -> None:
-    """Commit a decoded response to properties."""
-    current_base = current_value = None  #
+def _commit_response(response: Response) -> bool:
+    """Commit a decoded response to properties, return whether it was changed."""
     properties = response.properties
-
     if response.base_property is None:
+        return False
+
+    log_changes = _LOGGER.isEnabledFor(logging.INFO)
+    if log_changes:
+        current_value = properties.get_property_value(
+            response.base_property, response.zone, response.property_name
+        )
+    if not properties.set_property(
+        response.base_property,
+        response.value,
+        zone=response.zone,
+        property_name=response.property_name,
+    ):
+        return False
+    if log_changes:
+        is_global = response.zone in [Zone.ALL, None]
+        _LOGGER.info(
+            "%s: %s: %s -> %s (%s)",
+            "Global" if is_global else response.zone.full_name,
+            (
+                response.base_property
+                if response.property_name is None
+                else f"{response.base_property}.{response.property_name}"
+            ),
+            repr(current_value),
+            repr(response.value),
+            repr(response.code),
+        )
+    properties.history.record(
+        response.base_property, response.zone, response.property_name, response.value
+    )
+    return True
+
+
+def _check_repeated_response(
+    properties: AVRProperties, cache_key: tuple[str, Zone], code: str
+) -> frozenset[Zone] | None:
+    """
+    Check whether response is unchanged since it was last decoded, and return
+    the zones updated by the response if so.
+    """
+    cached = properties.response_cache.get(cache_key)
+    if cached is None or cached[0] != code:
+        return None
+    code, _, committed, zones = cached
+    for base_property, zone, property_name, value in committed:
+        if properties.get_property_value(base_property, zone, property_name) != value:
+            return None  ## property changed since response was last decoded
+    properties.response_cache[cache_key] = (code, time.time(), committed, zones)
+    properties.skipped_decode_count += 1
+    return zones
+
+
+def _decode_raw_response(
+    raw_resp: str,
+    params: AVRParams,
+    properties: AVRProperties,
+    skipped_zones: set[Zone] = None,
+) -> Iterator[Response]:
+    """
+    Decode a raw response and yield responses to be committed.
+
+    Responses are yielded lazily so that each is committed before the decoder
+    callback of the next response is run. Responses for code maps that set
+    skip_repeated_response are not decoded if identical to the previously
+    decoded response and the properties it committed are unchanged. The
+    zones updated when the response was last decoded are added to
+    skipped_zones instead. The cache is cleared when params change.
+    """
+    match_resp = get_property_registry().match_response(raw_resp=raw_resp)
+    if not match_resp:
+        ## No error handling as not all responses have been captured by aiopioneer.
+        if not (raw_resp.startswith("E") or raw_resp == "B00"):
+            _LOGGER.debug("undecoded response: %s", raw_resp)
         return
 
-    current_base = current_value = getattr(properties, response.base_property)
-    is_global = response.zone in [Zone.ALL, None]
-    if response.property_name is None and not is_global:
-        current_value = current_base.get(response.zone)
-        if current_value != response.value:
-            if response.value is not None:
-                current_base[response.zone] = response.value
-            else:
-                del current_base[response.zone]
-            setattr(properties, response.base_property, current_base)
-            _LOGGER.info(
-                "%s: %s: %s -> %s (%s)",
-                response.zone.full_name,
-                response.base_property,
-                repr(current_value),
-                repr(response.value),
-                repr(response.code),
-            )
-    elif response.property_name is not None and not is_global:
-        ## Default zone dict first, otherwise we hit an exception
-        current_base.setdefault(response.zone, {})
-        current_prop = current_base.get(response.zone)
-        current_value = current_prop.get(response.property_name)
-        if current_value != response.value:
-            if response.value is not None:
-                current_base[response.zone][response.property_name] = response.value
-            else:
-                del current_base[response.zone][response.property_name]
-            setattr(properties, response.base_property, current_base)
-            _LOGGER.info(
-                "%s: %s.%s: %s -> %s (%s)",
-                response.zone.full_name,
-                response.base_property,
-                response.property_name,
-                repr(current_value),
-                repr(response.value),
-                repr(response.code),
-            )
-    elif response.property_name is None and is_global:
-        if current_base != response.value:
-            setattr(properties, response.base_property, response.value)
-            _LOGGER.info(
-                "Global: %s: %s -> %s (%s)",
-                response.base_property,
-                repr(current_base),
-                repr(response.value),
-                repr(response.code),
+    response_cmd, code_map, response_zone = match_resp
+    code = raw_resp[len(response_cmd) :]
+    if not issubclass(code_map, CodeMapBase):
+        raise RuntimeError(f"invalid decoder {code_map} for response: {code}")
+    cache_key = (response_cmd, response_zone)
+    cacheable = code_map.skip_repeated_response
+    if cacheable:
+        zones = _check_repeated_response(properties, cache_key, code)
+        if zones is not None:
+            if skipped_zones is not None:
+                skipped_zones |= zones
+            return
+    responses = code_map.decode_response(
+        response=Response(
+            properties=properties,
+            code=code,
+            response_command=response_cmd,
+            zone=response_zone,
+        ),
+        params=params,
+    )
+    if responses is None:
+        raise RuntimeError(f"decoder {code_map} returned null response: {code}")
+
+    committed = []
+    zones = set()
+    while responses:
+        response = responses.pop(0)
+        if response is None:
+            raise RuntimeError("decoder returned null response")
+        if response.callback:
+            callback = response.callback
+            response.callback = None
+            callback_responses = callback(response)
+            _LOGGER.debug(
+                "response callback: %s -> %s", callback.__name__, callback_responses
             )
-    else:  # response.property_name is not None and is_global:
-        current_value = current_base.get(response.property_name)
-        if current_value != response.value:
-            if response.value is not None:
-                current_base[response.property_name] = response.value
-            else:
-                del current_base[response.property_name]
-            setattr(properties, response.base_property, current_base)
-            _LOGGER.info(
-                "Global: %s.%s: %s -> %s (%s)",
-                response.base_property,
-                response.property_name,
-                repr(current_value),
-                repr(response.value),
-                repr(response.code),
+            if callback_responses is None:
+                raise RuntimeError("decoder callback returned null response")
+            callback_responses.extend(responses)  # prepend callback_responses
+            responses = callback_responses
+            continue  ## don't process original callback response
+        if response.queue_commands:
+            cacheable = False  ## commands must be queued on every decode
+        elif cacheable and response.base_property is not None:
+            committed.append(
+                (
+                    response.base_property,
+                    response.zone,
+                    response.property_name,
+                    response.value,
+                )
             )
+        if response.zone is not None:
+            zones.add(response.zone)
+        if response.update_zones:
+            zones |= response.update_zones
+        yield response
+
+    if cacheable:
+        properties.response_cache[cache_key] = (
+            code,
+            time.time(),
+            tuple(committed),
+            frozenset(zones),
+        )
+    elif code_map.skip_repeated_response:
+        properties.response_cache.pop(cache_key, None)
 
 
 def process_raw_response(
     raw_resp: str, params: AVRParams, properties: AVRProperties
 ) -> set[Zone]:
     """Processes a raw response, decode and apply to properties."""
+    updated_zones: set[Zone] = set()
     try:
-        if not (match_resp := PROPERTY_REGISTRY.match_response(raw_resp=raw_resp)):
-            ## No error handling as not all responses have been captured by aiopioneer.
-            if not (raw_resp.startswith("E") or raw_resp == "B00"):
-                _LOGGER.debug("undecoded response: %s", raw_resp)
-            return []
-
-        response_cmd, code_map, response_zone = match_resp
-        code = raw_resp[len(response_cmd) :]
-        if not issubclass(code_map, CodeMapBase):
-            raise RuntimeError(f"invalid decoder {code_map} for response: {code}")
-        responses = code_map.decode_response(
-            response=Response(
-                properties=properties,
-                code=code,
-                response_command=response_cmd,
-                zone=response_zone,
-            ),
-            params=params,
-        )
-        if responses is None:
-            raise RuntimeError(f"decoder {code_map} returned null response: {code}")
-
         ## Process responses and update properties
-        updated_zones: set[Zone] = set()
-        while responses:
-            response = responses.pop(0)
-            if response is None:
-                raise RuntimeError("decoder returned null response")
-            if response.callback:
-                callback = response.callback
-                response.callback = None
-                callback_responses = callback(response)
-                _LOGGER.debug(
-                    "response callback: %s -> %s", callback.__name__, callback_responses
-                )
-                if callback_responses is None:
-                    raise RuntimeError("decoder callback returned null response")
-                callback_responses.extend(responses)  # prepend callback_responses
-                responses = callback_responses
-                continue  ## don't process original callback response
+        for response in _decode_raw_response(
+            raw_resp, params, properties, skipped_zones=updated_zones
+        ):
             _commit_response(response)
             if response.zone is not None:
                 updated_zones.add(response.zone)
@@ -144,3 +190,115 @@ def process_raw_response(
         raise AVRResponseDecodeError(response=raw_resp, exc=exc) from exc
 
     return updated_zones
+
+
+class ResponseBatch:
+    """
+    Batch decoder for raw AVR responses, eg. from a captured session log.
+
+    Decoded responses are committed to properties. Local commands queued by
+    the decoders that do not need the AVR, such as _update_listening_modes,
+    are executed after each line is decoded. All other queued commands are
+    collected in queue_commands rather than executed. Changes are recorded in
+    changes as tuples of (line number, zone, base_property, property_name,
+    value).
+    """
+
+    def __init__(self, params: AVRParams = None, properties: AVRProperties = None):
+        if params is None:
+            params = AVRParams()
+        if properties is None:
+            properties = AVRProperties(params)
+            properties.update_listening_modes()
+        self.params = params
+        self.properties = properties
+        self.line_count = 0
+        self.decode_count = 0
+        self.changes: list[tuple[int, Zone, str, str, Any]] = []
+        self.queue_commands: list[tuple[int, CommandItem]] = []
+        self.errors: list[AVRResponseDecodeError] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"ResponseBatch(line_count={self.line_count}, "
+            f"decode_count={self.decode_count}, "
+            f"changes={len(self.changes)}, "
+            f"queue_commands={len(self.queue_commands)}, "
+            f"errors={len(self.errors)})"
+        )
+
+    def process(self, raw_resp: str) -> None:
+        """Decode a raw response and commit to properties."""
+        self.line_count += 1
+        if not (raw_resp := raw_resp.strip()):
+            return  ## skip keepalives and blank lines
+        line_count = self.line_count
+        queue_commands: list[CommandItem] = []
+        try:
+            for response in _decode_raw_response(
+                raw_resp, self.params, self.properties
+            ):
+                self.decode_count += 1
+                if _commit_response(response):
+                    self.changes.append(
+                        (
+                            line_count,
+                            response.zone,
+                            response.base_property,
+                            response.property_name,
+                            response.value,
+                        )
+                    )
+                queue_commands.extend(response.queue_commands)
+        except Exception as exc:  # pylint: disable=broad-except
+            ## Continue on decode errors, as the listener does
+            self.errors.append(AVRResponseDecodeError(response=raw_resp, exc=exc))
+        for command_item in queue_commands:
+            if not self._execute_local_command(command_item):
+                self.queue_commands.append((line_count, command_item))
+
+    def _execute_local_command(self, command_item: CommandItem) -> bool:
+        """Execute a local command that does not need the AVR, if possible."""
+        match command_item.command:
+            case "_update_listening_modes":
+                self.properties.update_listening_modes()
+            case _:
+                return False
+        return True
+
+    def extend(self, raw_responses: Iterable[str]) -> None:
+        """Decode an iterable of raw responses."""
+        for raw_resp in raw_responses:
+            self.process(raw_resp)
+
+    async def async_extend(
+        self, raw_responses: Iterable[str] | AsyncIterable[str]
+    ) -> None:
+        """Decode an iterable or async iterable of raw responses."""
+        if not isinstance(raw_responses, AsyncIterable):
+            self.extend(raw_responses)
+            return
+        async for raw_resp in raw_responses:
+            self.process(raw_resp)
+
+
+def process_raw_responses(
+    raw_responses: Iterable[str],
+    params: AVRParams = None,
+    properties: AVRProperties = None,
+) -> ResponseBatch:
+    """Decode an iterable of raw responses without sending queued commands."""
+    batch = ResponseBatch(params=params, properties=properties)
+    batch.extend(raw_responses)
+    return batch
+
+
+async def async_process_raw_responses(
+    raw_responses: Iterable[str] | AsyncIterable[str],
+    params: AVRParams = None,
+    properties: AVRProperties = None,
+) -> ResponseBatch:
+    """Decode an (async) iterable of raw responses without sending commands."""
+    batch = ResponseBatch(params=params, properties=properties)
+    await batch.async_extend(raw_responses)
+    return batch
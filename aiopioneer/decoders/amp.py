@@ -50,7 +50,7 @@ class Power(CodeInverseBoolMap):
             queue_commands = []
             if properties.power.get(zone) is False:  ## zone has been turned on
                 queue_commands.append(
-                    CommandItem("_delayed_query_basic", 2.5, queue_id=3)
+                    CommandItem("_delayed_query_basic", zone, queue_id=3)
                 )
             if zone not in properties.zones_initial_refresh:
                 _LOGGER.debug("queuing initial refresh for zone %s", zone.full_name)
@@ -176,9 +176,13 @@ class SourceName(CodeStrMap):
             source_name = None
             if (source_id := response.value) in properties.source_id_to_name:
                 source_name = properties.source_id_to_name[source_id]
-                properties.source_id_to_name.pop(source_id)
+                properties.set_property(
+                    "source_id_to_name", None, property_name=source_id
+                )
             if source_name in properties.source_name_to_id:
-                properties.source_name_to_id.pop(source_name)
+                properties.set_property(
+                    "source_name_to_id", None, property_name=source_name
+                )
             return []
 
         super().decode_response(response=response, params=params)
@@ -385,6 +389,7 @@ class DisplayText(CodeStrMap):
     friendly_name = "display text"
     base_property = "amp"
     property_name = "display"
+    skip_repeated_response = True
 
     ## NOTE: value_to_code not implemented
 
@@ -34,16 +34,22 @@ class AudioChannelActive(CodeDictStrMap):
         "1": "active",
     }
 
+    _channel_classes: dict[tuple[str, str], type["AudioChannelActive"]] = {}
+
     def __new__(cls, channel_type: str, channel: str):
-        """Create a subclass for channel type and name."""
-        return type(
-            f"AudioChannelActive_{channel_type}_{channel}",
-            (AudioChannelActive,),
-            {
-                "friendly_name": f"{channel_type} channel {channel}",
-                "property_name": f"{channel_type}_channels.{channel}",
-            },
-        )
+        """Create (or reuse) a subclass for channel type and name."""
+        key = (channel_type, channel)
+        if (channel_class := AudioChannelActive._channel_classes.get(key)) is None:
+            channel_class = type(
+                f"AudioChannelActive_{channel_type}_{channel}",
+                (AudioChannelActive,),
+                {
+                    "friendly_name": f"{channel_type} channel {channel}",
+                    "property_name": f"{channel_type}_channels.{channel}",
+                },
+            )
+            AudioChannelActive._channel_classes[key] = channel_class
+        return channel_class
 
 
 class AudioInputMultichannel(CodeBoolMap):
@@ -213,6 +219,7 @@ class AudioInformation(CodeMapSequence):
     friendly_name = "audio information"
     base_property = "audio"
     property_name = "information"  # unused
+    skip_repeated_response = True
 
     code_map_sequence = [
         AudioSignalInputInfo,  # [0:2] audio.input_signal
@@ -4,6 +4,7 @@ import argparse
 import logging
 import re
 from abc import abstractmethod
+from collections.abc import Callable
 from typing import Any
 
 from ..const import Zone
@@ -18,6 +19,16 @@ CODE_MAP_EXP = pow(10, CODE_MAP_NDIGITS)
 _LOGGER = logging.getLogger(__name__)
 
 
+def _inherits_method(cls: type, owner: type, name: str) -> bool:
+    """Check whether classmethod name of cls is inherited unchanged from owner."""
+    return getattr(cls, name).__func__ is getattr(owner, name).__func__
+
+
+def _get_method_owner(cls: type, name: str) -> type | None:
+    """Get class in MRO of cls that defines name."""
+    return next((c for c in cls.__mro__ if name in c.__dict__), None)
+
+
 class CodeDefault:
     """Default code for map."""
 
@@ -39,6 +50,9 @@ class CodeMapBase:
     unit_of_measurement: str = None
     ha_auto_entity: bool = True  ## add as HA entity automatically
     ha_enable_default: bool = False  ## enable entity by default
+    skip_repeated_response: bool = False  ## decode depends only on response code
+
+    _value_decoders: dict[type, Callable[[str], Any]] = {}
 
     def __new__(cls, value, **kwargs):
         _LOGGER.warning("deprecated __new__ method called for class %s", cls)
@@ -121,6 +135,24 @@ class CodeMapBase:
         """Convert code to value."""
         raise NotImplementedError(f"code_to_value unsupported for {cls.get_name()}")
 
+    @classmethod
+    def compile_value_decoder(cls) -> Callable[[str], Any]:
+        """Compile a specialised code to value decoder for code map."""
+        return cls.code_to_value
+
+    @classmethod
+    def get_value_decoder(cls) -> Callable[[str], Any]:
+        """Get code to value decoder for code map, compiling on first use."""
+        if (decoder := CodeMapBase._value_decoders.get(cls)) is None:
+            decoder = cls.compile_value_decoder()
+            CodeMapBase._value_decoders[cls] = decoder
+        return decoder
+
+    @classmethod
+    def has_default_decoder(cls) -> bool:
+        """Check whether responses are decoded with the code map value decoder."""
+        return _inherits_method(cls, CodeMapBase, "decode_response")
+
     @classmethod
     def parse_args(
         cls,
@@ -142,7 +174,7 @@ class CodeMapBase:
     ) -> list[Response]:
         """Decode a response."""
         cls.set_response_properties(response)
-        response.update(value=cls.code_to_value(response.code))
+        response.update(value=cls.get_value_decoder()(response.code))
         return [response]
 
 
@@ -166,9 +198,16 @@ class CodeMapBlank(CodeMapComplexMixin, CodeMapBase):
 
     code_len = None
 
+    _blank_classes: dict[int | None, type["CodeMapBlank"]] = {}
+
     def __new__(cls, code_len: int = None):
-        """Create a subclass for a code map of code_len characters."""
-        return type(f"CodeMapBlank_{code_len}", (CodeMapBlank,), {"code_len": code_len})
+        """Create (or reuse) a subclass for a code map of code_len characters."""
+        if (blank_class := CodeMapBlank._blank_classes.get(code_len)) is None:
+            blank_class = type(
+                f"CodeMapBlank_{code_len}", (CodeMapBlank,), {"code_len": code_len}
+            )
+            CodeMapBlank._blank_classes[code_len] = blank_class
+        return blank_class
 
     @classmethod
     def get_len(cls) -> int:
@@ -203,6 +242,8 @@ class CodeMapSequence(CodeMapComplexMixin, CodeMapBase):
     code_map_sequence: list[type[CodeMapBase]] = []
     code_fillchar = "_"
 
+    _sequence_plans: dict[int, tuple[list, tuple]] = {}
+
     @classmethod
     def get_len_sequence(cls, code_map_sequence: list[type[CodeMapBase]] = None) -> int:
         """Get length of sequence."""
@@ -289,6 +330,51 @@ class CodeMapSequence(CodeMapComplexMixin, CodeMapBase):
             [parse_child_item(child_item) for child_item in code_map_sequence]
         )
 
+    @classmethod
+    def get_sequence_plan(
+        cls, code_map_sequence: list[type[CodeMapBase]] = None
+    ) -> tuple[tuple[int, int, bool, type[CodeMapBase], Callable | None], ...]:
+        """
+        Get compiled decode plan for code map sequence.
+
+        Each plan item is a (start, end, from_end, child_map, decoder) tuple,
+        where start and end are offsets relative to the end of the code if
+        from_end is set (after a negative length blank), and decoder is the
+        value decoder of child_map if it uses the default decode_response.
+        """
+        if code_map_sequence is None:
+            code_map_sequence = cls.code_map_sequence
+        cached = CodeMapSequence._sequence_plans.get(id(code_map_sequence))
+        if cached is not None and cached[0] is code_map_sequence:
+            return cached[1]
+
+        plan = []
+        code_index = 0
+        from_end = False
+        for child_map in code_map_sequence:
+            child_len = child_map.get_len()
+            if issubclass(child_map, CodeMapBlank):
+                if child_len < 0:
+                    code_index = 0
+                    from_end = True
+                code_index += child_len
+                continue
+            decoder = None
+            if child_map.has_default_decoder():
+                decoder = child_map.get_value_decoder()
+            plan.append(
+                (code_index, code_index + child_len, from_end, child_map, decoder)
+            )
+            code_index += child_len
+
+        plan = tuple(plan)
+        ## NOTE: sequence is held by cache so its id is not reused
+        CodeMapSequence._sequence_plans[id(code_map_sequence)] = (
+            code_map_sequence,
+            plan,
+        )
+        return plan
+
     @classmethod
     def decode_response_sequence(
         cls,
@@ -298,24 +384,37 @@ class CodeMapSequence(CodeMapComplexMixin, CodeMapBase):
     ) -> list[Response]:
         """Decode a response with code map sequence."""
         cls.set_response_properties(response)
-        code_index = 0
         responses = []
-        if code_map_sequence is None:
-            code_map_sequence = cls.code_map_sequence
+        code = response.code
+        code_len = len(code)
 
-        for child_map in code_map_sequence:
-            child_len = child_map.get_len()
-            if issubclass(child_map, CodeMapBlank):
-                if child_len < 0:
-                    code_index = len(response.code)
-                code_index += child_len
+        for start, end, from_end, child_map, decoder in cls.get_sequence_plan(
+            code_map_sequence
+        ):
+            if from_end:
+                start += code_len
+                end += code_len
+            child_code = code[start:end]
+            if decoder is None:
+                child_response = response.clone(code=child_code)
+                responses.extend(
+                    child_map.decode_response(response=child_response, params=params)
+                )
                 continue
-            child_code = response.code[code_index : code_index + child_len]
-            child_response = response.clone(code=child_code)
-            responses.extend(
-                child_map.decode_response(response=child_response, params=params)
+
+            ## Build response for default child decoder directly
+            value = decoder(child_code)
+            responses.append(
+                Response(
+                    properties=response.properties,
+                    code=child_code,
+                    response_command=response.response_command,
+                    base_property=child_map.base_property or response.base_property,
+                    property_name=child_map.property_name or response.property_name,
+                    zone=response.zone,
+                    value=response.value if value is None else value,
+                )
             )
-            code_index += child_len
 
         return responses
 
@@ -347,13 +446,18 @@ class CodeMapSequence(CodeMapComplexMixin, CodeMapBase):
 class CodeMapQuery(CodeMapBase):
     """Query code map."""
 
+    _query_classes: dict[type[CodeMapBase], type[CodeMapSequence]] = {}
+
     def __new__(cls, code_map_class: type[CodeMapBase]) -> type[CodeMapSequence]:
-        """Create a query code map class for base code map class."""
-        return type(
-            f"CodeMapQuery_{code_map_class.__name__}",
-            (CodeMapSequence,),
-            {"code_map_sequence": [CodeMapQuery, code_map_class]},
-        )
+        """Create (or reuse) a query code map class for base code map class."""
+        if (query_class := CodeMapQuery._query_classes.get(code_map_class)) is None:
+            query_class = type(
+                f"CodeMapQuery_{code_map_class.__name__}",
+                (CodeMapSequence,),
+                {"code_map_sequence": [CodeMapQuery, code_map_class]},
+            )
+            CodeMapQuery._query_classes[code_map_class] = query_class
+        return query_class
 
     @classmethod
     def get_len(cls) -> int:
@@ -435,6 +539,15 @@ class CodeStrMap(CodeMapBase):
             return str(code).rstrip(cls.code_fillchar)
         return str(code)
 
+    @classmethod
+    def compile_value_decoder(cls) -> Callable[[str], str]:
+        if not _inherits_method(cls, CodeStrMap, "code_to_value"):
+            return super().compile_value_decoder()
+        if cls.code_len and cls.code_fillchar:
+            code_fillchar = cls.code_fillchar
+            return lambda code: str(code).rstrip(code_fillchar)
+        return str
+
 
 class CodeBoolMap(CodeMapBase):
     """Map AVR codes to bool values."""
@@ -465,6 +578,13 @@ class CodeBoolMap(CodeMapBase):
     def code_to_value(cls, code: str) -> bool:
         return True if code == cls.code_true else False
 
+    @classmethod
+    def compile_value_decoder(cls) -> Callable[[str], bool]:
+        if not _inherits_method(cls, CodeBoolMap, "code_to_value"):
+            return super().compile_value_decoder()
+        code_true = cls.code_true
+        return lambda code: code == code_true
+
 
 class CodeInverseBoolMap(CodeBoolMap):
     """Map AVR codes to inverse bool values."""
@@ -479,6 +599,10 @@ class CodeDynamicDictMap(CodeMapComplexMixin, CodeMapBase):
     code_len: int = None
     index_map_class: type[CodeMapBase] = None
 
+    ## Reverse indexes per class, keyed by code map id in least recently used order
+    _reverse_indexes: dict[type, dict[int, tuple[dict, int, dict | None]]] = {}
+    _reverse_indexes_max = 32  ## per class
+
     @classmethod
     def get_len(cls) -> int:
         return cls.code_len if cls.code_len is not None else super().get_len()
@@ -493,15 +617,75 @@ class CodeDynamicDictMap(CodeMapComplexMixin, CodeMapBase):
         """Default value match function."""
         return v == value
 
+    @classmethod
+    def match_key(cls, v) -> Any:
+        """Get reverse index key for code map value, consistent with match."""
+        return v
+
+    @classmethod
+    def get_reverse_index(cls, code_map: dict, rebuild: bool = False) -> dict | None:
+        """
+        Get reverse index of values to codes for code map.
+
+        Indexes are cached per class for the most recently used code maps, and
+        an index is rebuilt when its code map has been resized. Returns None if
+        the code map values cannot be indexed.
+        """
+        indexes = CodeDynamicDictMap._reverse_indexes.setdefault(cls, {})
+        cached = indexes.pop(id(code_map), None)
+        if (
+            not rebuild
+            and cached is not None
+            and cached[0] is code_map
+            and cached[1] == len(code_map)
+        ):
+            indexes[id(code_map)] = cached  ## move to most recently used
+            return cached[2]
+
+        reverse_index = None
+        if _get_method_owner(cls, "match") is _get_method_owner(cls, "match_key"):
+            reverse_index = {}
+            try:
+                for k, v in code_map.items():
+                    reverse_index.setdefault(cls.match_key(v), k)
+            except TypeError:  ## unhashable value
+                reverse_index = None
+        if len(indexes) >= cls._reverse_indexes_max:
+            del indexes[next(iter(indexes))]  ## evict least recently used
+        indexes[id(code_map)] = (code_map, len(code_map), reverse_index)
+        return reverse_index
+
     @classmethod
     def value_to_code_dynamic(cls, value: Any, code_map: dict) -> str:
-        """Convert value to code for code map."""
-        for k, v in code_map.items():
-            if cls.match(v, value):
-                if cls.index_map_class:
-                    return cls.index_map_class.value_to_code(value=k)
-                return k
-        raise ValueError(f"value {value} not found for {cls.get_name()}")
+        """
+        Convert value to code for code map. Codes found in the reverse index
+        are checked against the code map, and the index is rebuilt once if the
+        value is not found or no longer matches.
+
+        NOTE: if a value is assigned in place to a code ahead of an existing
+        code with the same value, the existing code is returned until the
+        code map is resized.
+        """
+        k = None
+        for rebuild in [False, True]:  ## rebuild once if code map has changed
+            reverse_index = cls.get_reverse_index(code_map, rebuild=rebuild)
+            try:
+                if reverse_index is not None:
+                    k = reverse_index.get(value)
+            except TypeError:  ## unhashable value
+                reverse_index = None
+            if reverse_index is None:
+                ## Fall back to scanning code map
+                k = next((k for k, v in code_map.items() if cls.match(v, value)), None)
+                break
+            if k is not None and k in code_map and cls.match(code_map[k], value):
+                break
+            k = None
+        if k is None:
+            raise ValueError(f"value {value} not found for {cls.get_name()}")
+        if cls.index_map_class:
+            return cls.index_map_class.value_to_code(value=k)
+        return k
 
     @classmethod
     def code_to_value_dynamic(cls, code: str, code_map: dict) -> Any:
@@ -580,6 +764,10 @@ class CodeDynamicDictListMap(CodeDynamicDictMap):
         """Match value to first element of list."""
         return v[0] == value
 
+    @classmethod
+    def match_key(cls, v: list) -> Any:
+        return v[0]
+
 
 class CodeDictMap(CodeDynamicDictMap):
     """Map AVR codes to static code map."""
@@ -611,6 +799,47 @@ class CodeDictMap(CodeDynamicDictMap):
     def code_to_value(cls, code: str) -> Any:
         return cls.code_to_value_dynamic(code, code_map=cls.code_map)
 
+    @classmethod
+    def compile_dict_decoder(cls, first_element: bool = False) -> Callable[[str], Any]:
+        """Compile a decoder that looks up codes directly in the static code map."""
+        if not _inherits_method(cls, CodeDynamicDictMap, "code_to_value_dynamic"):
+            return cls.code_to_value
+        code_map = cls.code_map
+        code_default = CodeDefault()
+        index_decoder = None
+        if cls.index_map_class:
+            index_decoder = cls.index_map_class.get_value_decoder()
+        name = cls.get_name()
+
+        def decode_dict(code: str) -> Any:
+            index = code if index_decoder is None else index_decoder(code)
+            if index in code_map:
+                value = code_map[index]
+            elif code_default in code_map:
+                value = code_map[code_default]
+            else:
+                raise KeyError(f"key {code} not found for {name}")
+            return value[0] if first_element else value
+
+        return decode_dict
+
+    @classmethod
+    def compile_value_decoder(cls) -> Callable[[str], Any]:
+        if not _inherits_method(cls, CodeDictMap, "code_to_value"):
+            return super().compile_value_decoder()
+        return cls.compile_dict_decoder()
+
+    @classmethod
+    def has_default_decoder(cls) -> bool:
+        ## NOTE: compiled decoder is equivalent to code_to_value_dynamic only
+        ## if code_to_value and code_to_value_dynamic are not overridden
+        return (
+            _inherits_method(cls, CodeDictMap, "decode_response")
+            and _inherits_method(cls, CodeDictMap, "code_to_value")
+            and _inherits_method(cls, CodeDynamicDictMap, "decode_response_dynamic")
+            and _inherits_method(cls, CodeDynamicDictMap, "code_to_value_dynamic")
+        )
+
     @classmethod
     def parse_args(
         cls,
@@ -631,9 +860,13 @@ class CodeDictMap(CodeDynamicDictMap):
 
     @classmethod
     def decode_response(cls, response: Response, params: AVRParams) -> list[Response]:
-        return cls.decode_response_dynamic(
-            response=response, params=params, code_map=cls.code_map
-        )
+        if not cls.has_default_decoder():
+            return cls.decode_response_dynamic(
+                response=response, params=params, code_map=cls.code_map
+            )
+        cls.set_response_properties(response)
+        response.update(value=cls.get_value_decoder()(response.code))
+        return [response]
 
     @classmethod
     def keys(cls) -> list[str]:
@@ -667,11 +900,21 @@ class CodeDictListMap(CodeDictMap):
         value_list = super().code_to_value(code=code)
         return value_list[0]
 
+    @classmethod
+    def compile_value_decoder(cls) -> Callable[[str], Any]:
+        if not _inherits_method(cls, CodeDictListMap, "code_to_value"):
+            return cls.code_to_value
+        return cls.compile_dict_decoder(first_element=True)
+
     @classmethod
     def match(cls, v: list, value: str):
         """Match value to first element of list."""
         return v[0] == value
 
+    @classmethod
+    def match_key(cls, v: list) -> Any:
+        return v[0]
+
     @classmethod
     def values(cls) -> list[Any]:
         """Return list of first element of list items for code map."""
@@ -774,6 +1017,18 @@ class CodeFloatMap(CodeMapBase):
             CODE_MAP_NDIGITS,
         )
 
+    @classmethod
+    def compile_value_decoder(cls) -> Callable[[str], float]:
+        if not _inherits_method(cls, CodeFloatMap, "code_to_value"):
+            return super().compile_value_decoder()
+        code_offset = cls.code_offset
+        value_divider = cls.value_divider
+        value_offset = cls.value_offset
+        return lambda code: round(
+            (int(code) + code_offset) * value_divider - value_offset,
+            CODE_MAP_NDIGITS,
+        )
+
 
 class CodeIntMap(CodeFloatMap):
     """Map AVR codes to integer values."""
@@ -818,3 +1073,14 @@ class CodeIntMap(CodeFloatMap):
     @classmethod
     def code_to_value(cls, code: str) -> int:
         return (int(code) + cls.code_offset) * cls.value_divider - cls.value_offset
+
+    @classmethod
+    def compile_value_decoder(cls) -> Callable[[str], int]:
+        if not _inherits_method(cls, CodeIntMap, "code_to_value"):
+            return super().compile_value_decoder()
+        code_offset = cls.code_offset
+        value_divider = cls.value_divider
+        value_offset = cls.value_offset
+        if code_offset == 0 and value_divider == 1 and value_offset == 0:
+            return int
+        return lambda code: (int(code) + code_offset) * value_divider - value_offset
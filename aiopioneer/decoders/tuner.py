@@ -42,7 +42,7 @@ class TunerFMFrequency(CodeFloatMap):
         super().decode_response(response=response, params=params)
         return [
             response.clone(property_name="band", value=TunerBand.FM),
-            *TunerPreset.update_preset(response),
+            *TunerPreset.update_preset(response, TunerBand.FM),
             response,
         ]
 
@@ -135,7 +135,7 @@ class TunerAMFrequency(CodeIntMap):
         return [
             response.clone(inherit_property=False, callback=glean_frequency_step),
             response.clone(property_name="band", value=TunerBand.AM),
-            *TunerPreset.update_preset(response),
+            *TunerPreset.update_preset(response, TunerBand.AM),
             response,
         ]
 
@@ -231,7 +231,9 @@ class TunerPreset(CodeStrMap):
 
         def cache_preset(response: Response) -> list[Response]:
             """Cache preset for later update."""
-            response.properties.tuner["cached_preset"] = response.value
+            response.properties.set_property(
+                "tuner", response.value, property_name="cached_preset"
+            )
             return [response]
 
         super().decode_response(response=response, params=params)
@@ -243,7 +245,7 @@ class TunerPreset(CodeStrMap):
         return [response]
 
     @classmethod
-    def update_preset(cls, response: Response) -> list[Response]:
+    def update_preset(cls, response: Response, band: TunerBand) -> list[Response]:
         """Update tuner preset from cached preset and frequency update."""
 
         def check_cached_preset(response: Response) -> list[Response]:
@@ -254,7 +256,9 @@ class TunerPreset(CodeStrMap):
             if cached_preset is not None:
                 # pylint: disable=unbalanced-tuple-unpacking
                 (tuner_class, tuner_preset) = cached_preset
-                properties.tuner["cached_preset"] = None
+                properties.set_property("tuner", None, property_name="cached_preset")
+                ## NOTE: band from this response, as band update may not be committed
+                properties.tuner_presets[cached_preset] = (band, response.value)
                 return [
                     response.clone(property_name="class", value=tuner_class),
                     response.clone(property_name="preset", value=tuner_preset),
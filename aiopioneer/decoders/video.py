@@ -321,6 +321,7 @@ class VideoInformation(CodeMapSequence):
     friendly_name = "video information"
     base_property = "video"
     property_name = "information"  # unused
+    skip_repeated_response = True
 
     code_map_sequence = [
         VideoSignalInputTerminal,  # [0] signal_input_terminal
@@ -0,0 +1,168 @@
+"""aiopioneer discovery of Pioneer AVRs on a network."""
+
+import asyncio
+import ipaddress
+import logging
+
+from collections.abc import AsyncIterator, Iterable
+
+from .const import Zone, DEFAULT_PORT
+from .property_registry import get_property_registry
+
+_LOGGER = logging.getLogger(__name__)
+
+DISCOVERY_PORTS = (DEFAULT_PORT, 23)
+DISCOVERY_TIMEOUT = 1.0
+DISCOVERY_CONCURRENCY = 128
+DISCOVERY_FIELDS = {  ## property name: DiscoveredAVR attribute
+    "model": "model",
+    "mac_addr": "mac_addr",
+    "software_version": "software_version",
+}
+
+
+class DiscoveredAVR:
+    """Pioneer AVR found by discovery."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        model: str = None,
+        mac_addr: str = None,
+        software_version: str = None,
+        info: dict[str, str] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.model = model
+        self.mac_addr = mac_addr
+        self.software_version = software_version
+        self.info = info or {}  ## other system properties reported by AVR
+
+    def __repr__(self) -> str:
+        return (
+            f"DiscoveredAVR(host={self.host}, port={self.port}, "
+            f"model={self.model}, mac_addr={self.mac_addr}, "
+            f"software_version={self.software_version})"
+        )
+
+
+async def _read_response(
+    reader: asyncio.StreamReader, response_prefix: str, timeout: float
+) -> str | None:
+    """Read responses until the expected response or an error is received."""
+
+    async def read_response() -> str | None:
+        while True:
+            response = (await reader.readuntil(b"\n")).decode().strip()
+            if response.startswith(response_prefix):
+                return response
+            if response.startswith("E") or response == "B00":
+                return None
+
+    try:
+        return await asyncio.wait_for(read_response(), timeout=timeout)
+    except TimeoutError:
+        return None
+
+
+async def probe_avr(
+    host: str, port: int = DEFAULT_PORT, timeout: float = DISCOVERY_TIMEOUT
+) -> DiscoveredAVR | None:
+    """Identify a Pioneer AVR at host and port, or return None."""
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout=timeout
+        )
+    except (TimeoutError, OSError):
+        return None
+
+    registry = get_property_registry()
+    commands = [
+        registry.get_command("query_model", Zone.Z1),
+        *registry.get_commands("system_query_", zone=Zone.Z1),
+    ]
+    info = {}
+    try:
+        for command in commands:
+            response_prefix = command.get_avr_response(Zone.Z1)
+            writer.write(command.get_avr_command(Zone.Z1).encode("ASCII") + b"\r")
+            await writer.drain()
+            response = await _read_response(reader, response_prefix, timeout)
+            if response is None:
+                if command.name == "query_model":
+                    return None  ## not a Pioneer AVR
+                continue
+            _, code_map, _ = registry.match_response(response)
+            info[code_map.property_name] = code_map.code_to_value(
+                response[len(response_prefix) :]
+            )
+    except (OSError, EOFError, UnicodeDecodeError):
+        return None
+    except (asyncio.LimitOverrunError, ValueError) as exc:
+        _LOGGER.info("invalid response from %s:%d: %s", host, port, repr(exc))
+        return None
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+    _LOGGER.debug("discovered AVR %s at %s:%d", info.get("model"), host, port)
+    fields = {
+        DISCOVERY_FIELDS[name]: info.pop(name)
+        for name in list(info)
+        if name in DISCOVERY_FIELDS
+    }
+    return DiscoveredAVR(host, port, **fields, info=info)
+
+
+async def discover_avrs(
+    network: str,
+    ports: Iterable[int] = DISCOVERY_PORTS,
+    timeout: float = DISCOVERY_TIMEOUT,
+    concurrency: int = DISCOVERY_CONCURRENCY,
+) -> AsyncIterator[DiscoveredAVR]:
+    """
+    Probe hosts in a network (in CIDR notation) for Pioneer AVRs, yielding
+    each AVR as it responds. Ports are probed in order until an AVR is found
+    on a host. At most concurrency hosts are probed at a time.
+    """
+    hosts = iter(ipaddress.ip_network(network, strict=False).hosts())
+    ports = list(ports)
+    results: asyncio.Queue[DiscoveredAVR | None] = asyncio.Queue()
+
+    async def probe_hosts() -> None:
+        try:
+            for host in hosts:  ## hosts shared by all workers
+                for port in ports:
+                    try:
+                        avr = await probe_avr(str(host), port, timeout=timeout)
+                    except Exception as exc:  # pylint: disable=broad-except
+                        _LOGGER.warning(
+                            "error probing %s:%d: %s", str(host), port, repr(exc)
+                        )
+                        continue
+                    if avr:
+                        results.put_nowait(avr)
+                        break
+        finally:
+            results.put_nowait(None)  ## signal worker completed
+
+    workers = [
+        asyncio.create_task(probe_hosts(), name=f"avr_discovery_{i}")
+        for i in range(max(1, concurrency))
+    ]
+    try:
+        remaining = len(workers)
+        while remaining:
+            if (avr := await results.get()) is None:
+                remaining -= 1
+                continue
+            yield avr
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
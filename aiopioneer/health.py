@@ -0,0 +1,86 @@
+"""aiopioneer connection health monitoring."""
+
+from bisect import bisect_left
+from typing import Any
+
+RTT_BUCKETS = (0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0)  ## seconds
+
+
+class RTTHistogram:
+    """Histogram of request round trip times."""
+
+    def __init__(self, buckets: tuple[float, ...] = RTT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  ## last bucket is overflow
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def __repr__(self) -> str:
+        return f"RTTHistogram(count={self.count}, max={self.max:.3f})"
+
+    def record(self, rtt: float) -> None:
+        """Record a round trip time."""
+        self.counts[bisect_left(self.buckets, rtt)] += 1
+        self.count += 1
+        self.total += rtt
+        self.max = max(self.max, rtt)
+
+    def get_percentile(self, percentile: float) -> float | None:
+        """Get upper bound of the bucket containing a percentile."""
+        if not self.count:
+            return None
+        target = percentile * self.count
+        cumulative = 0
+        for bucket, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return min(bucket, self.max)
+        return self.max
+
+    def get_histogram(self) -> dict[str, int]:
+        """Get count of round trip times for each bucket."""
+        histogram = {
+            f"<={bucket}": count for bucket, count in zip(self.buckets, self.counts)
+        }
+        histogram[f">{self.buckets[-1]}"] = self.counts[-1]
+        return histogram
+
+    def clear(self) -> None:
+        """Clear recorded round trip times."""
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class ConnectionHealth:
+    """AVR connection health probe results."""
+
+    def __init__(self):
+        self.rtt = RTTHistogram()
+        self.last_response_at: float = None  ## monotonic time
+        self.missed_probes = 0  ## consecutive missed probes
+        self.probes = 0
+        self.probe_failures = 0
+        self.dead_links = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"ConnectionHealth(probes={self.probes}, "
+            f"missed_probes={self.missed_probes}, dead_links={self.dead_links})"
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get connection health statistics."""
+        return {
+            "probes": self.probes,
+            "probe_failures": self.probe_failures,
+            "missed_probes": self.missed_probes,
+            "dead_links": self.dead_links,
+            "rtt_mean": self.rtt.total / self.rtt.count if self.rtt.count else None,
+            "rtt_p50": self.rtt.get_percentile(0.5),
+            "rtt_p95": self.rtt.get_percentile(0.95),
+            "rtt_max": self.rtt.max if self.rtt.count else None,
+            "rtt_histogram": self.rtt.get_histogram(),
+        }
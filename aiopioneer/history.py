@@ -0,0 +1,206 @@
+"""aiopioneer property change history."""
+
+import time
+
+from array import array
+from typing import Any
+
+from .const import Zone
+from .params import (
+    AVRParams,
+    PARAM_PROPERTY_HISTORY_SIZE,
+    PARAM_PROPERTY_HISTORY_RETENTION,
+    PARAM_PROPERTY_HISTORY_MAX_ENTRIES,
+)
+
+
+class PropertyHistoryBuffer:
+    """Ring buffer of property change timestamps and values."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._timestamps = array("d", bytes(8 * size))
+        self._values: list[Any] = [None] * size
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"PropertyHistoryBuffer(size={self.size}, count={self._count})"
+
+    def append(self, timestamp: float, value: Any) -> None:
+        """Add a change, replacing the oldest change if the buffer is full."""
+        self._timestamps[self._next] = timestamp
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self.size
+        self._count = min(self._count + 1, self.size)
+
+    def get_oldest_timestamp(self) -> float | None:
+        """Get timestamp of the oldest change."""
+        if not self._count:
+            return None
+        return self._timestamps[(self._next - self._count) % self.size]
+
+    def pop_oldest(self) -> None:
+        """Discard the oldest change."""
+        if self._count:
+            self._values[(self._next - self._count) % self.size] = None
+            self._count -= 1
+
+    def get_entries(
+        self, start: float = None, end: float = None, last: int = None
+    ) -> list[tuple[float, Any]]:
+        """Get (timestamp, value) changes, oldest first."""
+        first = self._next - self._count
+        entries = [
+            (self._timestamps[i % self.size], self._values[i % self.size])
+            for i in range(first, self._next)
+        ]
+        if start is not None or end is not None:
+            entries = [
+                (t, v)
+                for t, v in entries
+                if (start is None or t >= start) and (end is None or t <= end)
+            ]
+        if last is not None:
+            entries = entries[-last:] if last > 0 else []
+        return entries
+
+    def resize(self, size: int) -> None:
+        """Resize buffer, keeping the most recent changes."""
+        entries = self.get_entries(last=size)
+        self.size = size
+        self._timestamps = array("d", bytes(8 * size))
+        self._values = [None] * size
+        self._next = self._count = 0
+        for timestamp, value in entries:
+            self.append(timestamp, value)
+
+
+class PropertyHistory:
+    """Bounded history of committed property changes."""
+
+    def __init__(self, params: AVRParams):
+        self._buffers: dict[tuple[str, Zone, str], PropertyHistoryBuffer] = {}
+        self._size = 0
+        self._retention: dict[str, int] = {}
+        self._max_entries = 0
+        self._entries = 0  ## changes retained across all buffers
+        self.enabled = False
+
+        def update_params(params: AVRParams) -> None:
+            self._size = params.get_param(PARAM_PROPERTY_HISTORY_SIZE) or 0
+            self._retention = params.get_param(PARAM_PROPERTY_HISTORY_RETENTION) or {}
+            max_entries = params.get_param(PARAM_PROPERTY_HISTORY_MAX_ENTRIES)
+            self._max_entries = max_entries or 0
+            self.enabled = self._size > 0 or any(
+                size > 0 for size in self._retention.values()
+            )
+            if not self.enabled:
+                self.clear()
+                return
+
+            ## Resize or drop existing buffers for new retention
+            for key, buffer in list(self._buffers.items()):
+                base_property, _, property_name = key
+                size = self.get_retention(base_property, property_name)
+                if size <= 0:
+                    del self._buffers[key]
+                elif buffer.size != size:
+                    buffer.resize(size)
+            self._entries = sum(len(buffer) for buffer in self._buffers.values())
+            self._trim()
+
+        update_params(params)
+        params.register_update_callback(
+            update_params,
+            params=[
+                PARAM_PROPERTY_HISTORY_SIZE,
+                PARAM_PROPERTY_HISTORY_RETENTION,
+                PARAM_PROPERTY_HISTORY_MAX_ENTRIES,
+            ],
+        )
+
+    def get_retention(self, base_property: str, property_name: str = None) -> int:
+        """Get maximum number of changes to retain for a property."""
+        if property_name is not None:
+            key = f"{base_property}.{property_name}"
+            if (size := self._retention.get(key)) is not None:
+                return size
+        if (size := self._retention.get(base_property)) is not None:
+            return size
+        return self._size
+
+    def record(
+        self,
+        base_property: str,
+        zone: Zone,
+        property_name: str,
+        value: Any,
+        timestamp: float = None,
+    ) -> None:
+        """Record a property change if history is enabled for the property."""
+        if not self.enabled:
+            return
+        key = (base_property, Zone.ALL if zone is None else zone, property_name)
+        size = self.get_retention(base_property, property_name)
+        buffer = self._buffers.get(key)
+        if size <= 0:
+            if buffer is not None:
+                self._entries -= len(buffer)
+                del self._buffers[key]
+            return
+        if buffer is None:
+            buffer = self._buffers[key] = PropertyHistoryBuffer(size)
+        elif buffer.size != size:
+            self._entries -= len(buffer)
+            buffer.resize(size)
+            self._entries += len(buffer)
+        count = len(buffer)
+        buffer.append(time.time() if timestamp is None else timestamp, value)
+        self._entries += len(buffer) - count
+        self._trim()
+
+    def _trim(self) -> None:
+        """Discard the oldest changes across all properties over max entries."""
+        if not self._max_entries:
+            return
+        while self._entries > self._max_entries:
+            key, buffer = min(
+                ((k, b) for k, b in self._buffers.items() if len(b)),
+                key=lambda item: item[1].get_oldest_timestamp(),
+            )
+            buffer.pop_oldest()
+            self._entries -= 1
+            if not len(buffer):
+                del self._buffers[key]
+
+    def get_history(
+        self,
+        base_property: str,
+        zone: Zone = Zone.ALL,
+        property_name: str = None,
+        start: float = None,
+        end: float = None,
+        last: int = None,
+    ) -> list[tuple[float, Any]]:
+        """
+        Get (timestamp, value) changes for a property, oldest first. Changes
+        are filtered to the time range start to end and/or the last N changes
+        if specified.
+        """
+        key = (base_property, Zone.ALL if zone is None else zone, property_name)
+        if (buffer := self._buffers.get(key)) is None:
+            return []
+        return buffer.get_entries(start=start, end=end, last=last)
+
+    def get_properties(self) -> list[tuple[str, Zone, str]]:
+        """Get (base_property, zone, property_name) of properties with history."""
+        return list(self._buffers)
+
+    def clear(self) -> None:
+        """Clear all property history."""
+        self._buffers = {}
+        self._entries = 0
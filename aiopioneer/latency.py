@@ -0,0 +1,128 @@
+"""aiopioneer adaptive response timeouts."""
+
+import math
+
+from collections import deque
+from typing import Any
+
+from .params import (
+    AVRParams,
+    PARAM_ADAPTIVE_TIMEOUT,
+    PARAM_RESPONSE_TIMEOUT_MIN,
+    PARAM_RESPONSE_TIMEOUT_MAX,
+)
+
+LATENCY_SAMPLES = 32  ## recent samples kept for percentile
+LATENCY_MIN_SAMPLES = 4  ## samples required before adapting timeout
+LATENCY_EWMA_ALPHA = 0.2
+LATENCY_PERCENTILE = 0.95
+
+
+class ResponseLatency:
+    """Observed response latency for a response type."""
+
+    def __init__(self):
+        self.samples: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.mean = 0.0
+        self.variance = 0.0
+        self.timeouts = 0  ## consecutive timeouts
+        self.errors = 0  ## error responses, not sampled
+
+    def __repr__(self) -> str:
+        return (
+            f"ResponseLatency(mean={self.mean:.3f}, "
+            f"deviation={math.sqrt(self.variance):.3f}, "
+            f"samples={len(self.samples)}, timeouts={self.timeouts}, "
+            f"errors={self.errors})"
+        )
+
+    def record(self, latency: float) -> None:
+        """Update exponentially weighted mean and variance with a sample."""
+        if self.timeouts:
+            ## Response may be a late reply to the request that timed out
+            self.timeouts = 0
+            return
+        if not self.samples:
+            self.mean = latency
+            self.variance = 0.0
+        else:
+            delta = latency - self.mean
+            self.mean += LATENCY_EWMA_ALPHA * delta
+            self.variance = (1 - LATENCY_EWMA_ALPHA) * (
+                self.variance + LATENCY_EWMA_ALPHA * delta * delta
+            )
+        self.samples.append(latency)
+
+    def get_percentile(self, percentile: float = LATENCY_PERCENTILE) -> float:
+        """Get percentile of recent samples."""
+        samples = sorted(self.samples)
+        return samples[min(len(samples) - 1, int(percentile * len(samples)))]
+
+
+class CommandLatency:
+    """Response timeouts derived from observed latency per response type."""
+
+    def __init__(self, params: AVRParams, timeout: float):
+        self._params = params
+        self.timeout = timeout  ## default timeout
+        self._latency: dict[str, ResponseLatency] = {}
+
+    def get_timeout(self, response_prefix: str) -> float:
+        """Get response timeout for a response type."""
+        if not self._params.get_param(PARAM_ADAPTIVE_TIMEOUT):
+            return self.timeout
+        timeout_min = self._params.get_param(PARAM_RESPONSE_TIMEOUT_MIN)
+        timeout_max = max(
+            self.timeout, self._params.get_param(PARAM_RESPONSE_TIMEOUT_MAX)
+        )
+        if (latency := self._latency.get(response_prefix)) is None:
+            return self.timeout
+        timeout = self.timeout
+        if len(latency.samples) >= LATENCY_MIN_SAMPLES:
+            timeout = max(
+                latency.mean + 4 * math.sqrt(latency.variance),
+                2 * latency.get_percentile(),
+                timeout_min,
+            )
+        ## Back off after timeouts, in case the response is slow
+        timeout *= 2**latency.timeouts
+        return min(timeout, timeout_max)
+
+    def record(self, response_prefix: str, latency: float) -> None:
+        """Record response latency for a response type."""
+        if (response_latency := self._latency.get(response_prefix)) is None:
+            response_latency = self._latency[response_prefix] = ResponseLatency()
+        response_latency.record(latency)
+
+    def record_error(self, response_prefix: str) -> None:
+        """Record an error response for a response type."""
+        if (response_latency := self._latency.get(response_prefix)) is None:
+            response_latency = self._latency[response_prefix] = ResponseLatency()
+        response_latency.errors += 1
+
+    def record_timeout(self, response_prefix: str) -> None:
+        """Record a response timeout for a response type."""
+        if (response_latency := self._latency.get(response_prefix)) is None:
+            response_latency = self._latency[response_prefix] = ResponseLatency()
+        response_latency.timeouts += 1
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get observed latency and current timeout for each response type."""
+        return {
+            response_prefix: {
+                "mean": latency.mean,
+                "deviation": math.sqrt(latency.variance),
+                "percentile": (
+                    latency.get_percentile() if latency.samples else None
+                ),
+                "samples": len(latency.samples),
+                "timeouts": latency.timeouts,
+                "errors": latency.errors,
+                "timeout": self.get_timeout(response_prefix),
+            }
+            for response_prefix, latency in self._latency.items()
+        }
+
+    def clear(self) -> None:
+        """Clear observed latency."""
+        self._latency = {}
@@ -2,15 +2,15 @@
 
 # pylint: disable=too-many-lines
 
-import copy
 import logging
 import re
 
-from collections import OrderedDict
+from collections import ChainMap, OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, Callable, Self
 
 from .const import Zone
-from .util import merge
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,10 +21,20 @@ PARAM_MAX_SOURCE_ID = "max_source_id"
 PARAM_MAX_VOLUME = "max_volume"
 PARAM_MAX_VOLUME_ZONEX = "max_volume_zonex"
 PARAM_POWER_ON_VOLUME_BOUNCE = "power_on_volume_bounce"
+PARAM_POWER_ON_READY_TIMEOUT = "power_on_ready_timeout"
 PARAM_VOLUME_STEP_ONLY = "volume_step_only"
+PARAM_VOLUME_STEP_WINDOW = "volume_step_window"
 PARAM_IGNORE_VOLUME_CHECK = "ignore_volume_check"
 PARAM_ALWAYS_POLL = "always_poll"
 PARAM_RETRY_COUNT = "retry_count"
+PARAM_ADAPTIVE_TIMEOUT = "adaptive_timeout"
+PARAM_RESPONSE_TIMEOUT_MIN = "response_timeout_min"
+PARAM_RESPONSE_TIMEOUT_MAX = "response_timeout_max"
+PARAM_RETRY_POLICY = "retry_policy"
+PARAM_RETRY_BUDGET = "retry_budget"
+PARAM_RETRY_BUDGET_WINDOW = "retry_budget_window"
+PARAM_HEALTH_CHECK_IDLE_TIME = "health_check_idle_time"
+PARAM_HEALTH_CHECK_MISSED_PROBES = "health_check_missed_probes"
 PARAM_DEBUG_LISTENER = "debug_listener"
 PARAM_DEBUG_UPDATER = "debug_updater"
 PARAM_DEBUG_COMMAND = "debug_command"
@@ -75,6 +85,27 @@ PARAM_DISABLED_LISTENING_MODES = "disabled_amp_listening_modes"
 ## tuner input source is used
 PARAM_TUNER_AM_FREQ_STEP = "am_frequency_step"
 
+## Tuner step in kHz for FM frequencies, used when stepping the frequency on
+## AVRs that do not support direct frequency entry
+PARAM_TUNER_FM_FREQ_STEP = "fm_frequency_step"
+
+## Maximum number of tuner frequency steps sent without waiting for the AVR
+## to report the frequency
+PARAM_TUNER_STEP_WINDOW = "tuner_step_window"
+
+## Number of changes to retain in history for each property. History is
+## disabled if 0. Retention can be overridden for a base property or
+## base_property.property_name
+PARAM_PROPERTY_HISTORY_SIZE = "property_history_size"
+PARAM_PROPERTY_HISTORY_RETENTION = "property_history_retention"
+PARAM_PROPERTY_HISTORY_MAX_ENTRIES = "property_history_max_entries"
+
+## Number of consecutive unsupported command (E03/E04) responses before a
+## query command is skipped on refresh, and interval in seconds after which a
+## skipped command is re-probed. Learning is disabled if failures is 0
+PARAM_UNSUPPORTED_COMMAND_FAILURES = "unsupported_command_failures"
+PARAM_UNSUPPORTED_COMMAND_REPROBE_INTERVAL = "unsupported_command_reprobe_interval"
+
 DEFAULT_ENABLED_FUNCTIONS = [
     "basic",
     "audio",
@@ -106,7 +137,7 @@ DEFAULT_INITIAL_REFRESH_FUNCTIONS = [
     "display",
 ]
 
-PARAM_DEFAULTS = {
+PARAM_DEFAULTS: Mapping[str, Any] = {
     PARAM_MODEL: None,
     PARAM_IGNORED_ZONES: [],
     PARAM_COMMAND_DELAY: 0.1,
@@ -114,10 +145,23 @@ PARAM_DEFAULTS = {
     PARAM_MAX_VOLUME: 185,
     PARAM_MAX_VOLUME_ZONEX: 81,
     PARAM_POWER_ON_VOLUME_BOUNCE: False,
+    PARAM_POWER_ON_READY_TIMEOUT: 10.0,
     PARAM_VOLUME_STEP_ONLY: False,
+    PARAM_VOLUME_STEP_WINDOW: 4,
     PARAM_IGNORE_VOLUME_CHECK: True,
     PARAM_ALWAYS_POLL: False,
     PARAM_RETRY_COUNT: 4,
+    PARAM_ADAPTIVE_TIMEOUT: True,
+    PARAM_RESPONSE_TIMEOUT_MIN: 1.5,
+    PARAM_RESPONSE_TIMEOUT_MAX: 8.0,
+    PARAM_RETRY_POLICY: {
+        "E02": {"delay": 1.0, "backoff": 1.5, "max_delay": 4.0, "jitter": 0.2},
+        "B00": {"delay": 0.5, "backoff": 2.0, "max_delay": 4.0, "jitter": 0.2},
+    },
+    PARAM_RETRY_BUDGET: 20,
+    PARAM_RETRY_BUDGET_WINDOW: 60.0,
+    PARAM_HEALTH_CHECK_IDLE_TIME: 60.0,
+    PARAM_HEALTH_CHECK_MISSED_PROBES: 3,
     PARAM_DEBUG_LISTENER: False,
     PARAM_DEBUG_UPDATER: False,
     PARAM_DEBUG_COMMAND: False,
@@ -233,8 +277,15 @@ PARAM_DEFAULTS = {
     PARAM_DISABLED_LISTENING_MODES: [],
     PARAM_ENABLED_LISTENING_MODES: [],
     PARAM_VIDEO_RESOLUTION_MODES: ["0", "1", "3", "4", "5", "6", "7", "8", "9"],
+    PARAM_PROPERTY_HISTORY_SIZE: 0,
+    PARAM_PROPERTY_HISTORY_RETENTION: {"amp.display": 0},
+    PARAM_PROPERTY_HISTORY_MAX_ENTRIES: 10000,
+    PARAM_UNSUPPORTED_COMMAND_FAILURES: 2,
+    PARAM_UNSUPPORTED_COMMAND_REPROBE_INTERVAL: 86400,
     PARAM_MHL_SOURCE: None,
     PARAM_TUNER_AM_FREQ_STEP: None,
+    PARAM_TUNER_FM_FREQ_STEP: 50,
+    PARAM_TUNER_STEP_WINDOW: 8,
 }
 
 PARAMS_ALL = PARAM_DEFAULTS.keys()
@@ -588,6 +639,36 @@ PARAM_MODEL_DEFAULTS = OrderedDict(
 )
 
 
+def _freeze_param(value: Any, memo: dict[int, Any] = None) -> Any:
+    """Return an immutable copy of a parameter value."""
+    if memo is not None and (frozen := memo.get(id(value))) is not None:
+        return frozen
+    if isinstance(value, Mapping):
+        frozen = MappingProxyType(
+            {k: _freeze_param(v, memo) for k, v in value.items()}
+        )
+    elif isinstance(value, (list, tuple)):
+        frozen = tuple(_freeze_param(v, memo) for v in value)
+    elif isinstance(value, (set, frozenset)):
+        frozen = frozenset(value)
+    else:
+        return value
+    if memo is not None:
+        memo[id(value)] = frozen
+    return frozen
+
+
+## Default and model parameter layers are frozen once and shared between all
+## AVRParams instances. Values shared between models are frozen only once
+_frozen_params: dict[int, Any] = {}
+PARAM_DEFAULTS = _freeze_param(PARAM_DEFAULTS, _frozen_params)
+PARAM_MODEL_DEFAULTS = OrderedDict(
+    (model_regex, _freeze_param(params, _frozen_params))
+    for model_regex, params in PARAM_MODEL_DEFAULTS.items()
+)
+del _frozen_params
+
+
 class AVRParams:
     """Pioneer AVR params class."""
 
@@ -596,68 +677,117 @@ class AVRParams:
 
         if params is None:
             params = {}
+        ## Parameter layers in increasing priority. Layer values are frozen,
+        ## PARAM_DEFAULTS and PARAM_MODEL_DEFAULTS values are shared between
+        ## instances, and only parameters that override the defaults are
+        ## resolved per instance
         self._default_params = PARAM_DEFAULTS
+        self._model_params: dict[str, Any] = {}
         self._user_params: dict[str, Any] = {}
         self._params: dict[str, Any] = {}
-        self._update_callbacks: list[Callable[[Self], None]] = []
+        self._update_callbacks: list[
+            tuple[Callable[[Self], None], frozenset[str] | None]
+        ] = []
         if model := params.get(PARAM_MODEL):
             self.set_default_params_model(model)
         self.set_user_params(params)
 
     ## Parameter management functions
-    def register_update_callback(self, callback: Callable[[Self], None]) -> None:
-        """Set parameter update callback."""
-        self._update_callbacks.append(callback)
-
-    def _update_params(self) -> None:
-        """Set current parameters."""
-        self._params = {}
-        merge(self._params, self._default_params)
-        merge(self._params, self._user_params, force_overwrite=True)
-        for callback in self._update_callbacks:
-            callback(self)
+    def register_update_callback(
+        self, callback: Callable[[Self], None], params: list[str] = None
+    ) -> None:
+        """
+        Set parameter update callback. If params is specified, the callback
+        is only called when one of those parameters changes.
+        """
+        self._update_callbacks.append(
+            (callback, frozenset(params) if params is not None else None)
+        )
+
+    def _resolve_param(self, param: str) -> tuple[bool, Any]:
+        """Get current value of a parameter from the parameter layers."""
+        found = False
+        value = None
+        for layer in (self._default_params, self._model_params, self._user_params):
+            if param not in layer:
+                continue
+            if layer[param] is None and isinstance(value, Mapping):
+                continue  ## None does not override a dict parameter
+            found = True
+            value = layer[param]
+        return found, value
+
+    def _update_params(self, params: set[str]) -> None:
+        """Update current value of changed parameters and call callbacks."""
+        changed_params = set()
+        params_all = self.params_all
+        for param in params:
+            current_found = param in params_all
+            current_value = params_all.get(param)
+            found, value = self._resolve_param(param)
+            if found and (
+                param not in self._default_params
+                or self._default_params[param] != value
+            ):
+                self._params[param] = value
+            else:
+                self._params.pop(param, None)
+            if found != current_found or value != current_value:
+                changed_params.add(param)
+        if not changed_params:
+            return
+        for callback, callback_params in self._update_callbacks:
+            if callback_params is None or not callback_params.isdisjoint(
+                changed_params
+            ):
+                callback(self)
 
     def set_default_params_model(self, model: str) -> None:
         """Set default parameters based on device model."""
-        self._default_params = PARAM_DEFAULTS
+        model_params = {}
         if model is not None and model != "unknown":
-            for model_regex, model_params in PARAM_MODEL_DEFAULTS.items():
+            for model_regex, params in PARAM_MODEL_DEFAULTS.items():
                 if re.search(model_regex, model):
                     _LOGGER.info(
                         "applying default parameters for model %s (%s)",
                         model,
                         model_regex,
                     )
-                    merge(self._default_params, model_params, force_overwrite=True)
-        self._update_params()
+                    model_params |= params
+        changed_params = set(self._model_params) | set(model_params)
+        self._model_params = model_params
+        self._update_params(changed_params)
 
-    def set_user_params(self, params: dict[str, Any] = None) -> None:
+    def set_user_params(self, params: Mapping[str, Any] = None) -> None:
         """Set user parameters and update current parameters."""
         _LOGGER.debug(">> PioneerAVR.set_user_params(%s)", params)
-        self._user_params = copy.deepcopy(params) if params is not None else {}
-        self._update_params()
+        user_params = dict(_freeze_param(params)) if params is not None else {}
+        changed_params = set(self._user_params) | set(user_params)
+        self._user_params = user_params
+        self._update_params(changed_params)
 
     def set_user_param(self, param: str, value: Any) -> None:
         """Set a user parameter."""
-        self._user_params[param] = value
-        self._update_params()
+        self._user_params[param] = _freeze_param(value)
+        self._update_params({param})
 
     @property
-    def default_params(self) -> dict[str, Any]:
-        """Get a copy of current default parameters."""
-        return copy.deepcopy(self._default_params)
+    def default_params(self) -> Mapping[str, Any]:
+        """Get a read-only view of default parameters, including model parameters."""
+        return MappingProxyType(ChainMap(self._model_params, self._default_params))
 
     @property
-    def user_params(self) -> dict[str, Any]:
-        """Get a copy of user parameters."""
-        return copy.deepcopy(self._user_params)
+    def user_params(self) -> Mapping[str, Any]:
+        """Get a read-only view of user parameters."""
+        return MappingProxyType(self._user_params)
 
     @property
-    def params_all(self) -> dict[str, Any]:
-        """Get a copy of all current parameters."""
-        ## NOTE: can't use MappingProxyTypeType because of mutable dict values
-        return copy.deepcopy(self._params)
+    def params_all(self) -> Mapping[str, Any]:
+        """Get a read-only view of all current parameters."""
+        return MappingProxyType(ChainMap(self._params, self._default_params))
 
     def get_param(self, param_name: str, default: Any = None) -> Any:
         """Get the value of the specified parameter."""
-        return self._params.get(param_name, default)
+        if param_name in self._params:
+            return self._params[param_name]
+        return self._default_params.get(param_name, default)
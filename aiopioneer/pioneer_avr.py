@@ -8,12 +8,14 @@ import time
 import traceback
 
 from collections.abc import Callable
+from typing import Any
 
 from .command_queue import CommandItem
 from .connection import AVRConnection
 from .const import (
     Zone,
     TunerBand,
+    VolumeRampCurve,
     VERSION,
     DEFAULT_PORT,
     DEFAULT_TIMEOUT,
@@ -22,14 +24,12 @@ from .const import (
     MEDIA_CONTROL_COMMANDS,
 )
 from .decode import process_raw_response
-from .decoders.amp import Volume
-from .decoders.audio import SpeakerChannel
-from .decoders.tuner import TunerAMFrequency, TunerFMFrequency
 from .exceptions import (
     AVRError,
     AVRResponseTimeoutError,
     AVRCommandError,
     AVRCommandArgumentError,
+    AVRCommandResponseError,
     AVRUnknownLocalCommandError,
     AVRTunerUnavailableError,
     AVRConnectProtocolError,
@@ -44,6 +44,11 @@ from .params import (
     PARAM_MAX_VOLUME,
     PARAM_MAX_VOLUME_ZONEX,
     PARAM_VOLUME_STEP_ONLY,
+    PARAM_COMMAND_DELAY,
+    PARAM_POWER_ON_READY_TIMEOUT,
+    PARAM_VOLUME_STEP_WINDOW,
+    PARAM_TUNER_FM_FREQ_STEP,
+    PARAM_TUNER_STEP_WINDOW,
     PARAM_IGNORE_VOLUME_CHECK,
     PARAM_RETRY_COUNT,
     PARAM_DEBUG_UPDATER,
@@ -54,8 +59,10 @@ from .params import (
     PARAM_DISABLE_AUTO_QUERY,
 )
 from .properties import AVRProperties
-from .property_registry import PROPERTY_REGISTRY
+from .property_registry import get_property_registry
+from .transport import AVRTransport
 from .util import cancel_task
+from .volume_ramp import VolumeRamp
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,6 +77,7 @@ class PioneerAVR(AVRConnection):
         timeout: float = DEFAULT_TIMEOUT,
         scan_interval: float = DEFAULT_SCAN_INTERVAL,
         params: dict[str, str] = None,
+        transport: AVRTransport = None,
     ):
         """Initialise the Pioneer AVR interface."""
         _LOGGER.info("Starting aiopioneer %s", VERSION)
@@ -84,12 +92,16 @@ class PioneerAVR(AVRConnection):
             port=port,
             timeout=timeout,
             scan_interval=scan_interval,
+            transport=transport,
         )
 
         ## Internal state
         self._update_lock = asyncio.Lock()
         self._updater_task = None
         self._zone_callback: dict[Zone, Callable[[None], None]] = {}
+        self._properties_updated = asyncio.Event()
+        self._volume_ramps: dict[Zone, VolumeRamp] = {}
+        self._volume_ramp_tasks: dict[Zone, asyncio.Task] = {}
 
     ## Connection/disconnection
     async def on_connect(self) -> None:
@@ -109,6 +121,8 @@ class PioneerAVR(AVRConnection):
 
     async def on_disconnect(self) -> None:
         """Stop AVR tasks on disconnection."""
+        for zone in list(self._volume_ramps):
+            await self.cancel_volume_ramp(zone)
         self.properties.reset()
         self._call_zone_callbacks()
         await self.properties.command_queue.cancel(ignore_exceptions=True)
@@ -145,8 +159,10 @@ class PioneerAVR(AVRConnection):
                 if zone not in ignored_zones:
                     _LOGGER.info("%s discovered", zone.full_name)
                     if zone not in self.properties.zones:
-                        self.properties.zones.add(zone)
-                        self.properties.max_volume[zone] = max_volume
+                        self.properties.set_property(
+                            "zones", self.properties.zones | {zone}
+                        )
+                        self.properties.set_property("max_volume", max_volume, zone)
                     return True
                 return False
             return None
@@ -162,9 +178,9 @@ class PioneerAVR(AVRConnection):
     async def build_source_dict(self) -> None:
         """Generate source id<->name translation tables."""
         timeouts = 0
-        self.properties.query_sources = True
-        self.properties.source_name_to_id = {}
-        self.properties.source_id_to_name = {}
+        self.properties.set_property("query_sources", True)
+        self.properties.set_property("source_name_to_id", {})
+        self.properties.set_property("source_id_to_name", {})
 
         command_queue = self.properties.command_queue
         await command_queue.wait()  ## wait for command queue to complete
@@ -193,8 +209,9 @@ class PioneerAVR(AVRConnection):
             return device_model
         _LOGGER.info("querying device model")
         if res := await self.send_command("query_model", ignore_error=True):
-            ## Update default params for this model
+            ## Update default params and learned capabilities for this model
             self.params.set_default_params_model(self.properties.amp.get("model"))
+            self.properties.capabilities.set_model(self.properties.amp.get("model"))
             return True
         elif res is False:
             _LOGGER.warning("AVR device model unavailable, no model parameters set")
@@ -203,7 +220,7 @@ class PioneerAVR(AVRConnection):
     async def query_device_info(self) -> None:
         """Query device information from Pioneer AVR."""
         _LOGGER.info("querying device information")
-        for command in PROPERTY_REGISTRY.get_commands("system_query_"):
+        for command in get_property_registry().get_commands("system_query_"):
             await self.send_command(command.name, ignore_error=True)
 
         ## It is possible to query via HTML page if all info is not available
@@ -234,8 +251,7 @@ class PioneerAVR(AVRConnection):
     def _call_zone_callbacks(self, zones: set[Zone] = None) -> None:
         """Call callbacks to signal updated zone(s)."""
         if zones is None:
-            zones = self.properties.zones.copy()
-            zones.add(Zone.ALL)
+            zones = self.properties.zones | {Zone.ALL}
         for zone in zones:
             if zone in self._zone_callback:
                 if callback := self._zone_callback[zone]:
@@ -246,6 +262,7 @@ class PioneerAVR(AVRConnection):
         """Decode response and commit to properties."""
         updated_zones = process_raw_response(response_raw, self.params, self.properties)
         if updated_zones:  ## Call zone callbacks for updated zones
+            self._properties_updated.set()
             self._call_zone_callbacks(updated_zones)
 
     ## AVR Updater
@@ -342,17 +359,26 @@ class PioneerAVR(AVRConnection):
                     self.params.get_param(PARAM_INITIAL_REFRESH_FUNCTIONS)
                 )
 
-            ## Add query commands for each domain from property registry
+            ## Add query commands for each domain from property registry,
+            ## skipping commands learned to be unsupported
             command_queue = self.properties.command_queue
+            capabilities = self.properties.capabilities
             for func in enabled_functions:
-                for command in PROPERTY_REGISTRY.get_commands(
+                for command in get_property_registry().get_commands(
                     prefix=f"query_{func}", zone=zone
                 ):
                     if command.name == "query_channel_level":
+                        # pylint: disable=import-outside-toplevel
+                        from .decoders.audio import SpeakerChannel
+
                         channels = SpeakerChannel.CHANNELS_ALL
                         if zone in self.properties.zones_initial_refresh:
                             channels = self.properties.channel_level.get(zone, {})
                         for channel in channels:
+                            if capabilities.is_unsupported(
+                                command.name, zone, [channel]
+                            ):
+                                continue
                             command_queue.enqueue(
                                 CommandItem(
                                     command.name,
@@ -364,12 +390,14 @@ class PioneerAVR(AVRConnection):
                                 queue_id=2,
                             )
                     else:
-                        command_queue.enqueue(
-                            CommandItem(
-                                command.name, ignore_error=True, rate_limit=False
-                            ),
-                            queue_id=2,
+                        command_item = CommandItem(
+                            command.name, ignore_error=True, rate_limit=False
                         )
+                        if capabilities.is_unsupported(
+                            command_item.command, command_item.zone
+                        ):
+                            continue
+                        command_queue.enqueue(command_item, queue_id=2)
             command_queue.enqueue(CommandItem("_end_refresh", zone, queue_id=2))
         finally:
             if not command_queue:
@@ -442,7 +470,7 @@ class PioneerAVR(AVRConnection):
             )
 
         try:
-            command_item = PROPERTY_REGISTRY.get_command(command, zone)
+            command_item = get_property_registry().get_command(command, zone)
             avr_command = command_item.get_avr_command(zone)
             arg_code_maps = command_item.avr_args
             if arg_code_maps and prefix is None and suffix is None:
@@ -486,12 +514,21 @@ class PioneerAVR(AVRConnection):
                 retry_count = self.params.get_param(PARAM_RETRY_COUNT)
 
             ## Send raw command, then wait for response
-            response = await self.send_raw_request(
-                command=raw_command,
-                response_prefix=response_prefix,
-                rate_limit=rate_limit,
-                retry_count=retry_count,
-            )
+            try:
+                response = await self.send_raw_request(
+                    command=raw_command,
+                    response_prefix=response_prefix,
+                    rate_limit=rate_limit,
+                    retry_count=retry_count,
+                )
+            except AVRCommandResponseError as exc:
+                if command.startswith("query_"):
+                    self._record_unsupported(command, zone, exc, command_args)
+                raise
+            if command.startswith("query_"):
+                self.properties.capabilities.record_success(
+                    command, zone, command_args
+                )
             if debug_command:
                 _LOGGER.debug(
                     "send_command %s received response: %s", command, response
@@ -522,6 +559,20 @@ class PioneerAVR(AVRConnection):
             if ignore_error is None:
                 raise exc
 
+    def _record_unsupported(
+        self,
+        command: str,
+        zone: Zone,
+        exc: AVRCommandResponseError,
+        args: list | tuple = None,
+    ) -> None:
+        """Record an unsupported command response while the connection is healthy."""
+        if exc.response not in ["E03", "E04"]:
+            return
+        if not self.available or self.health.missed_probes:
+            return  ## connection not healthy, do not learn capabilities
+        self.properties.capabilities.record_failure(command, zone, args)
+
     async def _execute_local_command(self, command: str, args: list) -> None:
         """Execute local command."""
 
@@ -538,7 +589,8 @@ class PioneerAVR(AVRConnection):
                 check_args(command, args, 1)
                 await self._refresh_zone(zone=Zone(args[0]))
             case "_delayed_refresh_zone":
-                await asyncio.sleep(2.5)  ## TODO: parameterise
+                check_args(command, args, 1)
+                await self._wait_for_zone_ready(zone=Zone(args[0]))
                 await self._refresh_zone(zone=Zone(args[0]))
             case "_end_refresh":
                 check_args(command, args, 1)
@@ -548,14 +600,20 @@ class PioneerAVR(AVRConnection):
                     if zone is Zone.Z1:
                         await self.query_device_info()
                     _LOGGER.info("completed initial refresh for %s", zone.full_name)
-                    self.properties.zones_initial_refresh.add(zone)
+                    self.properties.set_property(
+                        "zones_initial_refresh",
+                        self.properties.zones_initial_refresh | {zone},
+                    )
                 self._call_zone_callbacks(zones=set([zone]))
                 _LOGGER.debug(">> refresh zone %s completed", zone.full_name)
             case "_delayed_query_basic":
                 check_args(command, args, 1)
                 if self.params.get_param(PARAM_DISABLE_AUTO_QUERY):
                     return
-                await asyncio.sleep(args[0])  ## TODO: parameterise
+                if isinstance(args[0], Zone):  ## zone powered on
+                    await self._wait_for_zone_ready(zone=args[0])
+                else:
+                    await asyncio.sleep(args[0])
                 for cmd in [
                     "query_listening_mode",
                     "query_basic_audio_information",
@@ -567,12 +625,57 @@ class PioneerAVR(AVRConnection):
             case "_calculate_am_frequency_step":
                 await asyncio.sleep(2.5)  ## TODO: parameterise
                 await self._calculate_am_frequency_step()
+            case "_ramp_volume":
+                check_args(command, args, 2)
+                await self._ramp_volume_step(ramp=args[0], final_step=args[1])
             case "_sleep":
                 check_args(command, args, 1)
                 await asyncio.sleep(args[0])
             case _:
                 raise AVRUnknownLocalCommandError(command=command)
 
+    async def _wait_for_zone_ready(self, zone: Zone) -> bool:
+        """
+        Wait for zone to respond to queries after power on. Probe the zone
+        volume (or power for zones without volume) with increasing delays
+        until the AVR responds with other than an unavailable or busy error,
+        re-probing early on any AVR response.
+        """
+        ready_timeout = self.params.get_param(PARAM_POWER_ON_READY_TIMEOUT)
+        probe_command = "query_volume"
+        if zone is Zone.HDZ or zone not in self.properties.volume:
+            probe_command = "query_power"  ## zone may not report volume
+        start_time = time.monotonic()
+        delay = 0.1
+        while True:
+            try:
+                await self.send_command(probe_command, zone=zone, retry_on_fail=False)
+                break
+            except AVRCommandResponseError as exc:
+                if exc.response not in ["E02", "B00"]:
+                    break  ## AVR is responding
+            except AVRResponseTimeoutError:
+                pass
+            elapsed = time.monotonic() - start_time
+            if elapsed >= ready_timeout:
+                _LOGGER.warning(
+                    "%s not ready after %.1fs, continuing", zone.full_name, elapsed
+                )
+                return False
+            self._properties_updated.clear()
+            try:
+                await asyncio.wait_for(
+                    self._properties_updated.wait(),
+                    timeout=min(delay, ready_timeout - elapsed),
+                )
+            except TimeoutError:
+                pass
+            delay = min(delay * 1.5, 1.0)
+        _LOGGER.debug(
+            "%s ready after %.3fs", zone.full_name, time.monotonic() - start_time
+        )
+        return True
+
     async def _execute_avr_command(self, command_item: CommandItem) -> None:
         """Execute an AVR command from the command queue."""
         if (command := command_item.command).startswith("_"):
@@ -601,6 +704,7 @@ class PioneerAVR(AVRConnection):
 
     async def power_off(self, zone: Zone = Zone.Z1) -> None:
         """Power off the Pioneer AVR zone."""
+        await self.cancel_volume_ramp(zone)
         await self.send_command(
             "power_off", zone=self._check_zone(zone), wait_for_command_queue=True
         )
@@ -611,55 +715,229 @@ class PioneerAVR(AVRConnection):
 
     async def volume_up(self, zone: Zone = Zone.Z1) -> None:
         """Volume up media player."""
+        await self.cancel_volume_ramp(zone)
         await self.send_command("volume_up", zone=self._check_zone(zone))
 
     async def volume_down(self, zone: Zone = Zone.Z1) -> None:
         """Volume down media player."""
+        await self.cancel_volume_ramp(zone)
         await self.send_command("volume_down", zone=self._check_zone(zone))
 
     async def set_volume_level(self, target_volume: int, zone: Zone = Zone.Z1) -> None:
         """Set volume level (0..185 for Zone 1, 0..81 for other Zones)."""
         zone = self._check_zone(zone)
+        await self.cancel_volume_ramp(zone)
+        await self._set_volume_level(target_volume, zone=zone)
 
+    async def _set_volume_level(self, target_volume: int, zone: Zone) -> None:
+        """Set volume level directly or by stepping volume."""
         if not self.params.get_param(PARAM_VOLUME_STEP_ONLY):
             await self.send_command("set_volume_level", target_volume, zone=zone)
             return
 
         ## Step volume to reach target volume
+        from .decoders.amp import Volume  # pylint: disable=import-outside-toplevel
+
         Volume.value_to_code(target_volume, zone=zone, properties=self.properties)
-        start_volume = self.properties.volume.get(zone)
-        current_volume = start_volume
-        volume_step_count = 0
-        command = "set_volume_level"
-        if target_volume > start_volume:  # step up
-            while current_volume < target_volume:
-                await self.volume_up(zone)
-                volume_step_count += 1
-                new_volume = self.properties.volume.get(zone)
-                if new_volume <= current_volume:  # going wrong way
-                    raise AVRCommandError(
-                        command=command, err="AVR volume_up failed", zone=zone
-                    )
-                if volume_step_count > (target_volume - start_volume):
-                    raise AVRCommandError(
-                        command=command, err="maximum volume steps exceeded", zone=zone
-                    )
-                current_volume = new_volume
-        elif target_volume < start_volume:  # step down
-            while current_volume > target_volume:
-                _LOGGER.debug("current volume: %d", current_volume)
-                await self.volume_down(zone)
-                volume_step_count += 1
-                new_volume = self.properties.volume.get(zone)
-                if new_volume >= current_volume:  # going wrong way
-                    raise AVRCommandError(
-                        command=command, err="AVR volume_down failed", zone=zone
+        await self._step_value(
+            command="set_volume_level",
+            step_commands=("volume_up", "volume_down"),
+            get_value=lambda: self.properties.volume.get(zone),
+            target_value=target_volume,
+            step_window=self.params.get_param(PARAM_VOLUME_STEP_WINDOW),
+            zone=zone,
+        )
+
+    async def _step_value(
+        self,
+        command: str,
+        step_commands: tuple[str, str],
+        get_value: Callable[[], int],
+        target_value: int,
+        step_window: int,
+        step_size: int = None,
+        max_steps: int = None,
+        zone: Zone = Zone.Z1,
+        rate_limit: bool = True,
+        correct_overshoot: bool = True,
+    ) -> None:
+        """
+        Step a value to target value using up/down commands, keeping a window
+        of steps in flight. The step size is learned from the first step if
+        not specified.
+        """
+        start_value = current_value = get_value()
+        if target_value == start_value:
+            return
+        direction = 1 if target_value > start_value else -1
+        step_command = step_commands[0] if direction > 0 else step_commands[1]
+        step_window = max(1, step_window or 1)
+        if max_steps is None:
+            max_steps = abs(target_value - start_value)
+        steps_sent = 0
+
+        while True:
+            moved = (current_value - start_value) * direction
+            if moved < 0:  # going wrong way
+                raise AVRCommandError(
+                    command=command, err=f"AVR {step_command} failed", zone=zone
+                )
+            if step_size is None and moved > 0:
+                step_size = moved
+            remaining = (target_value - current_value) * direction
+            if step_size is None:
+                steps_in_flight = steps_sent
+                steps_wanted = min(1, max_steps)  ## first step only
+            else:
+                ## NOTE: acknowledged steps are rounded up
+                steps_in_flight = steps_sent + (-moved // step_size)
+                steps_wanted = -(-max(remaining, 0) // step_size)
+            if remaining <= 0 and steps_in_flight <= 0:
+                break
+
+            ## Hold request lock so other requests do not consume step responses
+            async with self._request_lock:
+                ## Send steps up to window size without waiting for responses
+                steps = min(step_window, steps_wanted) - steps_in_flight
+                for _ in range(steps):
+                    if steps_sent >= max_steps:
+                        raise AVRCommandError(
+                            command=command,
+                            err=f"maximum {step_command} steps exceeded",
+                            zone=zone,
+                        )
+                    await self.send_command(
+                        step_command,
+                        zone=zone,
+                        rate_limit=rate_limit,
+                        wait_for_response=False,
                     )
-                if volume_step_count > (start_volume - target_volume):
+                    steps_sent += 1
+
+                ## Wait for value to change
+                if not await self._wait_for_change(get_value, current_value):
+                    if remaining <= 0:  ## target reached, steps unaccounted
+                        break
                     raise AVRCommandError(
-                        command=command, err="maximum volume steps exceeded", zone=zone
+                        command=command, err=f"AVR {step_command} failed", zone=zone
                     )
-                current_volume = self.properties.volume.get(zone)
+            current_value = get_value()
+
+        ## Step back if steps overshot target by a whole step
+        overshoot = (current_value - target_value) * direction
+        if correct_overshoot and step_size and overshoot >= step_size:
+            _LOGGER.debug("%s overshot target by %d, correcting", command, overshoot)
+            await self._step_value(
+                command=command,
+                step_commands=step_commands,
+                get_value=get_value,
+                target_value=current_value
+                - (overshoot // step_size) * step_size * direction,
+                step_window=step_window,
+                step_size=step_size,
+                zone=zone,
+                rate_limit=rate_limit,
+                correct_overshoot=False,
+            )
+
+    async def ramp_volume(
+        self,
+        target_volume: int,
+        duration: float,
+        zone: Zone = Zone.Z1,
+        curve: VolumeRampCurve = VolumeRampCurve.LINEAR,
+        wait: bool = True,
+    ) -> None:
+        """Ramp volume level to target volume over duration seconds."""
+        zone = self._check_zone(zone)
+        from .decoders.amp import Volume  # pylint: disable=import-outside-toplevel
+
+        Volume.value_to_code(target_volume, zone=zone, properties=self.properties)
+        await self.cancel_volume_ramp(zone)
+        start_volume = self.properties.volume.get(zone)
+        if start_volume is None or duration <= 0:
+            await self._set_volume_level(target_volume, zone=zone)
+            return
+
+        ramp = VolumeRamp(
+            zone=zone,
+            start_volume=start_volume,
+            target_volume=target_volume,
+            duration=duration,
+            curve=curve,
+        )
+        _LOGGER.debug("starting %s", ramp)
+        self._volume_ramps[zone] = ramp
+        self._volume_ramp_tasks[zone] = task = asyncio.create_task(
+            self._volume_ramp_scheduler(ramp), name=f"avr_volume_ramp_{zone.name}"
+        )
+        if wait:
+            await asyncio.wait([task])
+
+    async def cancel_volume_ramp(self, zone: Zone = Zone.Z1) -> None:
+        """Cancel volume ramp in progress for zone."""
+        if (ramp := self._volume_ramps.pop(zone, None)) is None:
+            return
+        _LOGGER.debug("cancelling %s", ramp)
+        ramp.finished.set()
+        self.properties.command_queue.remove("_ramp_volume", zone=zone)
+        await cancel_task(
+            self._volume_ramp_tasks.pop(zone, None),
+            debug=self.params.get_param(PARAM_DEBUG_COMMAND_QUEUE),
+        )
+
+    async def _volume_ramp_scheduler(self, ramp: VolumeRamp) -> None:
+        """Queue volume ramp steps at the times the ramp volume changes."""
+        command_queue = self.properties.command_queue
+        schedule = ramp.get_schedule(self.params.get_param(PARAM_COMMAND_DELAY))
+        for ramp_time in schedule:
+            await asyncio.sleep(max(0.0, ramp_time - time.monotonic()))
+            final_step = ramp_time == schedule[-1]
+            command_queue.enqueue(
+                CommandItem(
+                    "_ramp_volume", ramp, final_step, zone=ramp.zone, queue_id=0
+                )
+            )
+        await ramp.finished.wait()
+
+    async def _ramp_volume_step(self, ramp: VolumeRamp, final_step: bool) -> None:
+        """Set volume to the current level of a volume ramp."""
+        zone = ramp.zone
+        if self._volume_ramps.get(zone) is not ramp:
+            return  ## step queued for a cancelled or superseded ramp
+        current_volume = self.properties.volume.get(zone)
+        if current_volume != ramp.last_volume:
+            _LOGGER.info(
+                "volume changed during volume ramp for %s, cancelling ramp",
+                zone.full_name,
+            )
+            await self.cancel_volume_ramp(zone)
+            return
+        volume = ramp.target_volume if final_step else ramp.get_volume()
+        if volume != current_volume:
+            try:
+                await self._set_volume_level(volume, zone=zone)
+            except AVRError:
+                await self.cancel_volume_ramp(zone)
+                raise
+            ramp.last_volume = self.properties.volume.get(zone)
+        if final_step:
+            _LOGGER.debug("completed %s", ramp)
+            self._volume_ramps.pop(zone, None)
+            self._volume_ramp_tasks.pop(zone, None)
+            ramp.finished.set()
+
+    async def _wait_for_change(self, get_value: Callable[[], Any], value: Any) -> bool:
+        """Wait for a property value to change, return False on timeout."""
+        while get_value() == value:
+            self._properties_updated.clear()
+            try:
+                await asyncio.wait_for(
+                    self._properties_updated.wait(), timeout=self._timeout
+                )
+            except TimeoutError:
+                return False
+        return True
 
     async def mute_on(self, zone: Zone = Zone.Z1) -> None:
         """Mute AVR."""
@@ -755,52 +1033,78 @@ class PioneerAVR(AVRConnection):
 
     async def _step_tuner_frequency(self, band: str, frequency: float) -> None:
         """Step the tuner frequency until requested frequency is reached."""
-        zone = Zone.Z1
+        command = "set_tuner_frequency"
         current_freq = self.properties.tuner.get("frequency")
         if band == "AM":
-            if not (
-                am_frequency_step := self.properties.tuner.get("am_frequency_step")
-            ):
+            if not (step_size := self.properties.tuner.get("am_frequency_step")):
                 raise AVRLocalCommandError(
                     command="set_tuner_frequency", err_key="freq_step_unknown"
                 )
-            target_freq = frequency // am_frequency_step * am_frequency_step
-            count = abs(frequency - current_freq) // am_frequency_step + 1
+            freq_units = 1  ## AM frequencies stepped in kHz
         else:
-            target_freq = frequency * 1000 // 50 * 50 / 1000
-            count = abs(int(frequency * 1000) - int(current_freq * 1000)) // 50 + 1
-
-        ## Continue adjusting until frequency is set
-        rc = True
-        if target_freq > current_freq:
-            while current_freq < target_freq and count > 0 and rc:
-                rc = await self.send_command(
-                    "tuner_increase_frequency",
-                    zone=zone,
-                    ignore_error=False,
-                    rate_limit=False,
-                )
-                if rc is None:  ## ignore timeouts
-                    rc = True
-                current_freq = self.properties.tuner.get("frequency")
-                count -= 1
-        elif target_freq < current_freq:
-            while current_freq > target_freq and count > 0 and rc:
-                rc = await self.send_command(
-                    "tuner_decrease_frequency",
-                    zone=zone,
-                    ignore_error=False,
-                    rate_limit=False,
+            fm_frequency_step = self.params.get_param(PARAM_TUNER_FM_FREQ_STEP)
+            step_size = max(1, round(fm_frequency_step / 10))  ## kHz to 0.01MHz
+            freq_units = 100  ## FM frequencies stepped in 0.01MHz
+
+        def get_freq_units() -> int | None:
+            if (freq := self.properties.tuner.get("frequency")) is None:
+                return None
+            return round(freq * freq_units)
+
+        def get_target_units(start_units: int) -> int:
+            """Get frequency closest to target reachable in steps from start."""
+            steps = round((frequency * freq_units - start_units) / step_size)
+            return start_units + steps * step_size
+
+        ## Select the closest known preset first if it saves steps, allowing
+        ## for the preset select and frequency query
+        preset_cost = 2
+        current_units = round(current_freq * freq_units)
+        target_units = get_target_units(current_units)
+        start_steps = abs(target_units - current_units) // step_size
+        steps = start_steps
+        preset = None
+        for tuner_preset, (preset_band, preset_freq) in (
+            self.properties.tuner_presets.items()
+        ):
+            preset_steps = abs(target_units - round(preset_freq * freq_units))
+            preset_steps = preset_steps // step_size + preset_cost
+            if preset_band == band and preset_steps < steps:
+                preset, steps = tuner_preset, preset_steps
+        if preset is not None:
+            _LOGGER.debug("selecting tuner preset %s to seek frequency", preset)
+            await self.send_command("select_tuner_preset", preset)
+            await self.send_command("query_tuner_frequency")
+
+            ## Count steps from the reported frequency, as the preset may have
+            ## been stored again on the AVR since it was learned
+            steps = start_steps
+            if (preset_units := get_freq_units()) is not None:
+                target_units = get_target_units(preset_units)
+                steps = abs(target_units - preset_units) // step_size
+            if steps >= start_steps:
+                _LOGGER.debug(
+                    "tuner preset %s frequency %s not closer than %s",
+                    preset,
+                    self.properties.tuner.get("frequency"),
+                    current_freq,
                 )
-                if rc is None:  ## ignore timeouts
-                    rc = True
-                current_freq = self.properties.tuner.get("frequency")
-                count -= 1
 
-        if count == 0:
-            raise AVRLocalCommandError(
-                command="step_tuner_frequency", err_key="freq_step_max_exceeded"
+        try:
+            await self._step_value(
+                command=command,
+                step_commands=("tuner_increase_frequency", "tuner_decrease_frequency"),
+                get_value=get_freq_units,
+                target_value=target_units,
+                step_window=self.params.get_param(PARAM_TUNER_STEP_WINDOW),
+                step_size=step_size,
+                max_steps=steps + 1,
+                rate_limit=False,
             )
+        except AVRCommandError as exc:
+            raise AVRLocalCommandError(
+                command=command, err_key="freq_set_failed", exc=exc, frequency=frequency
+            ) from exc
 
     async def set_tuner_frequency(
         self, band: TunerBand, frequency: float | int
@@ -811,12 +1115,27 @@ class PioneerAVR(AVRConnection):
         if band is TunerBand.AM and not self.properties.tuner.get("am_frequency_step"):
             await self.properties.command_queue.wait()  ## for AM step calculation
 
+        # pylint: disable=import-outside-toplevel
+        from .decoders.tuner import TunerAMFrequency, TunerFMFrequency
+
         if band is TunerBand.AM:
             code = TunerAMFrequency.value_to_code(frequency, properties=self.properties)
         else:
             code = TunerFMFrequency.value_to_code(frequency)
 
-        if await self.send_command("tuner_direct_access", ignore_error=True):
+        ## Skip direct access if learned to be unsupported
+        direct_access = False
+        capabilities = self.properties.capabilities
+        if not capabilities.is_unsupported("tuner_direct_access", Zone.Z1):
+            try:
+                direct_access = await self.send_command("tuner_direct_access")
+                capabilities.record_success("tuner_direct_access", Zone.Z1)
+            except AVRCommandResponseError as exc:
+                self._record_unsupported("tuner_direct_access", Zone.Z1, exc)
+            except AVRResponseTimeoutError:
+                pass  ## not evidence that direct access is unsupported
+
+        if direct_access:
             ## Set tuner frequency directly if command is supported
             try:
                 for digit in code.lstrip("0"):
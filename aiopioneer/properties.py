@@ -2,11 +2,21 @@
 
 import logging
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
+from .capabilities import CommandCapabilities
 from .command_queue import CommandQueue
-from .const import Zone, MEDIA_CONTROL_COMMANDS, LISTENING_MODES, SOURCE_TUNER
+from .const import (
+    Zone,
+    TunerBand,
+    MEDIA_CONTROL_COMMANDS,
+    LISTENING_MODES,
+    SOURCE_TUNER,
+)
 from .exceptions import AVRLocalCommandError
+from .history import PropertyHistory
 from .params import (
     AVRParams,
     PARAM_MODEL,
@@ -19,91 +29,375 @@ from .params import (
 
 _LOGGER = logging.getLogger(__name__)
 
+SNAPSHOT_PROPERTIES = [
+    "zones",
+    "zones_initial_refresh",
+    "power",
+    "volume",
+    "max_volume",
+    "mute",
+    "source_id",
+    "source_name",
+    "listening_mode",
+    "listening_mode_id",
+    "listening_modes_all",
+    "available_listening_modes",
+    "media_control_mode",
+    "tone",
+    "amp",
+    "tuner",
+    "dsp",
+    "video",
+    "system",
+    "audio",
+    "channel_level",
+    "query_sources",
+    "source_name_to_id",
+    "source_id_to_name",
+]
+
+## Base properties holding tables shared between instances
+SHARED_PROPERTIES = ["listening_modes_all", "available_listening_modes"]
+
+## Base properties cleared by AVRProperties.reset
+RESET_PROPERTIES = ["power", "volume", "mute", "dsp", "video", "system", "audio"]
+
+_EMPTY: Mapping = MappingProxyType({})
+
+
+## Listening mode tables and frozen snapshots shared between instances. These
+## must not be modified
+_LISTENING_MODES_CACHE: dict[tuple, tuple[dict[int, list], dict[int, str]]] = {}
+_LISTENING_MODES_CACHE_MAX = 32
+_SHARED_SNAPSHOTS: dict[int, tuple[Any, Any]] = {}
+
+
+def _get_listening_modes(
+    extra_modes: dict[int, list],
+    disabled_modes: list[int],
+    enabled_modes: list[int],
+    multichannel: bool,
+) -> tuple[dict[int, list], dict[int, str]]:
+    """Get all and available listening modes, shared between instances."""
+    key = (repr(extra_modes), tuple(disabled_modes), tuple(enabled_modes))
+    key += (bool(multichannel),)
+    if (modes := _LISTENING_MODES_CACHE.get(key)) is not None:
+        return modes
+
+    listening_modes_all = LISTENING_MODES
+    if extra_modes:
+        listening_modes_all = LISTENING_MODES | extra_modes
+    available_listening_modes = {}
+    available_mode_names = []
+    _LOGGER.debug("determining available listening modes")
+    for mode_id, mode_details in listening_modes_all.items():
+        if mode_id in disabled_modes or (
+            enabled_modes and mode_id not in enabled_modes
+        ):
+            continue
+        mode_name, mode_2ch, mode_multich = mode_details
+        if mode_name in available_mode_names:
+            _LOGGER.warning("ignored duplicate listening mode name: %s", mode_name)
+            continue
+        if (multichannel and mode_multich) or (not multichannel and mode_2ch):
+            available_listening_modes[mode_id] = mode_name
+        available_mode_names.append(mode_name)
+
+    if len(_LISTENING_MODES_CACHE) >= _LISTENING_MODES_CACHE_MAX:
+        _LISTENING_MODES_CACHE.clear()
+        _SHARED_SNAPSHOTS.clear()
+    modes = _LISTENING_MODES_CACHE[key] = (
+        listening_modes_all,
+        available_listening_modes,
+    )
+    return modes
+
+
+def _freeze_shared(value: Any) -> Any:
+    """Return an immutable copy of a shared table, frozen once per process."""
+    if (cached := _SHARED_SNAPSHOTS.get(id(value))) is not None:
+        if cached[0] is value:
+            return cached[1]
+    frozen = _freeze(value)
+    _SHARED_SNAPSHOTS[id(value)] = (value, frozen)
+    return frozen
+
+
+def _freeze(value: Any) -> Any:
+    """Return an immutable copy of a property value."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, set):
+        return frozenset(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value  ## immutable, or already frozen
+
+
+def _replace_item(mapping: Mapping, key: Any, value: Any) -> Mapping:
+    """Return a frozen copy of mapping with key set, or deleted if value is None."""
+    items = dict(mapping)
+    if value is not None:
+        items[key] = value
+    else:
+        items.pop(key, None)
+    return MappingProxyType(items)
+
+
+class BaseProperty:
+    """Read-only view of a base property in the AVRProperties property store."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: "AVRProperties", owner: type = None) -> Any:
+        if instance is None:
+            return self
+        return instance._store[self.name]  # pylint: disable=protected-access
+
+    def __set__(self, instance: "AVRProperties", value: Any) -> None:
+        raise AttributeError(
+            f"base property {self.name} is read-only, use set_property to update"
+        )
+
 
 class AVRProperties:
     """Pioneer AVR properties class."""
 
+    ## AVR base properties, read-only views of the property store
+    zones: frozenset[Zone] = BaseProperty()
+    zones_initial_refresh: frozenset[Zone] = BaseProperty()
+    power: Mapping[Zone, bool] = BaseProperty()
+    volume: Mapping[Zone, int] = BaseProperty()
+    max_volume: Mapping[Zone, int] = BaseProperty()
+    mute: Mapping[Zone, bool] = BaseProperty()
+    source_id: Mapping[Zone, int] = BaseProperty()
+    source_name: Mapping[Zone, str] = BaseProperty()
+    listening_mode: str = BaseProperty()
+    listening_mode_id: int = BaseProperty()
+    listening_modes_all: Mapping[int, tuple] = BaseProperty()
+    available_listening_modes: Mapping[int, str] = BaseProperty()
+    media_control_mode: Mapping[Zone, str] = BaseProperty()
+    tone: Mapping[Zone, Mapping] = BaseProperty()
+    amp: Mapping[str | Zone, Any] = BaseProperty()
+    tuner: Mapping[str | Zone, Any] = BaseProperty()
+    dsp: Mapping[str | Zone, Any] = BaseProperty()
+    video: Mapping[str | Zone, Any] = BaseProperty()
+    system: Mapping[str | Zone, Any] = BaseProperty()
+    audio: Mapping[str | Zone, Any] = BaseProperty()
+
+    ## Complex object that holds multiple different props for the CHANNEL/DSP functions
+    channel_level: Mapping[Zone, Mapping[str, Any]] = BaseProperty()
+
+    ## Source name mappings
+    query_sources: bool = BaseProperty()
+    source_name_to_id: Mapping[str, int] = BaseProperty()
+    source_id_to_name: Mapping[int, str] = BaseProperty()
+
     def __init__(self, params: AVRParams):
         self._params = params
-
-        ## AVR base properties
-        self.zones: set[Zone] = set()
-        self.zones_initial_refresh: set[Zone] = set()
         self.command_queue = CommandQueue(params)
-        self.power: dict[Zone, bool] = {}
-        self.volume: dict[Zone, int] = {}
-        self.max_volume: dict[Zone, int] = {}
-        self.mute: dict[Zone, bool] = {}
-        self.source_id: dict[Zone, int] = {}
-        self.source_name: dict[Zone, str] = {}
-        self.listening_mode: str = None
-        self.listening_mode_id: int = None
-        self.listening_modes_all: dict[int, list] = {}
-        self.available_listening_modes: dict[int, str] = {}
-        self.media_control_mode: dict[Zone, str] = {}
-        self.tone: dict[Zone, dict] = {}
-        self.amp: dict[str | Zone, Any] = {
-            "model": params.get_param(PARAM_MODEL),
-            "software_version": None,
-            "mac_addr": None,
-        }
-        self.tuner: dict[str | Zone, Any] = {
-            "am_frequency_step": self._params.get_param(PARAM_TUNER_AM_FREQ_STEP),
-        }
-        self.dsp: dict[str | Zone, Any] = {}
-        self.video: dict[str | Zone, Any] = {}
-        self.system: dict[str | Zone, Any] = {}
-        self.audio: dict[str | Zone, Any] = {}
-
-        ## Complex object that holds multiple different props for the CHANNEL/DSP functions
-        self.channel_level: dict[Zone, dict[str, Any]] = {}
-
-        ## Source name mappings
-        self.query_sources = None
-        self.source_name_to_id: dict[str, int] = {}
-        self.source_id_to_name: dict[int, str] = {}
+
+        ## Base property values are frozen and only updated with set_property,
+        ## which replaces the changed branches and the store itself. Each
+        ## store is therefore an immutable snapshot of the AVR properties
+        self._store: Mapping[str, Any] = MappingProxyType(
+            {base_property: _EMPTY for base_property in SNAPSHOT_PROPERTIES}
+            | {
+                "zones": frozenset(),
+                "zones_initial_refresh": frozenset(),
+                "listening_mode": None,
+                "listening_mode_id": None,
+                "amp": _freeze(
+                    {
+                        "model": params.get_param(PARAM_MODEL),
+                        "software_version": None,
+                        "mac_addr": None,
+                    }
+                ),
+                "tuner": _freeze(
+                    {"am_frequency_step": params.get_param(PARAM_TUNER_AM_FREQ_STEP)}
+                ),
+                "query_sources": None,
+            }
+        )
+
+        ## Tuner preset frequencies learned from preset responses
+        self.tuner_presets: dict[tuple[str, int], tuple[TunerBand, float | int]] = {}
+
+        ## Last decoded code, time, committed values and updated zones for
+        ## repeated responses
+        self.response_cache: dict[
+            tuple[str, Zone],
+            tuple[str, float, tuple[tuple[str, Zone, str, Any]], frozenset[Zone]],
+        ] = {}
+        self.skipped_decode_count = 0
+
+        ## Property change versions, ordered by version
+        self.version = 0
+        self._property_versions: dict[tuple[str, Zone, str], int] = {}
+
+        ## Property change history, if enabled
+        self.history = PropertyHistory(params)
+
+        ## Query commands learned to be unsupported by the AVR model
+        self.capabilities = CommandCapabilities(params)
 
         # Register params update callbacks
         def update_params(params: AVRParams):  # pylint: disable=unused-argument
             self.update_listening_modes()
 
-        params.register_update_callback(update_params)
+        params.register_update_callback(
+            update_params,
+            params=[
+                PARAM_DISABLED_LISTENING_MODES,
+                PARAM_ENABLED_LISTENING_MODES,
+                PARAM_EXTRA_LISTENING_MODES,
+            ],
+        )
+
+        def clear_response_cache(params: AVRParams):  # pylint: disable=unused-argument
+            self.response_cache = {}  ## decoding may depend on params
+
+        params.register_update_callback(clear_response_cache)
 
     def reset(self) -> None:
         """Reset AVR properties."""
         _LOGGER.info("resetting cached AVR properties")
-        self.zones_initial_refresh: set[Zone] = set()
         self.command_queue.purge()
-        self.power = {}
-        self.volume = {}
-        self.mute = {}
-        self.listening_mode = None
-        self.listening_mode_id = None
-        self.amp = {
-            "model": self.amp.get("model"),
-            "software_version": self.amp.get("software_version"),
-            "mac_addr": self.amp.get("mac_addr"),
-        }
-        self.tuner = {"am_frequency_step": self.tuner.get("am_frequency_step")}
-        self.dsp = {}
-        self.video = {}
-        self.system = {}
-        self.audio = {}
+        amp, tuner = self.amp, self.tuner
+        self._store = MappingProxyType(
+            self._store
+            | {base_property: _EMPTY for base_property in RESET_PROPERTIES}
+            | {
+                "zones_initial_refresh": frozenset(),
+                "listening_mode": None,
+                "listening_mode_id": None,
+                "amp": _freeze(
+                    {
+                        "model": amp.get("model"),
+                        "software_version": amp.get("software_version"),
+                        "mac_addr": amp.get("mac_addr"),
+                    }
+                ),
+                "tuner": _freeze({"am_frequency_step": tuner.get("am_frequency_step")}),
+            }
+        )
+        self.response_cache = {}
+
+        ## Reset properties are reported as changed
+        for key in list(self._property_versions):
+            self._commit_version(*key)
+
+    def get_property_value(
+        self, base_property: str, zone: Zone = Zone.ALL, property_name: str = None
+    ) -> Any:
+        """Get current value of a property."""
+        current_base = getattr(self, base_property)
+        if zone not in [Zone.ALL, None]:
+            current_base = current_base.get(zone)
+            if property_name is None:
+                return current_base
+            return None if current_base is None else current_base.get(property_name)
+        if property_name is None:
+            return current_base
+        return current_base.get(property_name)
+
+    def set_property(
+        self,
+        base_property: str,
+        value: Any,
+        zone: Zone = Zone.ALL,
+        property_name: str = None,
+    ) -> bool:
+        """
+        Set the value of a property, or delete a zone or named property if
+        value is None, and record the change. Return whether the value changed.
+        """
+        if zone is None:
+            zone = Zone.ALL
+        if base_property in SHARED_PROPERTIES:
+            value = _freeze_shared(value)
+        else:
+            value = _freeze(value)
+        current_base = self._store[base_property]
+        if zone is Zone.ALL and property_name is None:
+            if current_base is value or current_base == value:
+                return False
+            new_base = value
+        elif zone is Zone.ALL or property_name is None:
+            key = zone if property_name is None else property_name
+            if current_base.get(key) == value:
+                return False
+            new_base = _replace_item(current_base, key, value)
+        else:
+            current_zone = current_base.get(zone, _EMPTY)
+            if current_zone.get(property_name) == value:
+                return False
+            new_base = _replace_item(
+                current_base,
+                zone,
+                _replace_item(current_zone, property_name, value),
+            )
+        self._store = MappingProxyType(self._store | {base_property: new_base})
+        self._commit_version(base_property, zone, property_name)
+        return True
+
+    def _commit_version(
+        self, base_property: str, zone: Zone = Zone.ALL, property_name: str = None
+    ) -> int:
+        """Record a committed property change, and return the new version."""
+        self.version += 1
+        key = (base_property, Zone.ALL if zone is None else zone, property_name)
+        self._property_versions.pop(key, None)  ## keep versions ordered
+        self._property_versions[key] = self.version
+        return self.version
+
+    def get_property_version(
+        self, base_property: str, zone: Zone = Zone.ALL, property_name: str = None
+    ) -> int:
+        """Get version of last committed change to a property, or 0 if unchanged."""
+        key = (base_property, Zone.ALL if zone is None else zone, property_name)
+        return self._property_versions.get(key, 0)
+
+    def get_changes(self, since_version: int = 0) -> dict[tuple[str, Zone, str], Any]:
+        """
+        Get current values of properties changed since version since_version,
+        keyed by (base_property, zone, property_name) in order of change.
+        """
+        changes = []
+        for key, version in reversed(self._property_versions.items()):
+            if version <= since_version:
+                break
+            changes.append((key, self.get_property_value(*key)))
+        return dict(reversed(changes))
+
+    def get_snapshot(self) -> Mapping[str, Any]:
+        """
+        Get an immutable snapshot of AVR properties.
+
+        The property store is replaced rather than modified on each change, so
+        the snapshot is the current store. Base properties unchanged since a
+        previous snapshot are shared with it.
+        """
+        return self._store
 
     def set_source_dict(self, sources: dict[int, str] | dict[str, str]) -> None:
         """Set source ID to name mapping."""
-        self.query_sources = False
+        self.set_property("query_sources", False)
         try:
             if sources and isinstance(list(sources.keys())[0], str):
                 ## TODO: deprecate legacy (source_name, str(src_id)) format
                 _LOGGER.warning("converting legacy source dict format")
-                self.source_name_to_id = {k: int(v) for k, v in sources.items()}
-                self.source_id_to_name = {int(v): k for k, v in sources.items()}
+                source_name_to_id = {k: int(v) for k, v in sources.items()}
+                source_id_to_name = {int(v): k for k, v in sources.items()}
             else:
-                self.source_id_to_name = sources.copy()
-                self.source_name_to_id = {v: k for k, v in sources.items()}
+                source_id_to_name = dict(sources)
+                source_name_to_id = {v: k for k, v in sources.items()}
         except (ValueError, KeyError) as exc:
             raise AVRLocalCommandError(command="set_source_dict", exc=exc) from exc
+        self.set_property("source_name_to_id", source_name_to_id)
+        self.set_property("source_id_to_name", source_id_to_name)
 
     def get_source_dict(self, zone: Zone = None) -> dict[int, str]:
         """Return source ID to name mapping for zone."""
@@ -139,25 +433,12 @@ class AVRProperties:
 
     def update_listening_modes(self) -> None:
         """Update list of valid listening modes for current input source."""
-        self.listening_modes_all = LISTENING_MODES | self._params.get_param(
-            PARAM_EXTRA_LISTENING_MODES, {}
+        ## NOTE: listening mode tables are shared between instances
+        listening_modes_all, available_listening_modes = _get_listening_modes(
+            extra_modes=self._params.get_param(PARAM_EXTRA_LISTENING_MODES, {}),
+            disabled_modes=self._params.get_param(PARAM_DISABLED_LISTENING_MODES, []),
+            enabled_modes=self._params.get_param(PARAM_ENABLED_LISTENING_MODES, []),
+            multichannel=self.audio.get("input_multichannel"),
         )
-        self.available_listening_modes = {}
-        disabled_modes = self._params.get_param(PARAM_DISABLED_LISTENING_MODES, [])
-        enabled_modes = self._params.get_param(PARAM_ENABLED_LISTENING_MODES, [])
-        available_mode_names = []
-        multichannel = self.audio.get("input_multichannel")
-
-        _LOGGER.debug("determining available listening modes")
-        for mode_id, mode_details in self.listening_modes_all.items():
-            if mode_id in disabled_modes or (
-                enabled_modes and mode_id not in enabled_modes
-            ):
-                continue
-            mode_name, mode_2ch, mode_multich = mode_details
-            if mode_name in available_mode_names:
-                _LOGGER.warning("ignored duplicate listening mode name: %s", mode_name)
-                continue
-            if (multichannel and mode_multich) or (not multichannel and mode_2ch):
-                self.available_listening_modes |= {mode_id: mode_name}
-            available_mode_names.append(mode_name)
+        self.set_property("listening_modes_all", listening_modes_all)
+        self.set_property("available_listening_modes", available_listening_modes)
@@ -2,16 +2,11 @@
 
 import logging
 
+from bisect import bisect_left
 from .const import Zone
 from .exceptions import AVRUnknownCommandError
 from .property_entry import AVRCommand, AVRPropertyEntry
-from .decoders.amp import PROPERTIES_AMP, EXTRA_COMMANDS_AMP
-from .decoders.audio import PROPERTIES_AUDIO
 from .decoders.code_map import CodeMapBase
-from .decoders.dsp import PROPERTIES_DSP
-from .decoders.system import PROPERTIES_SYSTEM
-from .decoders.tuner import PROPERTIES_TUNER, EXTRA_COMMANDS_TUNER
-from .decoders.video import PROPERTIES_VIDEO
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +26,11 @@ class AVRPropertyRegistry:
         self.commands: list[AVRCommand] = extra_commands or []
         self.code_map_index: dict[type[CodeMapBase], AVRPropertyEntry] = {}
         self.command_index: dict[str, AVRCommand] = {c.name: c for c in extra_commands}
+        self.response_index: dict[str, tuple[int, str, type[CodeMapBase], Zone]] = {}
+        self._response_lens: list[int] = []
+        self._command_names: list[tuple[str, int]] = []
+        self._zone_commands: dict[Zone, list[AVRCommand]] = {}
+        self._code_maps_cache: dict[tuple, list[type[CodeMapBase]]] = {}
 
         for property_entry in property_entries:
             self.responses += list(property_entry.responses)
@@ -51,6 +51,19 @@ class AVRPropertyRegistry:
                     )
                 self.command_index[command.name] = command
 
+        ## Index responses by prefix, first registered response takes precedence
+        for index, response in enumerate(self.responses):
+            self.response_index.setdefault(response[0], (index, *response))
+        self._response_lens = sorted({len(r) for r in self.response_index})
+
+        ## Index commands by name for prefix lookups, and by zone
+        self._command_names = sorted(
+            (command.name, index) for index, command in enumerate(self.commands)
+        )
+        for command in self.commands:
+            for zone in command.avr_commands:
+                self._zone_commands.setdefault(zone, []).append(command)
+
     def get_command(self, command: str, zone: Zone) -> AVRCommand:
         """Return AVR command for zone."""
         if command in self.command_index:
@@ -60,13 +73,23 @@ class AVRPropertyRegistry:
         raise AVRUnknownCommandError(command=command, zone=zone)
 
     def get_commands(self, prefix: str = None, zone: Zone = None) -> list[AVRCommand]:
-        """Return commands matching optional prefix and base_property."""
-        return (
-            c
-            for c in self.commands
-            if (not prefix or c.name.startswith(prefix))
-            and (zone is None or zone in c.avr_commands)
-        )
+        """Return commands matching optional prefix and zone in registration order."""
+        if not prefix:
+            if zone is None:
+                return list(self.commands)
+            return list(self._zone_commands.get(zone, []))
+
+        indexes = []
+        start = bisect_left(self._command_names, (prefix,))
+        for name, index in self._command_names[start:]:
+            if not name.startswith(prefix):
+                break
+            indexes.append(index)
+        return [
+            self.commands[index]
+            for index in sorted(indexes)
+            if zone is None or zone in self.commands[index].avr_commands
+        ]
 
     def get_code_maps(
         self,
@@ -75,18 +98,29 @@ class AVRPropertyRegistry:
         is_ha_auto_entity: bool = False,
     ) -> list[type[CodeMapBase]]:
         """Return property entries matching a CodeMapBase subclass."""
-        classes: list[type[CodeMapBase]] = []
-        for code_map in self.code_map_index:
-            if issubclass(code_map, base_class):
-                if (zone is None or zone in code_map.supported_zones) and (
-                    not is_ha_auto_entity or code_map.ha_auto_entity
-                ):
-                    classes.append(code_map)
-        return classes
+        key = (base_class, zone, is_ha_auto_entity)
+        if (classes := self._code_maps_cache.get(key)) is None:
+            classes = []
+            for code_map in self.code_map_index:
+                if issubclass(code_map, base_class):
+                    if (zone is None or zone in code_map.supported_zones) and (
+                        not is_ha_auto_entity or code_map.ha_auto_entity
+                    ):
+                        classes.append(code_map)
+            self._code_maps_cache[key] = classes
+        return list(classes)
 
     def match_response(self, raw_resp: str) -> tuple[str, type[CodeMapBase], Zone]:
         """Return code map for response."""
-        return next((r for r in self.responses if raw_resp.startswith(r[0])), None)
+        match = None
+        for response_len in self._response_lens:
+            if response_len > len(raw_resp):
+                break
+            if (entry := self.response_index.get(raw_resp[:response_len])) and (
+                match is None or entry[0] < match[0]
+            ):
+                match = entry
+        return match[1:] if match else None
 
 
 EXTRA_COMMANDS_IPOD = [
@@ -226,32 +260,58 @@ EXTRA_COMMANDS_MHL = [
     AVRCommand("mhl_show_information", {Zone.Z1: ["37MHL", "MHL"]}),
 ]
 
-PROPERTY_REGISTRY = AVRPropertyRegistry(
-    PROPERTIES_AMP
-    + PROPERTIES_SYSTEM
-    + PROPERTIES_DSP
-    + PROPERTIES_AUDIO
-    + PROPERTIES_TUNER
-    + PROPERTIES_VIDEO,
-    extra_commands=EXTRA_COMMANDS_AMP
-    + EXTRA_COMMANDS_TUNER
-    + EXTRA_COMMANDS_IPOD
-    + EXTRA_COMMANDS_NETWORK
-    + EXTRA_COMMANDS_ADAPTERPORT
-    + EXTRA_COMMANDS_BLUETOOTH
-    + EXTRA_COMMANDS_MHL,
-)
+_PROPERTY_REGISTRY: AVRPropertyRegistry = None
+
+
+def get_property_registry() -> AVRPropertyRegistry:
+    """Return the property registry, loading decoders on first use."""
+    global _PROPERTY_REGISTRY  # pylint: disable=global-statement
+
+    if _PROPERTY_REGISTRY is not None:
+        return _PROPERTY_REGISTRY
+
+    # pylint: disable=import-outside-toplevel
+    from .decoders.amp import PROPERTIES_AMP, EXTRA_COMMANDS_AMP
+    from .decoders.audio import PROPERTIES_AUDIO
+    from .decoders.dsp import PROPERTIES_DSP
+    from .decoders.system import PROPERTIES_SYSTEM
+    from .decoders.tuner import PROPERTIES_TUNER, EXTRA_COMMANDS_TUNER
+    from .decoders.video import PROPERTIES_VIDEO
+
+    _PROPERTY_REGISTRY = AVRPropertyRegistry(
+        PROPERTIES_AMP
+        + PROPERTIES_SYSTEM
+        + PROPERTIES_DSP
+        + PROPERTIES_AUDIO
+        + PROPERTIES_TUNER
+        + PROPERTIES_VIDEO,
+        extra_commands=EXTRA_COMMANDS_AMP
+        + EXTRA_COMMANDS_TUNER
+        + EXTRA_COMMANDS_IPOD
+        + EXTRA_COMMANDS_NETWORK
+        + EXTRA_COMMANDS_ADAPTERPORT
+        + EXTRA_COMMANDS_BLUETOOTH
+        + EXTRA_COMMANDS_MHL,
+    )
+    return _PROPERTY_REGISTRY
+
+
+def __getattr__(name: str):
+    """Build PROPERTY_REGISTRY on first access."""
+    if name == "PROPERTY_REGISTRY":
+        return get_property_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_property_entry(code_map: type[CodeMapBase]) -> AVRPropertyEntry:
     """Return property entry for code map."""
-    return PROPERTY_REGISTRY.code_map_index[code_map]
+    return get_property_registry().code_map_index[code_map]
 
 
 def get_code_maps(
     base_class: type[CodeMapBase], zone: Zone = None, is_ha_auto_entity: bool = False
 ) -> list[type[CodeMapBase]]:
     """Convenience function to return property entries matching a CodeMapBase subclass."""
-    return PROPERTY_REGISTRY.get_code_maps(
+    return get_property_registry().get_code_maps(
         base_class=base_class, zone=zone, is_ha_auto_entity=is_ha_auto_entity
     )
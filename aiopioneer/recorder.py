@@ -0,0 +1,194 @@
+"""aiopioneer raw AVR traffic recording and replay."""
+
+import asyncio
+import logging
+import os
+import time
+
+from collections.abc import Iterable, Iterator
+
+from .transport import AVRTransport
+
+_LOGGER = logging.getLogger(__name__)
+
+RECORD_TX = "T"  ## command sent to AVR
+RECORD_RX = "R"  ## response received from AVR
+RECORDER_MAX_BYTES = 10 * 1024 * 1024
+RECORDER_BACKUP_COUNT = 3
+
+
+class TrafficRecorder:
+    """
+    Append-only recorder of raw AVR traffic with size based rotation. Each
+    record is written as a line containing the timestamp, direction and the
+    raw command or response.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = RECORDER_MAX_BYTES,
+        backup_count: int = RECORDER_BACKUP_COUNT,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._file = open(path, "a", encoding="ascii", errors="replace")
+        self._size = self._file.tell()
+
+    def __repr__(self) -> str:
+        return f"TrafficRecorder(path={self.path}, size={self._size})"
+
+    def _write(self, direction: str, lines: Iterable[str]) -> None:
+        """Write records for lines."""
+        if self._file is None:
+            return
+        timestamp = f"{time.time():.6f} {direction} "
+        data = "".join(timestamp + line + "\n" for line in lines)
+        self._file.write(data)
+        self._size += len(data)
+        if self.max_bytes and self._size >= self.max_bytes:
+            self._rotate()
+
+    def record_tx(self, command: str) -> None:
+        """Record a command sent to the AVR."""
+        self._write(RECORD_TX, (command,))
+
+    def record_rx(self, responses: list[str]) -> None:
+        """Record responses received from the AVR."""
+        self._write(RECORD_RX, responses)
+
+    def _rotate(self) -> None:
+        """Rotate recording to backup files."""
+        self._file.close()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                if os.path.exists(source := f"{self.path}.{i}"):
+                    os.replace(source, f"{self.path}.{i + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        self._file = open(self.path, "w", encoding="ascii", errors="replace")
+        self._size = 0
+
+    def flush(self) -> None:
+        """Flush buffered records to the recording."""
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the recording."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_recording(paths: str | list[str]) -> Iterator[tuple[float, str, str]]:
+    """Read (timestamp, direction, line) records from recording files in order."""
+    for path in [paths] if isinstance(paths, str) else paths:
+        with open(path, encoding="ascii", errors="replace") as file:
+            for record in file:
+                timestamp, direction, line = (record.rstrip("\n") + " ").split(" ", 2)
+                yield float(timestamp), direction, line[:-1]
+
+
+class ReplayTransport(AVRTransport):
+    """
+    Transport that replays recorded AVR responses. Responses recorded after
+    a command are released only once the client has sent as many commands
+    as had been sent when they were recorded, so replay is deterministic.
+    Responses are replayed at the recorded speed multiplied by speed, or as
+    fast as possible if speed is None.
+    """
+
+    def __init__(self, paths: str | list[str], speed: float | None = 1.0):
+        self.paths = paths
+        self.speed = speed
+        self.finished = asyncio.Event()
+        self.diverged = 0  ## commands sent that differ from the recording
+        self._records: list[tuple[float, str, str]] = []
+        self._tx_lines: list[str] = []
+        self._index = 0
+        self._tx_count = 0  ## commands sent by client
+        self._replayed_tx = 0  ## recorded commands replayed
+        self._tx_event = asyncio.Event()
+        self._closed = True
+
+    def __repr__(self) -> str:
+        return (
+            f"ReplayTransport(records={len(self._records)}, index={self._index}, "
+            f"diverged={self.diverged})"
+        )
+
+    async def connect(self) -> None:
+        if not self._records:
+            self._records = list(read_recording(self.paths))
+            self._tx_lines = [
+                line for _, direction, line in self._records if direction == RECORD_TX
+            ]
+        self._index = 0
+        self._tx_count = 0
+        self._replayed_tx = 0
+        self._closed = False
+        self.finished.clear()
+
+    async def write_lines(self, lines: list[str]) -> None:
+        if self._closed:
+            raise ConnectionResetError("replay transport closed")
+        for line in lines:
+            if self._tx_count >= len(self._tx_lines):
+                expected = None
+            else:
+                expected = self._tx_lines[self._tx_count]
+            if line != expected:
+                self.diverged += 1
+                _LOGGER.debug("replay diverged: sent %s, recorded %s", line, expected)
+            self._tx_count += 1
+        self._tx_event.set()
+
+    async def read_lines(self) -> list[str]:
+        records = self._records
+        lines = []
+        while not lines:
+            if self._closed:
+                raise EOFError
+            if self._index >= len(records):
+                self.finished.set()
+                await self._tx_event.wait()  ## wait for close
+                self._tx_event.clear()
+                continue
+
+            ## Wait for commands sent before the next response was recorded
+            tx_count = 0
+            index = self._index
+            while index < len(records) and records[index][1] == RECORD_TX:
+                index += 1
+                tx_count += 1
+            if self._tx_count < self._replayed_tx + tx_count:
+                self._tx_event.clear()
+                await self._tx_event.wait()
+                continue
+            self._replayed_tx += tx_count
+            if index >= len(records):
+                self._index = index
+                continue
+
+            ## Replay response at recorded speed
+            timestamp = records[index][0]
+            if self.speed and index > 0:
+                delay = timestamp - records[index - 1][0]  ## since command or response
+                if delay > 0:
+                    await asyncio.sleep(delay / self.speed)
+            lines.append(records[index][2])
+            index += 1
+            while (
+                index < len(records)
+                and records[index][1] == RECORD_RX
+                and records[index][0] == timestamp
+            ):
+                lines.append(records[index][2])  ## responses received together
+                index += 1
+            self._index = index
+        return lines
+
+    async def close(self) -> None:
+        self._closed = True
+        self._tx_event.set()
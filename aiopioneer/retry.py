@@ -0,0 +1,103 @@
+"""aiopioneer retry policies for failed AVR requests."""
+
+import logging
+import random
+import time
+
+from collections import deque
+
+from .exceptions import AVRError, AVRCommandResponseError, AVRResponseTimeoutError
+from .params import (
+    AVRParams,
+    PARAM_RETRY_POLICY,
+    PARAM_RETRY_BUDGET,
+    PARAM_RETRY_BUDGET_WINDOW,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    """
+    Base retry policy for failed AVR requests. Subclasses override get_delay
+    to select the errors that are retried and the delay before each retry.
+    Retries are limited to a budget of retries per time window for all
+    requests.
+    """
+
+    def __init__(self, params: AVRParams):
+        self._params = params
+        self._retried_at: deque[float] = deque()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(retries={len(self._retried_at)})"
+
+    def get_delay(
+        self,
+        command: str,  # pylint: disable=unused-argument
+        exc: AVRError,  # pylint: disable=unused-argument
+        attempt: int,  # pylint: disable=unused-argument
+    ) -> float | None:
+        """Get delay before retry attempt, or None if the error is not retried."""
+        return None
+
+    def get_retry_delay(
+        self, command: str, exc: AVRError, attempt: int
+    ) -> float | None:
+        """Get delay before retrying a failed request if within retry budget."""
+        if (delay := self.get_delay(command, exc, attempt)) is None:
+            return None
+        if not self._consume_budget():
+            _LOGGER.warning("retry budget exhausted, not retrying command %s", command)
+            return None
+        return delay
+
+    def _consume_budget(self) -> bool:
+        """Consume a retry from the budget, return False if budget is exhausted."""
+        budget = self._params.get_param(PARAM_RETRY_BUDGET)
+        window = self._params.get_param(PARAM_RETRY_BUDGET_WINDOW)
+        now = time.monotonic()
+        while self._retried_at and now - self._retried_at[0] >= window:
+            self._retried_at.popleft()
+        if budget is not None and len(self._retried_at) >= budget:
+            return False
+        self._retried_at.append(now)
+        return True
+
+    def reset(self) -> None:
+        """Reset retry budget."""
+        self._retried_at.clear()
+
+
+class BackoffRetryPolicy(RetryPolicy):
+    """
+    Retry policy with exponential backoff and jitter for each error class
+    configured in the retry_policy parameter. The error class is the AVR
+    error response code, or timeout for response timeouts.
+    """
+
+    @staticmethod
+    def get_error_class(exc: AVRError) -> str | None:
+        """Get error class for an exception."""
+        if isinstance(exc, AVRCommandResponseError):
+            return exc.response
+        if isinstance(exc, AVRResponseTimeoutError):
+            return "timeout"
+        return None
+
+    def get_delay(
+        self,
+        command: str,  # pylint: disable=unused-argument
+        exc: AVRError,
+        attempt: int,
+    ) -> float | None:
+        """Get backoff delay for the error class of a failed request."""
+        retry_policy = self._params.get_param(PARAM_RETRY_POLICY) or {}
+        if (policy := retry_policy.get(self.get_error_class(exc))) is None:
+            return None
+        delay = min(
+            policy.get("delay", 1.0) * policy.get("backoff", 1.0) ** (attempt - 1),
+            policy.get("max_delay", float("inf")),
+        )
+        jitter = policy.get("jitter", 0.0)
+        return max(0.0, delay * (1 + random.uniform(-jitter, jitter)))
@@ -0,0 +1,146 @@
+"""aiopioneer transports for AVR connections."""
+
+import asyncio
+import logging
+
+from .util import sock_set_keepalive
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AVRTransport:
+    """
+    Base AVR transport. Sends command lines to and receives response lines
+    from an AVR. A transport may be connected again after it is closed.
+    """
+
+    async def connect(self) -> None:
+        """Open transport."""
+        raise NotImplementedError
+
+    async def write_lines(self, lines: list[str]) -> None:
+        """Write command lines."""
+        raise NotImplementedError
+
+    async def read_lines(self) -> list[str]:
+        """Wait for and return all received lines, raise EOFError if closed."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Close transport."""
+        raise NotImplementedError
+
+    def set_keepalive(self, timeout: float) -> None:
+        """Set keepalive timeout for dead connection detection, if supported."""
+
+
+class TCPTransport(AVRTransport):
+    """TCP transport to an AVR API port."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._reader: asyncio.StreamReader = None
+        self._writer: asyncio.StreamWriter = None
+        self._buffer = b""
+
+    def __repr__(self) -> str:
+        return f"TCPTransport(host={self.host}, port={self.port})"
+
+    async def connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(
+            self.host, self.port
+        )
+        self._buffer = b""
+
+    async def write_lines(self, lines: list[str]) -> None:
+        self._writer.write(b"".join(line.encode("ASCII") + b"\r" for line in lines))
+        await self._writer.drain()
+
+    async def read_lines(self) -> list[str]:
+        while b"\n" not in self._buffer:
+            if not (data := await self._reader.read(65536)):
+                raise EOFError
+            self._buffer += data
+        data, _, self._buffer = self._buffer.rpartition(b"\n")
+        return [self._decode_line(line) for line in data.split(b"\n")]
+
+    @staticmethod
+    def _decode_line(line: bytes) -> str:
+        """Decode a received line, escaping invalid characters."""
+        try:
+            return line.decode().strip()
+        except UnicodeDecodeError as exc:
+            _LOGGER.warning("invalid characters in AVR response %s: %s", line, exc)
+            return line.decode(errors="backslashreplace").strip()
+
+    async def close(self) -> None:
+        if (writer := self._writer) is None:
+            return
+        self._reader = self._writer = None
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOGGER.debug("ignoring disconnect exception: %s", repr(exc))
+
+    def set_keepalive(self, timeout: float) -> None:
+        if self._writer:
+            sock_set_keepalive(
+                self._writer.get_extra_info("socket"),
+                after_idle_sec=int(timeout),
+                interval_sec=int(timeout),
+                max_fails=3,
+            )
+
+
+class LoopbackTransport(AVRTransport):
+    """In-memory transport that exchanges lines with a peer transport."""
+
+    def __init__(self):
+        self.peer: LoopbackTransport = None
+        self.connected = False
+        self._closed = False
+        self._lines: list[str] = []
+        self._event = asyncio.Event()
+
+    def __repr__(self) -> str:
+        return f"LoopbackTransport(connected={self.connected})"
+
+    @classmethod
+    def create_pair(cls) -> tuple["LoopbackTransport", "LoopbackTransport"]:
+        """Create a pair of connected transports for a client and a device."""
+        client, device = cls(), cls()
+        client.peer, device.peer = device, client
+        return client, device
+
+    async def connect(self) -> None:
+        if self.peer is None:
+            raise ConnectionRefusedError("loopback transport has no peer")
+        self._lines = []
+        self._event.clear()
+        for transport in (self, self.peer):
+            transport.connected = True
+            transport._closed = False  # pylint: disable=protected-access
+
+    async def write_lines(self, lines: list[str]) -> None:
+        if not self.connected:
+            raise ConnectionResetError("loopback transport closed")
+        self.peer._lines.extend(lines)  # pylint: disable=protected-access
+        self.peer._event.set()  # pylint: disable=protected-access
+
+    async def read_lines(self) -> list[str]:
+        while not self._lines:
+            if self._closed:
+                raise EOFError
+            await self._event.wait()
+            self._event.clear()
+        lines, self._lines = self._lines, []
+        return lines
+
+    async def close(self) -> None:
+        for transport in (self, self.peer):
+            if transport is not None:
+                transport.connected = False
+                transport._closed = True  # pylint: disable=protected-access
+                transport._event.set()  # pylint: disable=protected-access
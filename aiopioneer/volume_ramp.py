@@ -0,0 +1,91 @@
+"""aiopioneer timed volume ramp."""
+
+import asyncio
+import math
+import time
+
+from collections.abc import Callable
+
+from .const import Zone, VolumeRampCurve
+
+## Curve functions and their inverses, mapping ramp progress to volume progress
+RAMP_CURVES: dict[
+    VolumeRampCurve, tuple[Callable[[float], float], Callable[[float], float]]
+] = {
+    VolumeRampCurve.LINEAR: (lambda x: x, lambda y: y),
+    VolumeRampCurve.EASE_IN: (lambda x: x * x, math.sqrt),
+    VolumeRampCurve.EASE_OUT: (
+        lambda x: 1 - (1 - x) ** 2,
+        lambda y: 1 - math.sqrt(1 - y),
+    ),
+    VolumeRampCurve.EASE_IN_OUT: (
+        lambda x: (1 - math.cos(math.pi * x)) / 2,
+        lambda y: math.acos(1 - 2 * y) / math.pi,
+    ),
+}
+
+
+class VolumeRamp:
+    """Volume ramp from a start volume to a target volume over a duration."""
+
+    def __init__(
+        self,
+        zone: Zone,
+        start_volume: int,
+        target_volume: int,
+        duration: float,
+        curve: VolumeRampCurve = VolumeRampCurve.LINEAR,
+        start_time: float = None,
+    ):
+        if duration < 0:
+            raise ValueError(f"invalid volume ramp duration {duration}")
+        self.zone = zone
+        self.start_volume = start_volume
+        self.target_volume = target_volume
+        self.duration = duration
+        self.curve = VolumeRampCurve(curve)
+        self.start_time = time.monotonic() if start_time is None else start_time
+        self.last_volume = start_volume  ## volume after last ramp step
+        self.finished = asyncio.Event()
+
+    def __repr__(self) -> str:
+        return (
+            f"VolumeRamp(zone={self.zone}, {self.start_volume} -> "
+            f"{self.target_volume}, duration={self.duration}, curve={self.curve})"
+        )
+
+    def get_volume(self, now: float = None) -> int:
+        """Get ramp volume at a point in time."""
+        if now is None:
+            now = time.monotonic()
+        if self.duration <= 0 or now >= self.start_time + self.duration:
+            return self.target_volume
+        progress = max(0.0, (now - self.start_time) / self.duration)
+        curve, _ = RAMP_CURVES[self.curve]
+        volume_range = self.target_volume - self.start_volume
+        return self.start_volume + round(volume_range * curve(progress))
+
+    def get_schedule(self, min_interval: float) -> list[float]:
+        """
+        Get times at which the ramp volume changes, at least min_interval
+        apart. The last time is always the end of the ramp.
+        """
+        levels = abs(self.target_volume - self.start_volume)
+        if levels == 0 or self.duration <= 0:
+            return [self.start_time + self.duration]
+        _, curve_inverse = RAMP_CURVES[self.curve]
+        schedule = []
+        last_time = None
+        for level in range(1, levels):
+            ## Time at which the ramp volume reaches the next level
+            ramp_time = self.start_time + self.duration * curve_inverse(
+                level / levels
+            )
+            if last_time is None or ramp_time - last_time >= min_interval:
+                schedule.append(ramp_time)
+                last_time = ramp_time
+        end_time = self.start_time + self.duration
+        if schedule and end_time - schedule[-1] < min_interval:
+            schedule.pop()
+        schedule.append(end_time)
+        return schedule
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Measure aiopioneer import time and first property registry build time.
+
+Run from any directory: python benchmarks/import_time.py [runs]
+"""
+
+import pathlib
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+
+MEASURE = """
+import time
+start = time.perf_counter()
+import aiopioneer
+imported = time.perf_counter()
+from aiopioneer.property_registry import get_property_registry
+get_property_registry()
+built = time.perf_counter()
+print(imported - start, built - imported)
+"""
+
+
+def main(runs: int = 10) -> None:
+    """Measure in fresh interpreters and report median times."""
+    import_times, build_times = [], []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", MEASURE],
+            cwd=ROOT_DIR,  ## import aiopioneer from this repository
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        import_time, build_time = (float(t) for t in output.split())
+        import_times.append(import_time)
+        build_times.append(build_time)
+    print(f"import aiopioneer:     {statistics.median(import_times) * 1000:.1f}ms")
+    print(f"first registry build: {statistics.median(build_times) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
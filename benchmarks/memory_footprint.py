@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Measure per-instance memory footprint of AVRParams and AVRProperties.
+
+Run from any directory: python benchmarks/memory_footprint.py [instances]
+"""
+
+import pathlib
+import sys
+import tracemalloc
+
+from collections.abc import Callable
+from typing import Any
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from aiopioneer.const import Zone
+from aiopioneer.decode import process_raw_responses
+from aiopioneer.params import AVRParams, PARAM_MODEL
+from aiopioneer.properties import AVRProperties
+
+MODEL = "VSX-930"
+RESPONSES = [
+    "PWR0",
+    "VOL121",
+    "MUT1",
+    "FN19",
+    "SR0005",
+    "LM0401",
+    "FL0000574F524C4420202020202020",
+    "CLVL__050",
+    "CLVR__050",
+    "FRF09950",
+]
+
+
+def create_params() -> AVRParams:
+    """Create params for an AVR model."""
+    return AVRParams({PARAM_MODEL: MODEL})
+
+
+def create_properties() -> AVRProperties:
+    """Create properties with zones and listening modes populated."""
+    properties = AVRProperties(create_params())
+    properties.set_property("zones", {Zone.Z1, Zone.Z2})
+    properties.update_listening_modes()
+    return properties
+
+
+def create_decoded_properties() -> AVRProperties:
+    """Create properties with typical AVR responses decoded."""
+    return process_raw_responses(RESPONSES, properties=create_properties()).properties
+
+
+def measure(create: Callable[[], Any], instances: int) -> float:
+    """Return memory allocated per instance in bytes."""
+    create()  ## populate shared tables and import-time caches
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [create() for _ in range(instances)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    exclude = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = after.filter_traces(exclude).compare_to(before, "filename")
+    allocated = sum(stat.size_diff for stat in stats)
+    del objects
+    return allocated / instances
+
+
+def main(instances: int = 50) -> None:
+    """Measure params and properties instances."""
+    print(f"instances:                      {instances}")
+    for name, create in [
+        ("AVRParams", create_params),
+        ("AVRProperties (with params)", create_properties),
+        ("AVRProperties (decoded)", create_decoded_properties),
+    ]:
+        size = measure(create, instances)
+        print(f"per instance, {name + ':':<28} {size / 1024:.1f}KB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -63,7 +63,7 @@ async def main(argv):
     # await pioneer.disconnect()
 
     while True:
-        for prop, value in vars(pioneer.properties).items():
+        for prop, value in pioneer.properties.get_snapshot().items():
             print(prop, ":", value)
 
         await asyncio.sleep(60)
@@ -0,0 +1 @@
+"""aiopioneer tests."""
@@ -0,0 +1,177 @@
+"""Shared fixtures for aiopioneer tests."""
+
+import asyncio
+
+from collections.abc import Callable
+
+import pytest
+
+from aiopioneer.command_queue import CommandItem
+from aiopioneer.const import Zone
+from aiopioneer.decode import process_raw_response
+from aiopioneer.params import AVRParams
+from aiopioneer.pioneer_avr import PioneerAVR
+from aiopioneer.properties import AVRProperties
+from aiopioneer.transport import LoopbackTransport
+
+## Representative AVR responses covering the main decoder families
+RESPONSES = [
+    "PWR0",
+    "APR0",
+    "VOL121",
+    "ZV45",
+    "MUT1",
+    "FN19",
+    "Z2F04",
+    "RGB190HDMI1",
+    "RGB041DVD",
+    "SR0005",
+    "AST0502111111111000000000000000111111110000000000020240000000",
+    "VST40921201092120091000000912000000911000000000009110",
+    "FRF09950",
+    "PRA01",
+    "FRA00531",
+    "FL000048454C4C4F20202020202020",
+    "CLVL__050",
+    "CLVALL055",
+    "TO1",
+    "BA06",
+    "TR04",
+    "SPK1",
+    "SAA1",
+    "SUQ0",
+    'SSI"1.234"',
+    "RGD<VSX-930/ABC>",
+    "SVB0123456789AB",
+    "MC1",
+    "IS1",
+    "ATA1",
+    "SSL1",
+    "VTC06",
+]
+
+
+## Responses of the emulated AVR to queries
+DEVICE_RESPONSES = {
+    "?RGD": "RGD<VSX-930/KUXJ>",
+    "?P": "PWR0",
+    "?V": "VOL050",
+    "?M": "MUT1",
+    "?F": "FN04",
+}
+
+
+class LoopbackDevice:
+    """Emulated AVR answering commands over a loopback transport."""
+
+    def __init__(
+        self,
+        transport: LoopbackTransport,
+        responses: dict[str, str] = None,
+        handler: Callable[[str], list[str] | None] = None,
+    ):
+        self.transport = transport
+        self.responses = DEVICE_RESPONSES | (responses or {})
+        self.handler = handler
+        self.received: list[str] = []
+        self.silent = False  ## do not respond to commands
+        self.disconnects = 0
+        self.task: asyncio.Task = None
+
+    def respond(self, command: str) -> list[str]:
+        """Get responses to a command."""
+        if self.handler and (responses := self.handler(command)) is not None:
+            return responses
+        if command in self.responses:
+            return [self.responses[command]]
+        if command.startswith("?"):
+            return ["E04"]
+        return []
+
+    async def run(self) -> None:
+        """Answer commands until cancelled, waiting for reconnection."""
+        while True:
+            try:
+                commands = await self.transport.read_lines()
+            except EOFError:
+                self.disconnects += 1
+                while not self.transport.connected:
+                    await asyncio.sleep(0.01)
+                continue
+            responses = []
+            for command in commands:
+                self.received.append(command)
+                if not self.silent:
+                    responses.extend(self.respond(command))
+            if responses:
+                await self.transport.write_lines(responses)
+
+
+async def create_loopback_avr(
+    params: dict = None, timeout: float = 1.0, reconnect: bool = False, **kwargs
+) -> tuple[PioneerAVR, LoopbackDevice]:
+    """Create an AVR connected to an emulated device over a loopback transport."""
+    client, transport = LoopbackTransport.create_pair()
+    device = LoopbackDevice(transport, **kwargs)
+    avr = PioneerAVR(
+        "loopback",
+        timeout=timeout,
+        scan_interval=0,
+        params={"ignored_zones": ["2", "3", "Z"]} | (params or {}),
+        transport=client,
+    )
+    device.task = asyncio.create_task(device.run())
+    await avr.connect(reconnect=reconnect)
+    return avr, device
+
+
+async def shutdown_loopback_avr(avr: PioneerAVR, device: LoopbackDevice) -> None:
+    """Shut down an AVR and its emulated device."""
+    await avr.shutdown()
+    device.task.cancel()
+    await asyncio.gather(device.task, return_exceptions=True)
+
+
+class DecodeHarness:
+    """Decode raw responses into AVR properties outside a connection."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.params = AVRParams()
+        self.properties = AVRProperties(self.params)
+
+        async def execute(command_item: CommandItem) -> None:
+            pass
+
+        self.properties.command_queue.register_execute_callback(execute)
+        self.properties.set_property("zones", {Zone.Z1, Zone.Z2})
+        self.properties.update_listening_modes()
+
+    def decode(self, responses: list[str], repeat: int = 1) -> None:
+        """Decode responses repeat times, discarding queued commands."""
+
+        async def decode_responses() -> None:
+            for _ in range(repeat):
+                for response in responses:
+                    process_raw_response(response, self.params, self.properties)
+                    self.properties.command_queue.purge()
+            await asyncio.sleep(0)  ## let command queue task complete
+
+        self.loop.run_until_complete(decode_responses())
+
+
+async def create_harness(loop: asyncio.AbstractEventLoop) -> DecodeHarness:
+    """Create a decode harness within the event loop."""
+    return DecodeHarness(loop)
+
+
+@pytest.fixture
+def harness():
+    """Provide a decode harness running within an event loop."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        yield loop.run_until_complete(create_harness(loop))
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
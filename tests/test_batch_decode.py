@@ -0,0 +1,81 @@
+"""Tests for batch decoding of raw response logs."""
+
+from aiopioneer.const import Zone
+from aiopioneer.decode import process_raw_response, process_raw_responses
+from aiopioneer.exceptions import AVRResponseDecodeError
+from aiopioneer.params import AVRParams
+from aiopioneer.properties import AVRProperties
+
+from .conftest import RESPONSES, DecodeHarness
+
+AST_STEREO = "AST0502000111111000000000000000111111110000000000020240000000"
+TRANSCRIPT = RESPONSES + ["PWR0", "SR0006", AST_STEREO, "", "SR0100", "XYZ", "PWR2"]
+
+
+def create_properties() -> AVRProperties:
+    """Create properties with the zones and listening modes of the harness."""
+    properties = AVRProperties(AVRParams())
+    properties.set_property("zones", {Zone.Z1, Zone.Z2})
+    properties.update_listening_modes()
+    return properties
+
+
+def decode_per_line(
+    harness: DecodeHarness, raw_responses: list[str]
+) -> tuple[list[str], list[str]]:
+    """Decode each line as the AVR does, return AVR commands and failed lines."""
+    properties = harness.properties
+    avr_commands = []
+    errors = []
+
+    async def decode_responses() -> None:
+        for raw_resp in raw_responses:
+            if not raw_resp:
+                continue
+            try:
+                process_raw_response(raw_resp, harness.params, properties)
+            except AVRResponseDecodeError:
+                errors.append(raw_resp)
+            for command_item in list(properties.command_queue):
+                if command_item.command == "_update_listening_modes":
+                    properties.update_listening_modes()
+                else:
+                    avr_commands.append(command_item.command)
+            properties.command_queue.purge()
+
+    harness.loop.run_until_complete(decode_responses())
+    return avr_commands, errors
+
+
+def test_batch_decode_matches_per_line_decode(harness: DecodeHarness):
+    """Batch decode produces the same properties as decoding line by line."""
+    batch = process_raw_responses(TRANSCRIPT, properties=create_properties())
+    avr_commands, errors = decode_per_line(harness, TRANSCRIPT)
+    expected = harness.properties
+
+    assert batch.line_count == len(TRANSCRIPT)
+    assert batch.properties.get_snapshot() == expected.get_snapshot()
+    assert batch.properties.listening_modes_all == expected.listening_modes_all
+    assert (
+        batch.properties.available_listening_modes
+        == expected.available_listening_modes
+    )
+    assert [item.command for _, item in batch.queue_commands] == avr_commands
+    assert "_update_listening_modes" not in avr_commands
+    assert errors == ["SR0100"] and len(batch.errors) == 1  ## unknown mode
+
+
+def test_batch_decode_updates_listening_modes():
+    """Listening modes are updated when input multichannel changes mid batch."""
+    batch = process_raw_responses(RESPONSES[:10])  ## before AST
+    modes = dict(batch.properties.available_listening_modes)
+    batch.extend([RESPONSES[10]])
+    assert batch.properties.audio["input_multichannel"] is True
+    multichannel_modes = dict(batch.properties.available_listening_modes)
+    assert multichannel_modes != modes
+    batch.extend([AST_STEREO])
+    assert batch.properties.audio["input_multichannel"] is False
+    assert batch.properties.available_listening_modes != multichannel_modes
+    assert not any(
+        item.command.startswith("_update") for _, item in batch.queue_commands
+    )
@@ -0,0 +1,127 @@
+"""Tests for learning query commands unsupported by the AVR."""
+
+import asyncio
+import time
+
+from aiopioneer import connection
+from aiopioneer.const import Zone
+from aiopioneer.params import (
+    PARAM_COMMAND_DELAY,
+    PARAM_ENABLED_FUNCTIONS,
+    PARAM_UNSUPPORTED_COMMAND_FAILURES,
+    PARAM_UNSUPPORTED_COMMAND_REPROBE_INTERVAL,
+)
+from aiopioneer.pioneer_avr import PioneerAVR
+
+from .conftest import LoopbackDevice, create_loopback_avr, shutdown_loopback_avr
+
+TONE_QUERIES = ["?TO", "?BA", "?TR"]
+CAPABILITY_PARAMS = {
+    PARAM_COMMAND_DELAY: 0,
+    PARAM_ENABLED_FUNCTIONS: ["basic", "tone"],
+    PARAM_UNSUPPORTED_COMMAND_FAILURES: 2,
+}
+
+
+class ToneDevice:
+    """Emulated AVR that supports tone controls once enabled."""
+
+    def __init__(self):
+        self.supported = False
+
+    def handler(self, command: str) -> list[str] | None:
+        """Respond to tone queries."""
+        if command == "?F":
+            return ["E04"]  ## source response triggers a delayed query
+        if command not in TONE_QUERIES:
+            return None
+        if not self.supported:
+            return ["E04"]
+        return [{"?TO": "TO1", "?BA": "BA06", "?TR": "TR04"}[command]]
+
+
+async def refresh_tone_queries(avr: PioneerAVR, device: LoopbackDevice) -> list[str]:
+    """Refresh main zone, return tone queries sent."""
+    received = len(device.received)
+    await avr.refresh(zones=[Zone.Z1])
+    return [c for c in device.received[received:] if c in TONE_QUERIES]
+
+
+async def reconnect_tone_queries(
+    avr: PioneerAVR, device: LoopbackDevice
+) -> list[str]:
+    """Drop the connection, return tone queries sent on reconnect refresh."""
+    received = len(device.received)
+    await avr.disconnect()
+    async with asyncio.timeout(2.0):
+        while not avr.available:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)  ## let reconnect refresh be queued
+        await avr.properties.command_queue.wait()
+    return [c for c in device.received[received:] if c in TONE_QUERIES]
+
+
+def test_unsupported_query_skipped_and_reprobed(monkeypatch):
+    """Unsupported queries are skipped across reconnects until re-probed."""
+    monkeypatch.setattr(connection, "get_backoff_delay", lambda retry: 0.05)
+
+    async def run_refreshes() -> None:
+        tone_device = ToneDevice()
+        avr, device = await create_loopback_avr(
+            params=CAPABILITY_PARAMS | {PARAM_UNSUPPORTED_COMMAND_REPROBE_INTERVAL: 1},
+            handler=tone_device.handler,
+            reconnect=True,
+        )
+        capabilities = avr.properties.capabilities
+        try:
+            await avr.query_zones()
+            assert await refresh_tone_queries(avr, device) == TONE_QUERIES
+            assert not capabilities.is_unsupported("query_tone_status", Zone.Z1)
+            assert await refresh_tone_queries(avr, device) == TONE_QUERIES
+            last_failed = time.time()
+            assert capabilities.is_unsupported("query_tone_status", Zone.Z1)
+            assert await refresh_tone_queries(avr, device) == []
+            assert await reconnect_tone_queries(avr, device) == []
+            assert device.disconnects == 1
+
+            tone_device.supported = True
+            await asyncio.sleep(max(0, last_failed + 1 - time.time()))
+            assert await reconnect_tone_queries(avr, device) == TONE_QUERIES
+            assert avr.properties.tone[Zone.Z1]["status"] == "on"
+            commands = capabilities.get_unsupported_commands()["commands"]
+            assert not [c for c, *_ in commands if c.startswith("query_tone")]
+            assert await refresh_tone_queries(avr, device) == TONE_QUERIES
+        finally:
+            await shutdown_loopback_avr(avr, device)
+
+    asyncio.run(run_refreshes())
+
+
+def test_unsupported_queries_restored_for_model():
+    """Persisted unsupported queries are only restored for the same model."""
+
+    async def run_refreshes(unsupported: dict = None, model: str = None) -> tuple:
+        responses = {"?RGD": f"RGD<{model}/KUXJ>"} if model else {}
+        avr, device = await create_loopback_avr(
+            params=CAPABILITY_PARAMS,
+            handler=ToneDevice().handler,
+            responses=responses,
+        )
+        try:
+            if unsupported is not None:
+                avr.properties.capabilities.set_unsupported_commands(unsupported)
+            await avr.query_zones()
+            tone_queries = await refresh_tone_queries(avr, device)
+            if unsupported is None:
+                await refresh_tone_queries(avr, device)
+            return tone_queries, avr.properties.capabilities.get_unsupported_commands()
+        finally:
+            await shutdown_loopback_avr(avr, device)
+
+    tone_queries, unsupported = asyncio.run(run_refreshes())
+    assert tone_queries == TONE_QUERIES
+    assert unsupported["model"] == "VSX-930"
+    tone_queries, _ = asyncio.run(run_refreshes(unsupported))
+    assert tone_queries == []
+    tone_queries, _ = asyncio.run(run_refreshes(unsupported, model="VSX-1131"))
+    assert tone_queries == TONE_QUERIES
@@ -0,0 +1,38 @@
+"""Tests for memoised code map class factories."""
+
+from aiopioneer.decoders.audio import AudioChannelActive
+from aiopioneer.decoders.code_map import CodeMapBase, CodeMapBlank, CodeMapQuery
+from aiopioneer.decoders.tuner import TunerFMFrequency
+
+from .conftest import RESPONSES
+
+
+def _count_subclasses(cls: type) -> int:
+    """Count all subclasses of a class."""
+    return sum(1 + _count_subclasses(subclass) for subclass in cls.__subclasses__())
+
+
+def test_factories_return_same_class():
+    """Factories return the same class for the same arguments."""
+    assert CodeMapBlank(3) is CodeMapBlank(3)
+    assert CodeMapBlank(3) is not CodeMapBlank(4)
+    assert CodeMapQuery(TunerFMFrequency) is CodeMapQuery(TunerFMFrequency)
+    assert AudioChannelActive("input", "L") is AudioChannelActive("input", "L")
+
+
+def test_repeated_decodes_do_not_create_classes(harness):
+    """Decoding the same responses repeatedly creates no new code map classes."""
+    harness.decode(RESPONSES)
+    counts = (
+        len(CodeMapBlank._blank_classes),  # pylint: disable=protected-access
+        len(CodeMapQuery._query_classes),  # pylint: disable=protected-access
+        len(AudioChannelActive._channel_classes),  # pylint: disable=protected-access
+        _count_subclasses(CodeMapBase),
+    )
+    harness.decode(RESPONSES, repeat=20)
+    assert counts == (
+        len(CodeMapBlank._blank_classes),  # pylint: disable=protected-access
+        len(CodeMapQuery._query_classes),  # pylint: disable=protected-access
+        len(AudioChannelActive._channel_classes),  # pylint: disable=protected-access
+        _count_subclasses(CodeMapBase),
+    )
@@ -0,0 +1,116 @@
+"""Tests for compiled code map sequence decode plans."""
+
+import pytest
+
+from aiopioneer.decoders.code_map import CodeMapBase, CodeMapBlank, CodeMapSequence
+from aiopioneer.decoders.response import Response
+from aiopioneer.decoders.system import MCACCDiagnosticStatus
+from aiopioneer.params import AVRParams
+from aiopioneer.properties import AVRProperties
+from aiopioneer.property_registry import get_property_registry
+
+from .conftest import RESPONSES
+
+SEQUENCE_RESPONSES = [
+    response
+    for response in RESPONSES
+    if response.startswith(("AST", "VST", "CLV", "FR"))
+] + [
+    "AST0502000111111000000000000000111111110000000000020240000000",
+    "AST05021",  ## short code
+    "VST1",  ## short code
+    "CLVC__045",
+    "SSJ0307010",
+    "SSJ03070100000002",  ## error anchored to end of code
+    "SSJ031",  ## short code
+    "SUU0110120510",
+    "SUU01",  ## short code
+]
+
+
+def decode_response_sliced(
+    cls,
+    response: Response,
+    params: AVRParams,
+    code_map_sequence: list[type[CodeMapBase]] = None,
+) -> list[Response]:
+    """Decode a response with code map sequence by slicing on every decode."""
+    cls.set_response_properties(response)
+    code_index = 0
+    responses = []
+    if code_map_sequence is None:
+        code_map_sequence = cls.code_map_sequence
+
+    for child_map in code_map_sequence:
+        child_len = child_map.get_len()
+        if issubclass(child_map, CodeMapBlank):
+            if child_len < 0:
+                code_index = len(response.code)
+            code_index += child_len
+            continue
+        child_code = response.code[code_index : code_index + child_len]
+        child_response = response.clone(code=child_code)
+        responses.extend(
+            child_map.decode_response(response=child_response, params=params)
+        )
+        code_index += child_len
+
+    return responses
+
+
+def decode(raw_resp: str) -> list[tuple] | type[Exception]:
+    """Decode a raw response and return response attributes or exception type."""
+    params = AVRParams()
+    properties = AVRProperties(params)
+    response_cmd, code_map, zone = get_property_registry().match_response(raw_resp)
+    assert issubclass(code_map, CodeMapSequence)
+    try:
+        responses = code_map.decode_response(
+            response=Response(
+                properties=properties,
+                code=raw_resp[len(response_cmd) :],
+                response_command=response_cmd,
+                zone=zone,
+            ),
+            params=params,
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        return type(exc)
+    return [
+        (
+            response.code,
+            response.response_command,
+            response.base_property,
+            response.property_name,
+            response.zone,
+            response.value,
+            response.update_zones,
+            response.queue_commands,
+            response.callback and response.callback.__qualname__,
+        )
+        for response in responses
+    ]
+
+
+@pytest.mark.parametrize("raw_resp", SEQUENCE_RESPONSES)
+def test_sequence_plan_matches_slicing(monkeypatch, raw_resp: str):
+    """Compiled sequence plans decode the same responses as slicing each time."""
+    planned = decode(raw_resp)
+    monkeypatch.setattr(
+        CodeMapSequence,
+        "decode_response_sequence",
+        classmethod(decode_response_sliced),
+    )
+    assert planned == decode(raw_resp)
+
+
+def test_sequence_plan_anchors_to_end():
+    """Fields after a negative length blank are offset from the end of the code."""
+    plan = MCACCDiagnosticStatus.get_sequence_plan()
+    assert [(start, end, from_end) for start, end, from_end, _, _ in plan] == [
+        (0, 2, False),
+        (2, 4, False),
+        (5, 6, False),
+        (-1, 0, True),
+    ]
+    assert MCACCDiagnosticStatus.get_sequence_plan() is plan
@@ -0,0 +1,166 @@
+"""Tests for AVR discovery against local stand-in servers."""
+
+import asyncio
+import time
+
+from aiopioneer import discovery
+from aiopioneer.discovery import DiscoveredAVR, discover_avrs, probe_avr
+
+AVR_RESPONSES = {
+    b"?RGD": b"RGD<VSX-930/KUXJ>",
+    b"?SVB": b"SVB0009B0123456",
+    b"?SSI": b'SSI"1-5-3-00"',
+}
+SLOW_RESPONSE_DELAY = 0.15
+PROBE_TIMEOUT = 0.5
+
+
+async def _avr_handler(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, delay: float = 0
+):
+    try:
+        while command := (await reader.readuntil(b"\r")).strip():
+            await asyncio.sleep(delay)
+            writer.write(AVR_RESPONSES.get(command, b"E04") + b"\r\n")
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+
+
+async def _slow_avr_handler(reader, writer: asyncio.StreamWriter):
+    await _avr_handler(reader, writer, delay=SLOW_RESPONSE_DELAY)
+
+
+async def _silent_handler(reader: asyncio.StreamReader, _writer):
+    try:
+        await reader.read()  ## accept commands until closed, never respond
+    except ConnectionError:
+        pass
+
+
+async def _garbage_handler(_reader, writer: asyncio.StreamWriter):
+    writer.write(b"X" * 200000)  ## line longer than stream limit
+    await writer.drain()
+
+
+async def _start_server(
+    handler, host: str = "127.0.0.1", port: int = 0
+) -> tuple[asyncio.Server, int]:
+    server = await asyncio.start_server(handler, host, port)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def _discover_network(
+    concurrency: int, monkeypatch
+) -> tuple[list[tuple[DiscoveredAVR, float]], int, int, int]:
+    """
+    Discover AVRs on stand-in servers on 127.0.0.1-6, return AVRs with time
+    found, the two ports probed and the maximum number of concurrent probes.
+    """
+    active = max_active = 0
+
+    async def counting_probe_avr(*args, **kwargs) -> DiscoveredAVR | None:
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        try:
+            return await probe_avr(*args, **kwargs)
+        finally:
+            active -= 1
+
+    monkeypatch.setattr(discovery, "probe_avr", counting_probe_avr)
+    server, port = await _start_server(_avr_handler)
+    servers = [server]
+    for host, handler in [
+        ("127.0.0.2", _slow_avr_handler),
+        ("127.0.0.3", _silent_handler),
+        ## no server on 127.0.0.4
+        ("127.0.0.5", _avr_handler),
+        ("127.0.0.6", _silent_handler),
+    ]:
+        servers.append((await _start_server(handler, host, port))[0])
+    server, alt_port = await _start_server(_avr_handler, "127.0.0.3")
+    servers.append(server)
+
+    start = time.monotonic()
+    avrs = []
+    try:
+        async for avr in discover_avrs(
+            "127.0.0.0/29",
+            ports=[port, alt_port],
+            timeout=PROBE_TIMEOUT,
+            concurrency=concurrency,
+        ):
+            avrs.append((avr, time.monotonic() - start))
+    finally:
+        for server in servers:
+            server.close()
+            await server.wait_closed()
+    return avrs, port, alt_port, max_active
+
+
+def test_discover_avr():
+    """AVR model, MAC address and software version are discovered."""
+
+    async def discover():
+        server, port = await _start_server(_avr_handler)
+        async with server:
+            return [
+                avr
+                async for avr in discover_avrs("127.0.0.1/32", ports=[port])
+            ], port
+
+    avrs, port = asyncio.run(discover())
+    assert len(avrs) == 1
+    avr = avrs[0]
+    assert (avr.host, avr.port) == ("127.0.0.1", port)
+    assert avr.model == "VSX-930"
+    assert avr.mac_addr == "00:09:B0:12:34:56"
+    assert avr.software_version == "1-5-3-00"
+    assert avr.info == {}
+
+
+def test_discover_network_streams_results(monkeypatch):
+    """AVRs are yielded as found, skipping silent and absent hosts."""
+    avrs, port, alt_port, max_active = asyncio.run(
+        _discover_network(concurrency=4, monkeypatch=monkeypatch)
+    )
+    found = {(avr.host, avr.port): elapsed for avr, elapsed in avrs}
+    assert set(found) == {
+        ("127.0.0.1", port),
+        ("127.0.0.2", port),
+        ("127.0.0.3", alt_port),  ## silent on first port
+        ("127.0.0.5", port),
+    }
+    assert all(avr.model == "VSX-930" for avr, _ in avrs)
+    slow_probe_time = 3 * SLOW_RESPONSE_DELAY
+    assert found[("127.0.0.1", port)] < slow_probe_time  ## not held back
+    assert found[("127.0.0.2", port)] >= slow_probe_time
+    assert found[("127.0.0.3", alt_port)] >= PROBE_TIMEOUT
+    assert max_active == 4
+
+
+def test_discover_network_concurrency(monkeypatch):
+    """No more than concurrency hosts are probed at a time."""
+    for concurrency in [1, 2]:
+        avrs, _, _, max_active = asyncio.run(
+            _discover_network(concurrency=concurrency, monkeypatch=monkeypatch)
+        )
+        assert len(avrs) == 4
+        assert max_active == concurrency
+        if concurrency == 1:  ## hosts probed in turn
+            hosts = [avr.host for avr, _ in avrs]
+            assert hosts == ["127.0.0.1", "127.0.0.2", "127.0.0.3", "127.0.0.5"]
+
+
+def test_probe_invalid_responses(caplog):
+    """Hosts sending overlong lines are logged and not reported."""
+
+    async def probe():
+        server, port = await _start_server(_garbage_handler)
+        async with server:
+            return await probe_avr("127.0.0.1", port, timeout=2.0)
+
+    with caplog.at_level("INFO", logger="aiopioneer.discovery"):
+        assert asyncio.run(probe()) is None
+    assert "invalid response from 127.0.0.1" in caplog.text
@@ -0,0 +1,72 @@
+"""Tests for connection health monitoring."""
+
+import asyncio
+
+from aiopioneer import connection
+from aiopioneer.params import (
+    PARAM_HEALTH_CHECK_IDLE_TIME,
+    PARAM_HEALTH_CHECK_MISSED_PROBES,
+)
+
+from .conftest import create_loopback_avr, shutdown_loopback_avr
+
+HEALTH_PARAMS = {
+    PARAM_HEALTH_CHECK_IDLE_TIME: 0.1,
+    PARAM_HEALTH_CHECK_MISSED_PROBES: 2,
+    "command_delay": 0,
+}
+
+
+async def wait_until(condition, timeout: float = 2.0) -> None:
+    """Wait until a condition is true."""
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+def test_silent_link_reconnected(monkeypatch):
+    """A link that stops responding is disconnected and reconnected."""
+    monkeypatch.setattr(connection, "get_backoff_delay", lambda retry: 0.05)
+
+    async def run_silent_link() -> None:
+        avr, device = await create_loopback_avr(
+            params=HEALTH_PARAMS, timeout=0.2, reconnect=True
+        )
+        health = avr.health
+        try:
+            await asyncio.sleep(0.15)
+            assert health.probes >= 1 and health.probe_failures == 0
+            device.silent = True
+            await wait_until(lambda: not avr.available)
+            assert health.dead_links == 1
+            assert health.probe_failures >= 2
+            assert device.disconnects == 1
+            device.silent = False
+            await wait_until(lambda: avr.available)
+            await asyncio.sleep(0.3)
+            assert avr.available and health.dead_links == 1
+        finally:
+            await shutdown_loopback_avr(avr, device)
+
+    asyncio.run(run_silent_link())
+
+
+def test_traffic_suppresses_probes():
+    """Health probes are only sent when the link is idle."""
+
+    async def run_traffic() -> None:
+        avr, device = await create_loopback_avr(params=HEALTH_PARAMS, timeout=0.2)
+        health = avr.health
+        try:
+            for _ in range(20):
+                await device.transport.write_lines(["VOL050"])
+                await asyncio.sleep(0.03)
+            assert health.probes == 0 and "?P" not in device.received
+
+            await wait_until(lambda: health.rtt.count >= 2)
+            assert health.probe_failures == 0 and health.missed_probes == 0
+            assert avr.available
+        finally:
+            await shutdown_loopback_avr(avr, device)
+
+    asyncio.run(run_traffic())
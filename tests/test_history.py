@@ -0,0 +1,37 @@
+"""Tests for bounded property change history."""
+
+from aiopioneer.const import Zone
+from aiopioneer.history import PropertyHistory
+from aiopioneer.params import AVRParams
+
+
+def _record(history: PropertyHistory, count: int) -> None:
+    for i in range(count):
+        history.record("volume", Zone.Z1, None, i, timestamp=i)
+        history.record("power", Zone.Z1, None, i, timestamp=i + 0.5)
+
+
+def test_history_max_entries_discards_oldest():
+    """Oldest changes across all properties are discarded over max entries."""
+    history = PropertyHistory(
+        AVRParams({"property_history_size": 5, "property_history_max_entries": 8})
+    )
+    _record(history, 6)
+    assert history.get_history("volume", Zone.Z1) == [(t, t) for t in range(2, 6)]
+    assert history.get_history("power", Zone.Z1) == [
+        (t + 0.5, t) for t in range(2, 6)
+    ]
+
+
+def test_history_params_change_resizes_buffers():
+    """Buffers are resized or dropped as soon as retention params change."""
+    params = AVRParams({"property_history_size": 5})
+    history = PropertyHistory(params)
+    _record(history, 6)
+    params.set_user_params(
+        {"property_history_size": 5, "property_history_retention": {"power": 0}}
+    )
+    assert history.get_history("power", Zone.Z1) == []
+    assert history.get_properties() == [("volume", Zone.Z1, None)]
+    params.set_user_params({"property_history_size": 2})
+    assert history.get_history("volume", Zone.Z1) == [(4, 4), (5, 5)]
@@ -0,0 +1,56 @@
+"""Tests for adaptive response timeouts."""
+
+import asyncio
+
+import pytest
+
+from aiopioneer.exceptions import AVRCommandResponseError
+from aiopioneer.latency import CommandLatency
+from aiopioneer.params import AVRParams
+
+from .conftest import create_loopback_avr, shutdown_loopback_avr
+
+
+def test_timeout_adapts_within_bounds():
+    """Timeout follows observed latency, clamped to configured bounds."""
+    latency = CommandLatency(AVRParams(), 2.0)
+    assert latency.get_timeout("VOL") == 2.0
+    for _ in range(10):
+        latency.record("VOL", 0.05)
+        latency.record("RGB", 3.0)
+    assert latency.get_timeout("VOL") == 1.5  ## response_timeout_min
+    assert latency.get_timeout("RGB") == 6.0
+
+
+def test_response_after_timeout_not_sampled():
+    """Responses following a timeout are not used as latency samples."""
+    latency = CommandLatency(AVRParams(), 2.0)
+    for _ in range(10):
+        latency.record("VOL", 0.05)
+    latency.record_timeout("VOL")
+    assert latency.get_timeout("VOL") == 3.0  ## doubled after timeout
+    latency.record("VOL", 0.01)  ## possibly late reply
+    stats = latency.get_stats()["VOL"]
+    assert stats["samples"] == 10
+    assert stats["timeouts"] == 0
+    assert latency.get_timeout("VOL") == 1.5
+
+
+def test_error_responses_not_sampled():
+    """Error responses are counted but not used as latency samples."""
+
+    async def send_requests() -> dict:
+        avr, device = await create_loopback_avr(responses={"?X": "E04"})
+        try:
+            for _ in range(5):
+                with pytest.raises(AVRCommandResponseError):
+                    await avr.send_raw_request("?X", "XXX")
+                await avr.send_raw_request("?V", "VOL")
+            return avr.latency.get_stats()
+        finally:
+            await shutdown_loopback_avr(avr, device)
+
+    stats = asyncio.run(send_requests())
+    assert stats["XXX"]["samples"] == 0 and stats["XXX"]["errors"] == 5
+    assert stats["XXX"]["timeout"] == 1.0  ## AVR timeout
+    assert stats["VOL"]["samples"] == 5 and stats["VOL"]["errors"] == 0
@@ -0,0 +1,26 @@
+"""Tests for deferred property registry construction."""
+
+import subprocess
+import sys
+
+CHECK_IMPORT = """
+import sys
+import aiopioneer
+from aiopioneer import property_registry
+assert property_registry._PROPERTY_REGISTRY is None, "registry built at import"
+assert "aiopioneer.decoders.dsp" not in sys.modules, "decoders imported at import"
+registry = property_registry.PROPERTY_REGISTRY
+assert property_registry._PROPERTY_REGISTRY is registry
+assert registry.get_command("query_power", aiopioneer.const.Zone.Z1)
+"""
+
+
+def test_registry_not_built_at_import():
+    """Importing aiopioneer does not build the registry or import decoders."""
+    result = subprocess.run(
+        [sys.executable, "-c", CHECK_IMPORT],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,119 @@
+"""Tests for layered AVR params."""
+
+import pytest
+
+from aiopioneer.params import (
+    AVRParams,
+    PARAM_DEFAULTS,
+    PARAM_MODEL_DEFAULTS,
+    PARAM_MODEL,
+    PARAM_COMMAND_DELAY,
+    PARAM_MAX_VOLUME,
+    PARAM_ZONE_2_SOURCES,
+    PARAM_EXTRA_LISTENING_MODES,
+    PARAM_SPEAKER_SYSTEM_MODES,
+    PARAM_MHL_SOURCE,
+    PARAM_RETRY_POLICY,
+)
+
+
+def test_param_layers():
+    """User params override model params, which override defaults."""
+    params = AVRParams({PARAM_MODEL: "VSX-930"})
+    vsx930_params = PARAM_MODEL_DEFAULTS[r"^VSX-930"]
+    assert params.get_param(PARAM_MAX_VOLUME) == PARAM_DEFAULTS[PARAM_MAX_VOLUME]
+    assert (
+        params.get_param(PARAM_EXTRA_LISTENING_MODES)
+        == vsx930_params[PARAM_EXTRA_LISTENING_MODES]
+    )
+
+    params.set_user_params({PARAM_EXTRA_LISTENING_MODES: {1: ["TEST", True, True]}})
+    assert params.get_param(PARAM_EXTRA_LISTENING_MODES) == {1: ("TEST", True, True)}
+    params.set_user_params({})
+    assert (
+        params.get_param(PARAM_EXTRA_LISTENING_MODES)
+        == vsx930_params[PARAM_EXTRA_LISTENING_MODES]
+    )
+
+    params.set_default_params_model("unknown")
+    assert params.get_param(PARAM_EXTRA_LISTENING_MODES) == {}
+    assert params.default_params == PARAM_DEFAULTS
+    assert params.params_all == PARAM_DEFAULTS
+
+
+def test_param_override_none():
+    """None overrides scalar params but not dict params."""
+    params = AVRParams({PARAM_MODEL: "SC-LX57"})
+    assert params.get_param(PARAM_MHL_SOURCE) == 23
+    modes = params.get_param(PARAM_SPEAKER_SYSTEM_MODES)
+    params.set_user_params({PARAM_MHL_SOURCE: None, PARAM_SPEAKER_SYSTEM_MODES: None})
+    assert PARAM_MHL_SOURCE in params.params_all
+    assert params.get_param(PARAM_MHL_SOURCE) is None
+    assert params.get_param(PARAM_SPEAKER_SYSTEM_MODES) == modes
+
+
+def test_param_values_read_only():
+    """Returned params are read-only and do not copy the parameter layers."""
+    params = AVRParams()
+    with pytest.raises(AttributeError):
+        params.get_param(PARAM_ZONE_2_SOURCES).append(98)
+    with pytest.raises(TypeError):
+        params.get_param(PARAM_RETRY_POLICY)["E02"]["delay"] = 0
+    for params_view in [params.params_all, params.default_params, params.user_params]:
+        with pytest.raises(TypeError):
+            params_view[PARAM_MAX_VOLUME] = 0
+    default_sources = PARAM_DEFAULTS[PARAM_ZONE_2_SOURCES]
+    assert params.get_param(PARAM_ZONE_2_SOURCES) is default_sources
+
+    user_sources = [1, 2]
+    params.set_user_params({PARAM_ZONE_2_SOURCES: user_sources})
+    user_sources.append(4)
+    assert params.get_param(PARAM_ZONE_2_SOURCES) == (1, 2)
+    assert params.user_params[PARAM_ZONE_2_SOURCES] == (1, 2)
+    assert params.get_param(PARAM_ZONE_2_SOURCES) is params.params_all[
+        PARAM_ZONE_2_SOURCES
+    ]
+
+
+def test_param_defaults_shared():
+    """Default and model parameter layers are shared between instances."""
+    params1 = AVRParams({PARAM_MODEL: "VSX-930"})
+    params2 = AVRParams({PARAM_MODEL: "VSX-930", PARAM_MAX_VOLUME: 100})
+    assert params1._default_params is params2._default_params is PARAM_DEFAULTS
+    assert params1.default_params == params2.default_params
+    for param in PARAM_DEFAULTS:
+        assert params1.get_param(param) is params2.get_param(param) or (
+            param == PARAM_MAX_VOLUME
+        ), param
+    assert params1._params.keys() == {
+        PARAM_MODEL,
+        *PARAM_MODEL_DEFAULTS[r"^VSX-930"],
+    }
+    assert params2._params.keys() - params1._params.keys() == {PARAM_MAX_VOLUME}
+
+
+def test_param_update_callbacks():
+    """Callbacks are called only when a parameter changes."""
+    params = AVRParams()
+    calls = {"all": 0, "scoped": 0}
+
+    def callback_all(_params: AVRParams) -> None:
+        calls["all"] += 1
+
+    def callback_scoped(_params: AVRParams) -> None:
+        calls["scoped"] += 1
+
+    params.register_update_callback(callback_all)
+    params.register_update_callback(callback_scoped, params=[PARAM_MAX_VOLUME])
+
+    params.set_user_param(PARAM_COMMAND_DELAY, 0.2)
+    assert calls == {"all": 1, "scoped": 0}
+    params.set_user_param(PARAM_COMMAND_DELAY, 0.2)
+    assert calls == {"all": 1, "scoped": 0}
+    params.set_user_param(PARAM_MAX_VOLUME, 100)
+    assert calls == {"all": 2, "scoped": 1}
+    params.set_user_params({PARAM_MAX_VOLUME: 100, PARAM_COMMAND_DELAY: 0.2})
+    assert calls == {"all": 2, "scoped": 1}
+    params.set_user_params({})
+    assert calls == {"all": 3, "scoped": 2}
+    assert params.get_param(PARAM_MAX_VOLUME) == PARAM_DEFAULTS[PARAM_MAX_VOLUME]
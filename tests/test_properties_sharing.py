@@ -0,0 +1,101 @@
+"""Tests for property snapshot and listening mode sharing."""
+
+import pytest
+
+from aiopioneer.const import Zone
+from aiopioneer.params import PARAM_DISABLED_LISTENING_MODES
+
+from .conftest import RESPONSES, DecodeHarness, create_harness
+
+
+def test_snapshot_shares_unchanged_properties(harness: DecodeHarness):
+    """Unchanged base properties are shared between snapshots."""
+    harness.decode(RESPONSES)
+    properties = harness.properties
+    snapshot1 = properties.get_snapshot()
+    harness.decode(["VOL101"])
+    snapshot2 = properties.get_snapshot()
+
+    assert snapshot1["volume"] is not snapshot2["volume"]
+    assert snapshot1["volume"][Zone.Z1] == 121
+    assert snapshot2["volume"][Zone.Z1] == 101
+    for base_property in ["power", "tuner", "amp", "audio", "video"]:
+        assert snapshot1[base_property] is snapshot2[base_property], base_property
+    assert properties.get_snapshot()["volume"] is snapshot2["volume"]
+
+
+def test_listening_modes_shared_between_instances(harness: DecodeHarness):
+    """AVRs with the same listening mode params share listening mode tables."""
+    other = harness.loop.run_until_complete(create_harness(harness.loop))
+    properties1, properties2 = harness.properties, other.properties
+
+    assert properties1.listening_modes_all is properties2.listening_modes_all
+    assert (
+        properties1.available_listening_modes
+        is properties2.available_listening_modes
+    )
+    snapshot1 = properties1.get_snapshot()
+    snapshot2 = properties2.get_snapshot()
+    assert snapshot1["listening_modes_all"] is snapshot2["listening_modes_all"]
+    assert (
+        snapshot1["available_listening_modes"]
+        is snapshot2["available_listening_modes"]
+    )
+
+
+def test_snapshot_isolated_from_updates(harness: DecodeHarness):
+    """A snapshot is not changed by later updates to properties."""
+    harness.decode(RESPONSES)
+    properties = harness.properties
+    snapshot = properties.get_snapshot()
+    snapshot_repr = repr(dict(snapshot))
+
+    harness.decode(["VOL101", "CLVL__060", "FL0000574F524C4420202020202020"])
+    harness.decode(["RGB190GAME", "PWR1", "FN02", "PRA01"])
+    properties.set_property("zones", properties.zones | {Zone.Z3})
+    properties.set_property("volume", 50, Zone.Z1)
+    properties.set_property("amp", None, property_name="display")
+    properties.set_source_dict({1: "CD"})
+    harness.params.set_user_param(PARAM_DISABLED_LISTENING_MODES, ["0005"])
+    properties.reset()
+
+    assert repr(dict(snapshot)) == snapshot_repr
+    assert snapshot["volume"][Zone.Z1] == 121
+    assert Zone.Z3 not in snapshot["zones"]
+    assert properties.get_snapshot()["volume"] != snapshot["volume"]
+
+
+def test_snapshot_immutable(harness: DecodeHarness):
+    """Snapshots and the nested values within them cannot be modified."""
+    harness.decode(RESPONSES)
+    snapshot = harness.properties.get_snapshot()
+    with pytest.raises(TypeError):
+        snapshot["volume"] = {}
+    with pytest.raises(TypeError):
+        snapshot["volume"][Zone.Z1] = 0
+    with pytest.raises(TypeError):
+        snapshot["channel_level"][Zone.Z1]["L"] = 0
+    assert isinstance(snapshot["zones"], frozenset)
+
+
+def test_base_properties_read_only(harness: DecodeHarness):
+    """Base properties can only be updated with set_property."""
+    harness.decode(RESPONSES)
+    properties = harness.properties
+    with pytest.raises(AttributeError):
+        properties.zones.add(Zone.Z3)
+    with pytest.raises(TypeError):
+        properties.volume[Zone.Z1] = 50
+    with pytest.raises(TypeError):
+        properties.channel_level[Zone.Z1]["L"] = 0
+    with pytest.raises(AttributeError):
+        properties.amp = {}
+    assert properties.volume[Zone.Z1] == 121
+
+    snapshot = properties.get_snapshot()
+    assert properties.get_snapshot() is snapshot  ## unchanged store is shared
+    assert properties.set_property("volume", 50, Zone.Z1)
+    assert not properties.set_property("volume", 50, Zone.Z1)
+    assert properties.get_snapshot() is not snapshot
+    assert properties.get_snapshot()["volume"][Zone.Z1] == 50
+    assert snapshot["volume"][Zone.Z1] == 121
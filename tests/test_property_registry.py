@@ -0,0 +1,109 @@
+"""Tests for indexed property registry lookups."""
+
+from aiopioneer.const import Zone
+from aiopioneer.decoders.code_map import CodeMapBase
+from aiopioneer.property_entry import AVRCommand, gen_query_property
+from aiopioneer.property_registry import AVRPropertyRegistry, get_property_registry
+
+from .conftest import RESPONSES
+
+ZONES = [None, *Zone]
+
+
+def scan_commands(
+    registry: AVRPropertyRegistry, prefix: str = None, zone: Zone = None
+) -> list[AVRCommand]:
+    """Return commands matching prefix and zone by scanning all commands."""
+    return [
+        command
+        for command in registry.commands
+        if (not prefix or command.name.startswith(prefix))
+        and (zone is None or zone in command.avr_commands)
+    ]
+
+
+def scan_responses(
+    registry: AVRPropertyRegistry, raw_resp: str
+) -> tuple[str, type[CodeMapBase], Zone]:
+    """Return the first registered response matching a raw response."""
+    return next((r for r in registry.responses if raw_resp.startswith(r[0])), None)
+
+
+def test_get_commands_matches_scan():
+    """Indexed command lookups match a scan of all commands for every prefix."""
+    registry = get_property_registry()
+    prefixes = {"", "zzz", "query_", "_"}
+    for command in registry.commands:
+        prefixes |= {command.name[:i] for i in range(1, len(command.name) + 1)}
+    for prefix in sorted(prefixes):
+        for zone in ZONES:
+            assert registry.get_commands(prefix, zone) == scan_commands(
+                registry, prefix, zone
+            ), (prefix, zone)
+    assert registry.get_commands() == registry.commands
+    assert registry.get_commands() is not registry.commands
+
+
+def test_get_code_maps_matches_scan():
+    """Cached code map lookups match a scan and return a copy."""
+    registry = get_property_registry()
+    for zone in ZONES:
+        for is_ha_auto_entity in [False, True]:
+            expected = [
+                code_map
+                for code_map in registry.code_map_index
+                if (zone is None or zone in code_map.supported_zones)
+                and (not is_ha_auto_entity or code_map.ha_auto_entity)
+            ]
+            code_maps = registry.get_code_maps(CodeMapBase, zone, is_ha_auto_entity)
+            assert code_maps == expected
+            code_maps.append(CodeMapBase)
+            assert (
+                registry.get_code_maps(CodeMapBase, zone, is_ha_auto_entity)
+                == expected
+            )
+
+
+def test_match_response_matches_scan():
+    """Indexed response matching returns the first registered response."""
+    registry = get_property_registry()
+    raw_responses = set(RESPONSES) | {"", "X", "E04", "B00", "?P", "VOL"}
+    for response, _, _ in registry.responses:
+        raw_responses |= {response, response + "0", response + "12345", response[:-1]}
+    for raw_resp in sorted(raw_responses):
+        assert registry.match_response(raw_resp) == scan_responses(
+            registry, raw_resp
+        ), raw_resp
+
+
+def test_match_response_registration_order():
+    """Responses registered first take precedence over longer later responses."""
+
+    class ShortMap(CodeMapBase):
+        """Code map for short response."""
+
+        base_property = "amp"
+        property_name = "short"
+
+    class LongMap(CodeMapBase):
+        """Code map for long response."""
+
+        base_property = "amp"
+        property_name = "long"
+
+    registry = AVRPropertyRegistry(
+        [
+            gen_query_property(ShortMap, {Zone.ALL: "AB"}),
+            gen_query_property(LongMap, {Zone.Z1: "ABC", Zone.Z2: "XABC"}),
+        ]
+    )
+    for raw_resp in ["ABC1", "AB1", "XABC1", "XAB", "A"]:
+        assert registry.match_response(raw_resp) == scan_responses(
+            registry, raw_resp
+        ), raw_resp
+    assert registry.match_response("ABC1")[1] is ShortMap
+    assert registry.match_response("XABC1")[1:] == (LongMap, Zone.Z2)
+    assert [c.name for c in registry.get_commands("query_amp")] == [
+        "query_amp_short",
+        "query_amp_long",
+    ]
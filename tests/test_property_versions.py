@@ -0,0 +1,144 @@
+"""Tests for versioned property change tracking."""
+
+import asyncio
+
+from aiopioneer.const import Zone
+from aiopioneer.params import (
+    PARAM_DISABLED_LISTENING_MODES,
+    PARAM_EXTRA_LISTENING_MODES,
+)
+from aiopioneer.properties import AVRProperties
+
+from .conftest import (
+    RESPONSES,
+    DecodeHarness,
+    create_loopback_avr,
+    shutdown_loopback_avr,
+)
+
+
+def assert_bumped(
+    properties: AVRProperties, version: int, *keys: tuple[str, Zone, str]
+) -> int:
+    """Check properties changed after version, and return the new version."""
+    assert properties.version > version
+    changes = properties.get_changes(version)
+    for key in keys:
+        assert key in changes, key
+        assert properties.get_property_version(*key) > version, key
+    return properties.version
+
+
+def test_decoder_commits_bump_version(harness: DecodeHarness):
+    """Each shape of property committed by the decoder bumps the version."""
+    properties = harness.properties
+    version = properties.version
+    for response, key in [
+        ("VOL121", ("volume", Zone.Z1, None)),  ## zone property
+        ("CLVL__050", ("channel_level", Zone.Z1, "L")),  ## zone property name
+        ("SR0005", ("listening_mode", Zone.ALL, None)),  ## global property
+        ("SAA1", ("amp", Zone.ALL, "dimmer")),  ## global property name
+    ]:
+        harness.decode([response])
+        version = assert_bumped(properties, version, key)
+
+    harness.decode(["VOL121"])  ## unchanged value
+    assert properties.version == version
+    assert properties.get_changes(version) == {}
+
+
+def test_local_updates_bump_version(harness: DecodeHarness):
+    """Property updates made outside the response decoder bump the version."""
+    properties = harness.properties
+    version = properties.version
+
+    properties.set_source_dict({19: "HDMI 1", 4: "DVD"})
+    version = assert_bumped(
+        properties,
+        version,
+        ("source_id_to_name", Zone.ALL, None),
+        ("source_name_to_id", Zone.ALL, None),
+        ("query_sources", Zone.ALL, None),
+    )
+
+    harness.params.set_user_param(
+        PARAM_EXTRA_LISTENING_MODES, {999: ["TEST", True, True]}
+    )
+    version = assert_bumped(
+        properties,
+        version,
+        ("listening_modes_all", Zone.ALL, None),
+        ("available_listening_modes", Zone.ALL, None),
+    )
+    harness.params.set_user_param(PARAM_DISABLED_LISTENING_MODES, [999])
+    version = assert_bumped(
+        properties, version, ("available_listening_modes", Zone.ALL, None)
+    )
+    assert properties.get_property_version("listening_modes_all") < version
+
+    properties.set_property("query_sources", True)
+    harness.decode(["RGB190HDMI1"])
+    harness.decode(["RGB190GAME"])  ## existing source renamed
+    version = assert_bumped(
+        properties,
+        version,
+        ("source_id_to_name", Zone.ALL, 19),
+        ("source_name_to_id", Zone.ALL, "HDMI1"),
+    )
+
+    harness.decode(["FN02", "PRA01"])
+    version = assert_bumped(properties, version, ("tuner", Zone.ALL, "cached_preset"))
+    assert properties.tuner["cached_preset"] == ("A", 1)
+    harness.decode(["FRF09950"])
+    assert_bumped(properties, version, ("tuner", Zone.ALL, "cached_preset"))
+    assert properties.tuner.get("cached_preset") is None
+
+
+def test_reset_reports_all_properties_changed(harness: DecodeHarness):
+    """All tracked properties are reported as changed after a reset."""
+    harness.decode(RESPONSES)
+    properties = harness.properties
+    tracked = set(properties.get_changes())
+    version = properties.version
+    properties.reset()
+    assert set(properties.get_changes(version)) == tracked
+    assert properties.get_changes(properties.version) == {}
+
+
+def test_avr_updates_bump_version():
+    """Zone discovery, source queries and initial refresh bump the version."""
+
+    async def run_updates() -> None:
+        avr, device = await create_loopback_avr(
+            params={"command_delay": 0, "max_source_id": 2},
+            responses={"?RGB01": "RGB010CD", "?RGB02": "RGB020TUNER"},
+        )
+        properties = avr.properties
+        try:
+            version = properties.version
+            await avr.query_zones()
+            version = assert_bumped(
+                properties,
+                version,
+                ("zones", Zone.ALL, None),
+                ("max_volume", Zone.Z1, None),
+            )
+
+            await avr.build_source_dict()
+            version = assert_bumped(
+                properties,
+                version,
+                ("query_sources", Zone.ALL, None),
+                ("source_id_to_name", Zone.ALL, 1),
+                ("source_name_to_id", Zone.ALL, "TUNER"),
+            )
+            assert properties.source_id_to_name == {1: "CD", 2: "TUNER"}
+
+            await avr.refresh(zones=[Zone.Z1], wait=True)
+            assert_bumped(
+                properties, version, ("zones_initial_refresh", Zone.ALL, None)
+            )
+        finally:
+            await shutdown_loopback_avr(avr, device)
+
+    asyncio.run(run_updates())
@@ -0,0 +1,114 @@
+"""Tests for raw traffic recording and replay."""
+
+import asyncio
+import os
+
+from aiopioneer.const import Zone
+from aiopioneer.pioneer_avr import PioneerAVR
+from aiopioneer.recorder import (
+    RECORD_RX,
+    RECORD_TX,
+    ReplayTransport,
+    read_recording,
+)
+from aiopioneer.transport import AVRTransport, LoopbackTransport
+
+from .conftest import LoopbackDevice, shutdown_loopback_avr
+
+SESSION_RESPONSES = {"?V": "VOL121", "?M": "MUT0", "?S": "SR0005"}
+SESSION_COMMANDS = [
+    "query_volume",
+    "query_mute",
+    "query_listening_mode",
+    "query_volume",
+]
+
+
+def create_avr(transport: AVRTransport, timeout: float = 1.0) -> PioneerAVR:
+    """Create an AVR using a transport."""
+    return PioneerAVR(
+        "replay",
+        timeout=timeout,
+        scan_interval=0,
+        params={"ignored_zones": ["2", "3", "Z"], "command_delay": 0},
+        transport=transport,
+    )
+
+
+async def run_session(
+    avr: PioneerAVR, commands: list[str], ignore_error: bool = None
+) -> dict:
+    """Connect, send commands, and return properties snapshot."""
+    await avr.connect(reconnect=False)
+    avr.properties.set_property("zones", {Zone.Z1})
+    for command in commands:
+        await avr.send_command(command, zone=Zone.Z1, ignore_error=ignore_error)
+    return dict(avr.properties.get_snapshot())
+
+
+async def record_session(path: str) -> dict:
+    """Record a loopback device session with rotation."""
+    client, transport = LoopbackTransport.create_pair()
+    device = LoopbackDevice(transport, responses=SESSION_RESPONSES)
+    avr = create_avr(client)
+    avr.start_recording(path, max_bytes=64, backup_count=10)
+    device.task = asyncio.create_task(device.run())
+    try:
+        return await run_session(avr, SESSION_COMMANDS)
+    finally:
+        await shutdown_loopback_avr(avr, device)
+
+
+async def replay_session(paths: list[str], commands: list[str]) -> tuple[dict, int]:
+    """Replay a recorded session, return properties snapshot and divergences."""
+    transport = ReplayTransport(paths, speed=None)
+    avr = create_avr(transport, timeout=0.2)
+    try:
+        ## recorded responses to diverged commands are not the expected response
+        snapshot = await run_session(avr, commands, ignore_error=True)
+        await asyncio.wait_for(transport.finished.wait(), timeout=1.0)
+        return snapshot, transport.diverged
+    finally:
+        await avr.shutdown()
+
+
+def get_recording_paths(path: str) -> list[str]:
+    """Get rotated recording paths, oldest first."""
+    backups = 1
+    while os.path.exists(f"{path}.{backups}"):
+        backups += 1
+    return [f"{path}.{i}" for i in range(backups - 1, 0, -1)] + [path]
+
+
+def test_record_rotate_replay(tmp_path):
+    """A rotated recording replays to the same properties."""
+    path = str(tmp_path / "avr.log")
+    recorded = asyncio.run(record_session(path))
+    paths = get_recording_paths(path)
+    assert len(paths) > 2  ## recording was rotated
+
+    records = list(read_recording(paths))
+    sent = [line for _, direction, line in records if direction == RECORD_TX]
+    received = [line for _, direction, line in records if direction == RECORD_RX]
+    assert sent[0] == "?RGD" and sent[-4:] == ["?V", "?M", "?S", "?V"]
+    assert "VOL121" in received and "MUT0" in received
+    assert [timestamp for timestamp, _, _ in records] == sorted(
+        timestamp for timestamp, _, _ in records
+    )
+
+    replayed, diverged = asyncio.run(replay_session(paths, SESSION_COMMANDS))
+    assert diverged == 0
+    for base_property in ["amp", "volume", "mute", "listening_mode"]:
+        assert replayed[base_property] == recorded[base_property], base_property
+
+
+def test_replay_counts_diverged_commands(tmp_path):
+    """Commands that differ from the recording are counted."""
+    path = str(tmp_path / "avr.log")
+    asyncio.run(record_session(path))
+    paths = get_recording_paths(path)
+    commands = list(SESSION_COMMANDS)
+    commands[1] = "query_power"
+    replayed, diverged = asyncio.run(replay_session(paths, commands))
+    assert diverged == 1
+    assert replayed["volume"][Zone.Z1] == 121
@@ -0,0 +1,57 @@
+"""Tests for skipping decode of repeated identical responses."""
+
+from aiopioneer.decode import process_raw_response
+from aiopioneer.params import PARAM_COMMAND_DELAY
+
+from .conftest import DecodeHarness
+
+DISPLAY_RESPONSE = "FL000048454C4C4F20202020202020"
+VIDEO_RESPONSE = "VST40921201092120091000000912000000911000000000009110"
+
+
+def decode(harness: DecodeHarness, response: str):
+    """Decode a response and return updated zones."""
+    return process_raw_response(response, harness.params, harness.properties)
+
+
+def test_repeated_response_skipped(harness: DecodeHarness):
+    """Repeated responses are not decoded but still report updated zones."""
+    properties = harness.properties
+    for response in [DISPLAY_RESPONSE, VIDEO_RESPONSE]:
+        version = properties.version
+        zones = decode(harness, response)
+        assert zones and properties.version > version
+        skipped_decode_count = properties.skipped_decode_count
+        version = properties.version
+        assert decode(harness, response) == zones
+        assert properties.skipped_decode_count == skipped_decode_count + 1
+        assert properties.version == version
+
+
+def test_changed_response_decoded(harness: DecodeHarness):
+    """Changed responses, and responses with changed properties, are decoded."""
+    properties = harness.properties
+    decode(harness, DISPLAY_RESPONSE)
+    display = properties.amp["display"]
+    decode(harness, "FL0000574F524C4420202020202020")
+    assert properties.amp["display"] != display
+    assert properties.skipped_decode_count == 0
+
+    properties.set_property(
+        "amp", None, property_name="display"
+    )  ## property changed elsewhere
+    decode(harness, "FL0000574F524C4420202020202020")
+    assert properties.amp["display"] is not None
+    assert properties.skipped_decode_count == 0
+
+
+def test_param_change_clears_response_cache(harness: DecodeHarness):
+    """Responses are decoded again after params change."""
+    properties = harness.properties
+    decode(harness, DISPLAY_RESPONSE)
+    harness.params.set_user_param(PARAM_COMMAND_DELAY, 0.2)
+    assert not properties.response_cache
+    decode(harness, DISPLAY_RESPONSE)
+    assert properties.skipped_decode_count == 0
+    decode(harness, DISPLAY_RESPONSE)
+    assert properties.skipped_decode_count == 1
@@ -0,0 +1,105 @@
+"""Tests for retry policies."""
+
+import asyncio
+import time
+
+import pytest
+
+from aiopioneer.exceptions import AVRCommandResponseError, AVRResponseTimeoutError
+from aiopioneer.params import (
+    AVRParams,
+    PARAM_COMMAND_DELAY,
+    PARAM_RETRY_POLICY,
+    PARAM_RETRY_BUDGET,
+    PARAM_RETRY_BUDGET_WINDOW,
+)
+from aiopioneer.retry import BackoffRetryPolicy
+
+from .conftest import create_loopback_avr, shutdown_loopback_avr
+
+FAST_RETRY_POLICY = {
+    "E02": {"delay": 0.01, "backoff": 2.0, "max_delay": 0.05, "jitter": 0.2}
+}
+
+
+async def send_failing_requests(
+    params: dict, retry_counts: list[int]
+) -> list[tuple[int, float]]:
+    """Send requests that always fail, return attempts and time for each."""
+    avr, device = await create_loopback_avr(
+        params={PARAM_COMMAND_DELAY: 0, PARAM_RETRY_POLICY: FAST_RETRY_POLICY}
+        | params,
+        responses={"?X": "E02", "?Y": "E04"},
+    )
+    results = []
+    try:
+        for retry_count in retry_counts:
+            received = len(device.received)
+            start = time.monotonic()
+            with pytest.raises(AVRCommandResponseError):
+                await avr.send_raw_request("?X", "XXX", retry_count=retry_count)
+            results.append(
+                (len(device.received) - received, time.monotonic() - start)
+            )
+        with pytest.raises(AVRCommandResponseError):
+            await avr.send_raw_request("?Y", "YYY", retry_count=3)
+        assert device.received.count("?Y") == 1  ## error not in policy
+    finally:
+        await shutdown_loopback_avr(avr, device)
+    return results
+
+
+def test_retry_count_within_budget():
+    """Requests are sent retry_count + 1 times if retries are within budget."""
+    results = asyncio.run(send_failing_requests({}, [0, 1, 4]))
+    assert [attempts for attempts, _ in results] == [1, 2, 5]
+
+
+def test_retry_budget_exhausted():
+    """Retries beyond the retry budget fail without waiting."""
+    results = asyncio.run(
+        send_failing_requests(
+            {PARAM_RETRY_BUDGET: 3, PARAM_RETRY_BUDGET_WINDOW: 60.0}, [2, 2, 2]
+        )
+    )
+    assert [attempts for attempts, _ in results] == [3, 2, 1]
+    assert results[2][1] < 0.01  ## no retry delay
+
+
+def test_retry_budget_window():
+    """Retry budget is restored after the budget window."""
+    policy = BackoffRetryPolicy(
+        AVRParams(
+            {
+                PARAM_RETRY_POLICY: FAST_RETRY_POLICY,
+                PARAM_RETRY_BUDGET: 2,
+                PARAM_RETRY_BUDGET_WINDOW: 0.05,
+            }
+        )
+    )
+    exc = AVRCommandResponseError(command="?X", response="E02")
+    assert policy.get_retry_delay("?X", exc, 1) is not None
+    assert policy.get_retry_delay("?X", exc, 2) is not None
+    assert policy.get_retry_delay("?X", exc, 3) is None
+    time.sleep(0.05)
+    assert policy.get_retry_delay("?X", exc, 1) is not None
+
+
+def test_backoff_delay_bounds():
+    """Backoff delays grow by backoff up to max_delay, varied by jitter."""
+    retry_policy = {
+        "E02": {"delay": 1.0, "backoff": 1.5, "max_delay": 4.0, "jitter": 0.2},
+        "timeout": {"delay": 0.5},
+    }
+    policy = BackoffRetryPolicy(AVRParams({PARAM_RETRY_POLICY: retry_policy}))
+    exc = AVRCommandResponseError(command="?X", response="E02")
+    for attempt in range(1, 8):
+        delay = min(1.0 * 1.5 ** (attempt - 1), 4.0)
+        delays = [policy.get_delay("?X", exc, attempt) for _ in range(200)]
+        assert all(delay * 0.8 <= d <= delay * 1.2 for d in delays)
+        assert max(delays) - min(delays) > 0  ## jitter applied
+
+    timeout = AVRResponseTimeoutError(command="?X")
+    assert [policy.get_delay("?X", timeout, n) for n in (1, 3)] == [0.5, 0.5]
+    exc = AVRCommandResponseError(command="?X", response="E04")
+    assert policy.get_delay("?X", exc, 1) is None
@@ -0,0 +1,73 @@
+"""Tests for dynamic dict map reverse lookup indexes."""
+
+import pytest
+
+from aiopioneer.decoders.code_map import (
+    CodeDynamicDictListMap,
+    CodeDynamicDictMap,
+    CodeDynamicDictStrMap,
+)
+
+
+class SampleDynamicStrMap(CodeDynamicDictStrMap):
+    """Dynamic dict map of str values."""
+
+
+class SampleDynamicListMap(CodeDynamicDictListMap):
+    """Dynamic dict map of list values."""
+
+
+def scan_value_to_code(code_map_class: type[CodeDynamicDictMap], value, code_map):
+    """Convert value to code by scanning code map, as before reverse indexes."""
+    return next(k for k, v in code_map.items() if code_map_class.match(v, value))
+
+
+def test_reverse_index_duplicate_values():
+    """Duplicate values are encoded to the first matching code."""
+    str_map = {"01": "A", "02": "B", "03": "A", "04": "C", "05": "B"}
+    list_map = {"10": ["A", 1], "11": ["B", 2], "12": ["A", 3], "13": ["B", 4]}
+    for code_map_class, code_map in [
+        (SampleDynamicStrMap, str_map),
+        (SampleDynamicListMap, list_map),
+    ]:
+        for value in {code_map_class.match_key(v) for v in code_map.values()}:
+            assert code_map_class.value_to_code_dynamic(
+                value, code_map
+            ) == scan_value_to_code(code_map_class, value, code_map)
+
+
+def test_reverse_index_in_place_mutation():
+    """Reverse lookups follow code maps modified in place."""
+    code_map = {"01": "A", "02": "B"}
+    assert SampleDynamicStrMap.value_to_code_dynamic("B", code_map) == "02"
+
+    code_map["02"] = "C"  ## value changed, same size
+    assert SampleDynamicStrMap.value_to_code_dynamic("C", code_map) == "02"
+    with pytest.raises(ValueError):
+        SampleDynamicStrMap.value_to_code_dynamic("B", code_map)
+
+    code_map["03"] = "B"  ## value added
+    assert SampleDynamicStrMap.value_to_code_dynamic("B", code_map) == "03"
+    code_map["04"] = "A"  ## duplicate value added after first match
+    assert SampleDynamicStrMap.value_to_code_dynamic("A", code_map) == "01"
+
+    del code_map["01"]  ## first match removed
+    assert SampleDynamicStrMap.value_to_code_dynamic("A", code_map) == "04"
+    code_map.clear()
+    with pytest.raises(ValueError):
+        SampleDynamicStrMap.value_to_code_dynamic("A", code_map)
+
+
+def test_reverse_index_per_code_map():
+    """Indexes are kept for each code map used with a class."""
+    code_maps = [{f"{i:02d}": f"SOURCE {i}", "99": "COMMON"} for i in range(4)]
+    for _ in range(2):
+        for i, code_map in enumerate(code_maps):
+            assert SampleDynamicStrMap.value_to_code_dynamic(
+                f"SOURCE {i}", code_map
+            ) == f"{i:02d}"
+
+    indexes = CodeDynamicDictMap._reverse_indexes[SampleDynamicStrMap]
+    for code_map in code_maps:
+        index = indexes[id(code_map)][2]
+        assert SampleDynamicStrMap.get_reverse_index(code_map) is index
@@ -0,0 +1,104 @@
+"""Tests for AVR transports."""
+
+import asyncio
+
+import pytest
+
+from aiopioneer.transport import LoopbackTransport, TCPTransport
+
+
+async def run_tcp_transport(chunks: list[bytes]) -> tuple[list[list[str]], bytes]:
+    """Read lines from a server sending chunks, return batches and received data."""
+    received = asyncio.Queue()
+
+    async def handle_client(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        received.put_nowait(await reader.readuntil(b"\r"))
+        for chunk in chunks:
+            writer.write(chunk)
+            await writer.drain()
+            await asyncio.sleep(0.01)
+        writer.close()
+
+    server = await asyncio.start_server(handle_client, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    transport = TCPTransport("127.0.0.1", port)
+    batches = []
+    try:
+        await transport.connect()
+        await transport.write_lines(["?P"])
+        with pytest.raises(EOFError):
+            while True:
+                batches.append(await transport.read_lines())
+    finally:
+        await transport.close()
+        server.close()
+        await server.wait_closed()
+    return batches, await received.get()
+
+
+def test_tcp_transport_lines():
+    """Lines are split across and within reads, and EOF raised when closed."""
+    batches, command = asyncio.run(
+        run_tcp_transport(
+            [b"PWR0\r\nVOL", b"121\r", b"\nMUT1\r\nFN19\r\nAPR", b"1\r\n", b"Z2F"]
+        )
+    )
+    assert command == b"?P\r"
+    assert ["PWR0"] in batches  ## batch returned before rest of line received
+    assert [line for lines in batches for line in lines] == [
+        "PWR0",
+        "VOL121",
+        "MUT1",
+        "FN19",
+        "APR1",
+    ]  ## incomplete line discarded at EOF
+
+
+def test_tcp_transport_invalid_characters():
+    """Invalid characters only affect the line they are received in."""
+    batches, _ = asyncio.run(
+        run_tcp_transport([b"PWR0\r\nFL00\xff\xfeAB\r\nVOL121\r\n"])
+    )
+    assert [line for lines in batches for line in lines] == [
+        "PWR0",
+        "FL00\\xff\\xfeAB",
+        "VOL121",
+    ]
+
+
+def test_loopback_transport_lines():
+    """Lines are exchanged in batches, and EOF raised when closed."""
+
+    async def run_loopback() -> None:
+        client, device = LoopbackTransport.create_pair()
+        with pytest.raises(ConnectionRefusedError):
+            await LoopbackTransport().connect()
+        await client.connect()
+        assert client.connected and device.connected
+
+        await client.write_lines(["?P"])
+        await client.write_lines(["?V", "?M"])
+        assert await device.read_lines() == ["?P", "?V", "?M"]
+        read_task = asyncio.create_task(client.read_lines())
+        await asyncio.sleep(0)
+        await device.write_lines(["PWR0", "VOL121"])
+        assert await read_task == ["PWR0", "VOL121"]
+
+        await device.write_lines(["MUT1"])
+        await client.close()
+        assert not device.connected
+        assert await client.read_lines() == ["MUT1"]  ## lines received before close
+        with pytest.raises(EOFError):
+            await client.read_lines()
+        with pytest.raises(EOFError):
+            await device.read_lines()
+        with pytest.raises(ConnectionResetError):
+            await client.write_lines(["?P"])
+
+        await client.connect()  ## reconnect
+        await device.write_lines(["PWR1"])
+        assert await client.read_lines() == ["PWR1"]
+
+    asyncio.run(run_loopback())
@@ -0,0 +1,112 @@
+"""Tests for tuner preset learning and frequency seek."""
+
+import asyncio
+
+from aiopioneer.const import SOURCE_TUNER, TunerBand, Zone
+from aiopioneer.decoders.response import Response
+from aiopioneer.decoders.tuner import TunerPreset
+from aiopioneer.params import PARAM_TUNER_FM_FREQ_STEP
+
+from .conftest import create_loopback_avr, shutdown_loopback_avr
+
+
+def test_preset_learned_with_band_from_response(harness):
+    """Preset learned on band change is recorded with the new band."""
+    harness.decode(["FRA00531"])
+    assert harness.properties.tuner["band"] == TunerBand.AM
+    harness.decode(["PRA01", "FRF09950"])
+    assert harness.properties.tuner_presets[("A", 1)] == (TunerBand.FM, 99.5)
+    assert harness.properties.tuner["band"] == TunerBand.FM
+
+
+def test_preset_band_independent_of_committed_band(harness):
+    """Preset band is taken from the frequency response, not properties."""
+    properties = harness.properties
+    properties.set_property("tuner", TunerBand.AM, property_name="band")
+    properties.set_property("tuner", ("B", 2), property_name="cached_preset")
+    response = Response(properties, code="09950", response_command="FRF", value=99.5)
+    for preset_response in TunerPreset.update_preset(response, TunerBand.FM):
+        preset_response.callback(preset_response)
+    assert properties.tuner_presets[("B", 2)] == (TunerBand.FM, 99.5)
+
+
+class TunerDevice:
+    """Emulated AVR FM tuner with stepping and presets."""
+
+    def __init__(self, frequency: int, presets: dict[str, int], step: int = 5):
+        self.frequency = frequency  ## 0.01MHz
+        self.presets = presets
+        self.step = step  ## 0.01MHz
+
+    def handler(self, command: str) -> list[str] | None:
+        """Respond to tuner commands."""
+        if command in ("TFI", "TFD"):
+            self.frequency += self.step if command == "TFI" else -self.step
+        elif command.endswith("PR") and command[:3] in self.presets:
+            self.frequency = self.presets[command[:3]]
+            return [f"PR{command[:3]}"]
+        elif command == "TAC":
+            return ["E04"]  ## direct access unsupported
+        elif command != "?FR":
+            return None
+        return [f"FRF{self.frequency:05d}"]
+
+
+async def seek_tuner_frequency(
+    tuner: TunerDevice,
+    start: float,
+    learned_presets: dict,
+    frequency: float,
+    params: dict = None,
+) -> tuple[float, list[str]]:
+    """Seek tuner frequency from start, return frequency and commands sent."""
+    avr, device = await create_loopback_avr(params=params, handler=tuner.handler)
+    try:
+        properties = avr.properties
+        properties.set_property("zones", {Zone.Z1})
+        properties.set_property("power", True, Zone.Z1)
+        properties.set_property("source_id", SOURCE_TUNER, Zone.Z1)
+        properties.set_property("tuner", TunerBand.FM, property_name="band")
+        properties.set_property("tuner", start, property_name="frequency")
+        properties.tuner_presets.update(learned_presets)
+        await avr.set_tuner_frequency(TunerBand.FM, frequency)
+        return properties.tuner["frequency"], device.received
+    finally:
+        await shutdown_loopback_avr(avr, device)
+
+
+def test_seek_frequency_via_preset():
+    """Seek selects a learned preset close to the target frequency."""
+    tuner = TunerDevice(9500, {"A02": 10450})
+    presets = {("A", 2): (TunerBand.FM, 104.5)}
+    frequency, commands = asyncio.run(
+        seek_tuner_frequency(tuner, 95.0, presets, 104.3)
+    )
+    assert frequency == 104.3 and tuner.frequency == 10430
+    assert "A02PR" in commands
+    assert commands.count("TFD") == 4
+
+
+def test_seek_frequency_via_stale_preset():
+    """Seek steps from the reported frequency if the preset was re-stored."""
+    tuner = TunerDevice(9500, {"A02": 9000})
+    presets = {("A", 2): (TunerBand.FM, 104.5)}
+    frequency, commands = asyncio.run(
+        seek_tuner_frequency(tuner, 95.0, presets, 104.3)
+    )
+    assert frequency == 104.3 and tuner.frequency == 10430
+    assert "A02PR" in commands
+    assert commands.count("TFI") == 286
+
+
+def test_seek_frequency_with_fm_step_param():
+    """Seek steps on the FM step grid from params without overshooting."""
+    tuner = TunerDevice(8790, {}, step=20)
+    frequency, commands = asyncio.run(
+        seek_tuner_frequency(
+            tuner, 87.9, {}, 101.1, params={PARAM_TUNER_FM_FREQ_STEP: 200}
+        )
+    )
+    assert frequency == 101.1 and tuner.frequency == 10110
+    assert commands.count("TFI") == 66
+    assert "TFD" not in commands
@@ -0,0 +1,141 @@
+"""Differential tests for compiled code map value decoders."""
+
+import pytest
+
+from aiopioneer.decoders.code_map import (
+    CodeMapBase,
+    CodeBoolMap,
+    CodeDictListMap,
+    CodeDictMap,
+    CodeDictStrMap,
+    CodeDynamicDictMap,
+    CodeFloatMap,
+    CodeMapSequence,
+    CodeStrMap,
+)
+from aiopioneer.decoders.response import Response
+from aiopioneer.params import AVRParams
+from aiopioneer.properties import AVRProperties
+from aiopioneer.property_registry import get_property_registry
+
+
+class SampleDictListMap(CodeDictListMap):
+    """Dict list code map, decoded to the whole list item by decode_response."""
+
+    code_map = {"01": ["one", 1], "02": ["two", 2]}
+
+
+class SampleCodeToValueDictMap(CodeDictStrMap):
+    """Dict code map with code_to_value not used by decode_response."""
+
+    code_map = {"01": "one", "02": "two"}
+
+    @classmethod
+    def code_to_value(cls, code: str) -> str:
+        return super().code_to_value(code).upper()
+
+
+NUMERIC_CODES = ["0", "1", "05", "50", "99", "000", "121", "185", "09950", "-10"]
+STR_CODES = ["", "ABC", "ABC__", "HELLO    ", "<VSX-930/ABC>", '"1.234"']
+
+
+def _get_code_maps() -> list[type[CodeMapBase]]:
+    """Get all code maps, including those not registered as properties."""
+    get_property_registry()  ## load all decoders
+    code_maps = []
+    pending = [CodeMapBase]
+    while pending:
+        code_map = pending.pop()
+        code_maps.append(code_map)
+        pending.extend(code_map.__subclasses__())
+    return sorted(set(code_maps), key=lambda c: f"{c.__module__}.{c.__name__}")
+
+
+def _get_codes(code_map: type[CodeMapBase]) -> list[str]:
+    """Get sample codes for a code map."""
+    codes = list(STR_CODES)
+    if issubclass(code_map, CodeDynamicDictMap):
+        codes += [str(code) for code in getattr(code_map, "code_map", {}) or {}]
+    if issubclass(code_map, CodeBoolMap):
+        codes += [code_map.code_true, code_map.code_false]
+    if issubclass(code_map, CodeFloatMap):
+        codes += NUMERIC_CODES
+    if issubclass(code_map, CodeStrMap):
+        codes += ["ABC" + code_map.code_fillchar * 3]
+    return codes
+
+
+def _decode(decoder, code: str):
+    """Decode code, returning the exception type on failure."""
+    try:
+        return decoder(code)
+    except Exception as exc:  # pylint: disable=broad-except
+        return type(exc)
+
+
+@pytest.mark.parametrize("code_map", _get_code_maps(), ids=lambda c: c.__name__)
+def test_compiled_decoder_matches_generic(code_map: type[CodeMapBase]):
+    """Compiled decoder returns the same value or error as code_to_value."""
+    compiled = code_map.get_value_decoder()
+    for code in _get_codes(code_map):
+        assert _decode(compiled, code) == _decode(code_map.code_to_value, code), code
+
+
+def _decode_response(code_map: type[CodeMapBase], code: str) -> list | type:
+    """Decode response code, returning response attributes or exception type."""
+    params = AVRParams()
+    properties = AVRProperties(params)
+    response = Response(properties, code=code, response_command="TST")
+    try:
+        responses = code_map.decode_response(response, params)
+    except Exception as exc:  # pylint: disable=broad-except
+        return type(exc)
+    return [
+        (
+            r.code,
+            r.response_command,
+            r.base_property,
+            r.property_name,
+            r.zone,
+            r.update_zones,
+            r.value,
+            [c.command for c in r.queue_commands],
+            r.callback is not None,
+        )
+        for r in responses
+    ]
+
+
+@pytest.fixture
+def dynamic_decoders(monkeypatch: pytest.MonkeyPatch):
+    """Decode with code_to_value and decode_response_dynamic only."""
+    monkeypatch.setattr(CodeMapBase, "has_default_decoder", classmethod(_false))
+    monkeypatch.setattr(CodeDictMap, "has_default_decoder", classmethod(_false))
+    monkeypatch.setattr(
+        CodeMapBase, "get_value_decoder", classmethod(lambda cls: cls.code_to_value)
+    )
+    monkeypatch.setattr(CodeMapSequence, "_sequence_plans", {})
+    monkeypatch.setattr(CodeDictMap, "decode_response", classmethod(_decode_dynamic))
+
+
+def _false(cls) -> bool:  # pylint: disable=unused-argument
+    return False
+
+
+def _decode_dynamic(cls, response: Response, params: AVRParams) -> list[Response]:
+    return cls.decode_response_dynamic(
+        response=response, params=params, code_map=cls.code_map
+    )
+
+
+@pytest.mark.parametrize("code_map", _get_code_maps(), ids=lambda c: c.__name__)
+def test_compiled_response_decode_matches_dynamic(
+    code_map: type[CodeMapBase], request: pytest.FixtureRequest
+):
+    """Responses decoded with compiled decoders match the dynamic decode path."""
+    codes = _get_codes(code_map)
+    compiled = [_decode_response(code_map, code) for code in codes]
+    request.getfixturevalue("dynamic_decoders")
+    dynamic = [_decode_response(code_map, code) for code in codes]
+    for code, compiled_result, dynamic_result in zip(codes, compiled, dynamic):
+        assert compiled_result == dynamic_result, code
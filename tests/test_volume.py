@@ -0,0 +1,257 @@
+"""Tests for volume ramps and volume stepping."""
+
+import asyncio
+import time
+
+import pytest
+
+from aiopioneer.command_queue import CommandItem
+from aiopioneer.const import Zone
+from aiopioneer.exceptions import AVRCommandError
+from aiopioneer.params import PARAM_MAX_VOLUME
+from aiopioneer.pioneer_avr import PioneerAVR
+
+from .conftest import LoopbackDevice, create_loopback_avr, shutdown_loopback_avr
+
+
+class VolumeDevice:
+    """Emulated AVR main zone volume."""
+
+    def __init__(self, volume: int, step_sizes: list[int] = None):
+        self.volume = volume
+        self.levels: list[int] = []  ## volume levels set
+        self.step_sizes = step_sizes or []  ## sizes of first volume up steps
+        self.step_delay = 0.0  ## delay before acknowledging volume steps
+        self.drop_steps: set[int] = set()  ## volume steps not acknowledged
+        self.steps = 0
+        self.pending_steps = 0
+        self.max_pending_steps = 0
+        self.device: LoopbackDevice = None
+
+    async def acknowledge_step(self, step: int, response: str) -> None:
+        """Acknowledge a volume step after a delay."""
+        await asyncio.sleep(self.step_delay)
+        self.pending_steps -= 1
+        if step not in self.drop_steps:
+            await self.device.transport.write_lines([response])
+
+    def handler(self, command: str) -> list[str] | None:
+        """Respond to volume commands."""
+        if command in ("VU", "VD"):
+            step_size = self.step_sizes.pop(0) if self.step_sizes else 1
+            self.volume += step_size if command == "VU" else -1
+            self.steps += 1
+            self.pending_steps += 1
+            self.max_pending_steps = max(self.max_pending_steps, self.pending_steps)
+            asyncio.create_task(
+                self.acknowledge_step(self.steps, f"VOL{self.volume:03d}")
+            )
+            return []
+        if command.endswith("VL") and command[:-2].isdigit():
+            self.volume = int(command[:-2])
+            self.levels.append(self.volume)
+        elif command != "?V":
+            return None
+        return [f"VOL{self.volume:03d}"]
+
+
+async def create_volume_avr(
+    volume_device: VolumeDevice, params: dict = None
+) -> tuple[PioneerAVR, LoopbackDevice]:
+    """Create an AVR with main zone powered on and its volume known."""
+    avr, device = await create_loopback_avr(
+        params={"command_delay": 0.01} | (params or {}),
+        handler=volume_device.handler,
+    )
+    volume_device.device = device
+    properties = avr.properties
+    properties.set_property("zones", {Zone.Z1})
+    max_volume = avr.params.get_param(PARAM_MAX_VOLUME)
+    properties.set_property("max_volume", max_volume, Zone.Z1)
+    properties.set_property("power", True, Zone.Z1)
+    await avr.send_command("query_volume", zone=Zone.Z1)
+    assert properties.volume[Zone.Z1] == volume_device.volume
+    return avr, device
+
+
+def test_ramp_volume_reaches_target():
+    """Volume ramp steps through intermediate levels to target volume."""
+
+    async def run_ramp() -> tuple[float, int]:
+        volume_device = VolumeDevice(50)
+        avr, device = await create_volume_avr(volume_device)
+        try:
+            start = time.monotonic()
+            await avr.ramp_volume(60, 0.3)
+            elapsed = time.monotonic() - start
+            assert avr.properties.volume[Zone.Z1] == 60
+            assert volume_device.volume == 60
+            assert volume_device.levels == sorted(set(volume_device.levels))
+            assert len(volume_device.levels) > 2
+            return elapsed
+        finally:
+            await shutdown_loopback_avr(avr, device)
+
+    elapsed = asyncio.run(run_ramp())
+    assert elapsed >= 0.3  ## wait returns when ramp finishes
+
+
+def test_ramp_volume_superseded():
+    """A new volume ramp replaces a ramp in progress."""
+
+    async def run_ramps() -> None:
+        volume_device = VolumeDevice(50)
+        avr, device = await create_volume_avr(volume_device)
+        try:
+            await avr.ramp_volume(100, 2.0, wait=False)
+            await asyncio.sleep(0.2)
+            first_ramp = avr._volume_ramps[Zone.Z1]  # pylint: disable=protected-access
+            assert 50 < volume_device.volume < 100
+            await avr.ramp_volume(40, 0.2)
+            assert first_ramp.finished.is_set()
+            assert not avr._volume_ramps  # pylint: disable=protected-access
+            await asyncio.sleep(0.1)  ## no further steps from first ramp
+            assert avr.properties.volume[Zone.Z1] == 40
+            assert volume_device.volume == 40
+        finally:
+            await shutdown_loopback_avr(avr, device)
+
+    asyncio.run(run_ramps())
+
+
+def test_ramp_volume_cancel_restart():
+    """Steps queued for a cancelled ramp do not run against a new ramp."""
+
+    async def run_ramps() -> None:
+        volume_device = VolumeDevice(50)
+        avr, device = await create_volume_avr(volume_device)
+        command_queue = avr.properties.command_queue
+        volume_ramps = avr._volume_ramps  # pylint: disable=protected-access
+        try:
+            async with command_queue:  ## hold ramp steps in the command queue
+                await avr.ramp_volume(20, 0.1, wait=False)
+                first_ramp = volume_ramps[Zone.Z1]
+                await asyncio.sleep(0.15)
+                assert "_ramp_volume" in command_queue.commands
+                await avr.cancel_volume_ramp(Zone.Z1)
+                assert "_ramp_volume" not in command_queue.commands
+
+                ## final step of the cancelled ramp queued after cancelling
+                command_queue.enqueue(
+                    CommandItem(
+                        "_ramp_volume", first_ramp, True, zone=Zone.Z1, queue_id=0
+                    ),
+                    start_executing=False,
+                )
+                await avr.ramp_volume(80, 0.3, wait=False)
+                ramp = volume_ramps[Zone.Z1]
+            await asyncio.wait_for(ramp.finished.wait(), timeout=1.0)
+            assert volume_device.levels[-1] == avr.properties.volume[Zone.Z1] == 80
+            assert len(volume_device.levels) > 2  ## new ramp not ended early
+            assert all(level > 50 for level in volume_device.levels)
+        finally:
+            await shutdown_loopback_avr(avr, device)
+
+    asyncio.run(run_ramps())
+
+
+def test_ramp_volume_no_wait():
+    """Volume ramp runs in the background if not waiting."""
+
+    async def run_ramp() -> None:
+        volume_device = VolumeDevice(60)
+        avr, device = await create_volume_avr(volume_device)
+        try:
+            await avr.ramp_volume(55, 0.2, wait=False)
+            ramp = avr._volume_ramps[Zone.Z1]  # pylint: disable=protected-access
+            assert not ramp.finished.is_set()
+            await asyncio.wait_for(ramp.finished.wait(), timeout=1.0)
+            assert avr.properties.volume[Zone.Z1] == 55
+        finally:
+            await shutdown_loopback_avr(avr, device)
+
+    asyncio.run(run_ramp())
+
+
+async def step_volume(
+    volume_device: VolumeDevice, target_volume: int, step_window: int = 4
+) -> PioneerAVR:
+    """Step volume to target volume, return the AVR."""
+    avr, device = await create_volume_avr(
+        volume_device,
+        params={"volume_step_only": True, "volume_step_window": step_window},
+    )
+    try:
+        await avr.set_volume_level(target_volume)
+        return avr
+    finally:
+        await shutdown_loopback_avr(avr, device)
+
+
+def test_step_volume_to_target():
+    """Volume steps to target with a window of steps in flight."""
+    volume_device = VolumeDevice(50)
+    volume_device.step_delay = 0.1
+    avr = asyncio.run(step_volume(volume_device, 60))
+    assert volume_device.volume == 60 and volume_device.steps == 10
+    assert volume_device.max_pending_steps == 4
+    assert avr.properties.volume.get(Zone.Z1) is None  ## reset on shutdown
+
+    volume_device = VolumeDevice(50)
+    asyncio.run(step_volume(volume_device, 45, step_window=1))
+    assert volume_device.volume == 45 and volume_device.max_pending_steps == 1
+
+
+def test_step_volume_overshoot_corrected():
+    """Volume steps back if steps overshoot the target."""
+    volume_device = VolumeDevice(50, step_sizes=[1, 1, 1, 1, 3])  ## last step 3
+    asyncio.run(step_volume(volume_device, 55))
+    assert volume_device.volume == 55
+    assert volume_device.device.received.count("VD") == 2
+
+
+def test_step_volume_dropped_acknowledgement():
+    """Volume step fails if the final step is not acknowledged."""
+
+    async def run_steps() -> None:
+        volume_device = VolumeDevice(50)
+        volume_device.drop_steps = {5}
+        avr, device = await create_volume_avr(
+            volume_device, params={"volume_step_only": True}
+        )
+        try:
+            start = time.monotonic()
+            with pytest.raises(AVRCommandError):
+                await avr.set_volume_level(55)
+            assert time.monotonic() - start < 2.0  ## AVR timeout 1.0s
+            assert volume_device.volume == 55
+            await avr.send_command("query_volume", zone=Zone.Z1)
+            assert avr.properties.volume[Zone.Z1] == 55
+        finally:
+            await shutdown_loopback_avr(avr, device)
+
+    asyncio.run(run_steps())
+
+
+def test_step_volume_does_not_block_requests():
+    """Other requests are sent while volume is stepping."""
+
+    async def run_steps() -> None:
+        volume_device = VolumeDevice(50)
+        volume_device.step_delay = 0.05
+        avr, device = await create_volume_avr(
+            volume_device, params={"volume_step_only": True, "volume_step_window": 2}
+        )
+        try:
+            step_task = asyncio.create_task(avr.set_volume_level(70))
+            await asyncio.sleep(0.05)
+            for _ in range(3):
+                await avr.send_command("query_mute", zone=Zone.Z1)
+                assert not step_task.done()
+            await step_task
+            assert avr.properties.volume[Zone.Z1] == 70
+            assert device.received.count("?M") >= 3
+        finally:
+            await shutdown_loopback_avr(avr, device)
+
+    asyncio.run(run_steps())
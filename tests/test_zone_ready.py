@@ -0,0 +1,93 @@
+"""Tests for zone readiness detection after power on."""
+
+import asyncio
+import time
+
+from aiopioneer.command_queue import CommandItem, CommandQueue
+from aiopioneer.const import Zone
+from aiopioneer.params import AVRParams, PARAM_POWER_ON_READY_TIMEOUT
+
+from .conftest import create_loopback_avr, shutdown_loopback_avr
+
+
+def test_delayed_query_basic_coalesced_per_zone():
+    """Delayed basic queries are coalesced per powered on zone."""
+    queue = CommandQueue(AVRParams())
+    for item in [
+        CommandItem("_delayed_query_basic", Zone.Z1, queue_id=3),
+        CommandItem("_delayed_query_basic", Zone.Z2, queue_id=3),
+        CommandItem("_delayed_query_basic", Zone.Z1, queue_id=3),
+        CommandItem("_delayed_query_basic", 2.5, queue_id=3),
+        CommandItem("_delayed_query_basic", 4.5, queue_id=3),
+        CommandItem("_delayed_query_basic", Zone.Z2, queue_id=3),
+    ]:
+        queue.enqueue(item, start_executing=False)
+    assert [item.args for item in queue] == [(Zone.Z1,), (Zone.Z2,), (2.5,)]
+
+
+class WarmupDevice:
+    """Emulated AVR zone that is unavailable until warmed up."""
+
+    def __init__(self):
+        self.ready_at = 0.0
+        self.probes = 0
+
+    def handler(self, command: str) -> list[str] | None:
+        """Respond to volume queries."""
+        if command != "?V":
+            return None
+        self.probes += 1
+        if time.monotonic() < self.ready_at:
+            return ["E02"]
+        return ["VOL050"]
+
+
+async def wait_for_zone_ready(
+    warmup: float, notify: bool, ready_timeout: float = 10.0
+) -> tuple[bool, float, int]:
+    """Wait for main zone ready, return result, elapsed time and probes."""
+    warmup_device = WarmupDevice()
+    avr, device = await create_loopback_avr(
+        params={"command_delay": 0, PARAM_POWER_ON_READY_TIMEOUT: ready_timeout},
+        handler=warmup_device.handler,
+    )
+
+    async def notify_ready() -> None:
+        await asyncio.sleep(warmup)
+        await device.transport.write_lines(["VOL060"])  ## unsolicited response
+
+    try:
+        avr.properties.set_property("zones", {Zone.Z1})
+        avr.properties.set_property("power", True, Zone.Z1)
+        avr.properties.set_property("volume", 40, Zone.Z1)  ## probe zone volume
+        if notify:
+            asyncio.create_task(notify_ready())
+        start = time.monotonic()
+        warmup_device.ready_at = start + warmup
+        # pylint: disable=protected-access
+        ready = await avr._wait_for_zone_ready(Zone.Z1)
+        return ready, time.monotonic() - start, warmup_device.probes
+    finally:
+        await shutdown_loopback_avr(avr, device)
+
+
+def test_zone_ready_immediately():
+    """A zone that is ready is detected with one probe."""
+    ready, elapsed, probes = asyncio.run(wait_for_zone_ready(0, notify=False))
+    assert ready and probes == 1 and elapsed < 0.1
+
+
+def test_zone_ready_early_on_update():
+    """Readiness is probed again as soon as the AVR sends an update."""
+    ready, elapsed, _ = asyncio.run(wait_for_zone_ready(0.5, notify=True))
+    assert ready and 0.5 <= elapsed < 0.65  ## next timed probe is at 0.81s
+    ready, elapsed, _ = asyncio.run(wait_for_zone_ready(0.5, notify=False))
+    assert ready and elapsed >= 0.8
+
+
+def test_zone_ready_timeout():
+    """Waiting for readiness gives up after power_on_ready_timeout."""
+    ready, elapsed, probes = asyncio.run(
+        wait_for_zone_ready(5.0, notify=False, ready_timeout=0.3)
+    )
+    assert not ready and 0.3 <= elapsed < 0.5 and probes >= 3